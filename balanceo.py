@@ -0,0 +1,181 @@
+"""
+BALANCEO DE CARGA EN EL CLIENTE
+Reparte las llamadas a un proceso lógico (P3_MATRIX, ...) entre sus
+réplicas, los endpoints que da topologia.py, sobre los canales compartidos
+de un PoolCanales. Políticas (POLITICA_BALANCEO):
+- round_robin: turnos entre las réplicas sanas.
+- menos_pendientes: la réplica sana con menos llamadas en curso; a igual
+  cantidad, la de menor latencia media. Las réplicas sin medir van primero.
+Salud y latencia: cada llamada actualiza la latencia media de su réplica
+(media móvil exponencial con peso PESO_LATENCIA). Una réplica que falla
+FALLOS_MAXIMOS veces seguidas (UNAVAILABLE o DEADLINE_EXCEEDED) queda fuera
+durante un enfriamiento que se duplica en cada recaída, hasta
+ENFRIAMIENTO_MAXIMO segundos. Al vencer vuelve a recibir llamadas: un
+acierto la deja sana y un fallo la saca de nuevo. Si todas están fuera se
+usa la que antes vuelve.
+Una llamada con petición unaria que falla con UNAVAILABLE (la réplica no
+llegó a recibirla) se reintenta en otra réplica. Las de flujo de
+peticiones no se reintentan, porque el flujo ya se consumió.
+"""
+
+import os
+import threading
+import time
+from itertools import count
+import grpc
+from topologia import obtener_topologia, separar_endpoint
+
+POLITICA_BALANCEO = os.environ.get("POLITICA_BALANCEO", "menos_pendientes")
+POLITICAS_BALANCEO = ("round_robin", "menos_pendientes")
+PESO_LATENCIA = 0.2
+FALLOS_MAXIMOS = 3
+ENFRIAMIENTO_INICIAL = 1.0
+ENFRIAMIENTO_MAXIMO = 30.0
+
+# Errores que indican que la réplica no está respondiendo
+CODIGOS_FALLO = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+
+
+class EstadoReplica:
+    """Llamadas en curso, latencia y salud de un endpoint"""
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.host, self.puerto = separar_endpoint(endpoint)
+        self.en_curso = 0
+        self.latencia = None  # media móvil en segundos; None hasta la primera respuesta
+        self.fallos_seguidos = 0
+        self.fuera_hasta = 0.0
+        self.enfriamiento = ENFRIAMIENTO_INICIAL
+        self.llamadas = 0
+        self.errores = 0
+
+    def sana(self, ahora):
+        return ahora >= self.fuera_hasta
+
+
+class Balanceador:
+    """Elige la réplica de cada llamada y lleva las estadísticas de todas"""
+
+    def __init__(self, pool, topologia=None, politica=POLITICA_BALANCEO):
+        if politica not in POLITICAS_BALANCEO:
+            raise ValueError(f"Política de balanceo desconocida: {politica}")
+        self.pool = pool
+        self.topologia = obtener_topologia() if topologia is None else topologia
+        self.politica = politica
+        self.replicas = {}  # endpoint -> EstadoReplica
+        self.turnos = {}
+        self.lock = threading.Lock()
+
+    def elegir(self, id_proceso, excluir=()):
+        """Réplica para la próxima llamada (ya contada como en curso). KeyError si no hay"""
+        endpoints = [e for e in self.topologia.endpoints(id_proceso) if e not in excluir]
+        if not endpoints:
+            raise KeyError(f"no hay réplicas disponibles de {id_proceso}")
+        ahora = time.monotonic()
+        with self.lock:
+            candidatas = [self.replicas.setdefault(e, EstadoReplica(e)) for e in endpoints]
+            sanas = ([r for r in candidatas if r.sana(ahora)]
+                     or [min(candidatas, key=lambda r: r.fuera_hasta)])
+            turno = next(self.turnos.setdefault(id_proceso, count())) % len(sanas)
+            if self.politica == "round_robin":
+                elegida = sanas[turno]
+            else:
+                # Empezar en el turno reparte los empates en lugar de cargar siempre la primera
+                rotadas = sanas[turno:] + sanas[:turno]
+                elegida = min(rotadas, key=lambda r: (r.en_curso, r.latencia or 0.0))
+            elegida.en_curso += 1
+            return elegida
+
+    def terminar(self, replica, duracion, error=None):
+        """Registra el fin de una llamada a la réplica"""
+        fallo = isinstance(error, grpc.RpcError) and error.code() in CODIGOS_FALLO
+        with self.lock:
+            replica.en_curso -= 1
+            replica.llamadas += 1
+            if not fallo:
+                # Un error de la aplicación también es una respuesta de una réplica viva
+                replica.latencia = (duracion if replica.latencia is None
+                                    else (1 - PESO_LATENCIA) * replica.latencia + PESO_LATENCIA * duracion)
+                replica.fallos_seguidos = 0
+                replica.enfriamiento = ENFRIAMIENTO_INICIAL
+                return
+            replica.errores += 1
+            replica.fallos_seguidos += 1
+            if replica.fallos_seguidos >= FALLOS_MAXIMOS:
+                replica.fuera_hasta = time.monotonic() + replica.enfriamiento
+                replica.enfriamiento = min(2 * replica.enfriamiento, ENFRIAMIENTO_MAXIMO)
+        self.pool.reportar_error(replica.host, replica.puerto, error)
+
+    def _flujo(self, replica, respuestas, inicio):
+        """Entrega las respuestas de un flujo y cierra la llamada al terminarlo"""
+        error = None
+        try:
+            yield from respuestas
+        except grpc.RpcError as e:
+            error = e
+            raise
+        finally:
+            self.terminar(replica, time.perf_counter() - inicio, error)
+
+    def llamar(self, id_proceso, clase_stub, metodo, peticion, **kwargs):
+        """Llama metodo en una réplica de id_proceso; los flujos de respuesta se devuelven como iterador"""
+        probadas = []
+        while True:
+            replica = self.elegir(id_proceso, excluir=probadas)
+            inicio = time.perf_counter()
+            try:
+                llamada = getattr(self.pool.obtener_stub(replica.host, replica.puerto, clase_stub), metodo)
+                respuesta = llamada(peticion, **kwargs)
+            except grpc.RpcError as e:
+                self.terminar(replica, time.perf_counter() - inicio, e)
+                probadas.append(replica.endpoint)
+                flujo_peticiones = isinstance(llamada, (grpc.StreamUnaryMultiCallable,
+                                                        grpc.StreamStreamMultiCallable))
+                quedan = [endpoint for endpoint in self.topologia.endpoints(id_proceso) if endpoint not in probadas]
+                if e.code() != grpc.StatusCode.UNAVAILABLE or flujo_peticiones or not quedan:
+                    raise
+                print(f"[ERROR] Réplica {replica.endpoint} de {id_proceso} no disponible, reintentando en otra")
+                continue
+            except Exception:
+                self.terminar(replica, time.perf_counter() - inicio)
+                raise
+            if isinstance(llamada, (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)):
+                return self._flujo(replica, respuesta, inicio)
+            self.terminar(replica, time.perf_counter() - inicio)
+            return respuesta
+
+    def stub(self, id_proceso, clase_stub):
+        return StubBalanceado(self, id_proceso, clase_stub)
+
+    def estado(self):
+        """endpoint -> (llamadas, errores, en curso, latencia media en ms o None, sana)"""
+        ahora = time.monotonic()
+        with self.lock:
+            return {e: (r.llamadas, r.errores, r.en_curso,
+                        None if r.latencia is None else r.latencia * 1000, r.sana(ahora))
+                    for e, r in self.replicas.items()}
+
+
+class StubBalanceado:
+    """Se usa como el stub generado (stub.Metodo(peticion, timeout=...)), pero cada llamada va a una réplica"""
+    def __init__(self, balanceador, id_proceso, clase_stub):
+        self.balanceador = balanceador
+        self.id_proceso = id_proceso
+        self.clase_stub = clase_stub
+
+    def __getattr__(self, metodo):
+        def llamar(peticion, **kwargs):
+            return self.balanceador.llamar(self.id_proceso, self.clase_stub, metodo, peticion, **kwargs)
+        return llamar
+
+
+_balanceadores = {}
+_lock_balanceadores = threading.Lock()
+
+
+def obtener_balanceador(pool):
+    """Balanceador compartido de un pool de canales"""
+    with _lock_balanceadores:
+        if pool not in _balanceadores:
+            _balanceadores[pool] = Balanceador(pool)
+        return _balanceadores[pool]
@@ -0,0 +1,118 @@
+"""
+BENCHMARK DE LA MULTIDIFUSIÓN CON ORDEN TOTAL
+Levanta N servidores gRPC locales con BroadcastService (difusion.py) y hace
+que cada uno multidifunda MENSAJES mensajes con total_order=True a la vez.
+Para cada combinación de número de procesos y ventana de confirmaciones mide:
+- rendimiento: mensajes entregados en todos los procesos por segundo
+- latencia de entrega: desde que el emisor pide la difusión hasta que el
+  último proceso la entrega (media y percentil 99)
+- confirmaciones (AckOrdered) enviadas por mensaje
+y comprueba que todos los procesos entregaron en el mismo orden.
+
+Uso: python benchmark_orden_total.py [mensajes_por_proceso]
+"""
+
+import sys
+import threading
+import time
+from concurrent import futures
+import grpc
+import numpy as np
+import services_pb2
+import services_pb2_grpc
+from bitacora import Bitacora
+from difusion import ServicioDifusion
+from pool_canales import PoolCanales
+from reloj_lamport import crear_reloj
+
+PROCESOS = (2, 3, 5, 8)
+VENTANAS = (0.0, 0.002, 0.01, 0.05)
+MENSAJES = 50
+PUERTO_BASE = 51100
+
+
+class Nodo:
+    """Un proceso del benchmark: servidor, servicio de difusión y sus entregas"""
+    def __init__(self, id_proceso, procesos, ventana):
+        self.entregas = []
+        self.servicio = ServicioDifusion(id_proceso, crear_reloj(), PoolCanales(), procesos,
+                                         plazo=10.0, ventana_ack=ventana, al_entregar=self.registrar)
+        self.acks = 0
+        confirmar = self.servicio.confirmar_ordenados
+
+        def contar_acks():
+            self.acks += 1
+            confirmar()
+        self.servicio.confirmar_ordenados = contar_acks
+
+        self.servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
+        services_pb2_grpc.add_BroadcastServiceServicer_to_server(self.servicio, self.servidor)
+        self.servidor.add_insecure_port(f'[::]:{procesos[id_proceso][1]}')
+        self.servidor.start()
+
+    def registrar(self, remitente, secuencia, contenido):
+        self.entregas.append(((remitente, secuencia), time.perf_counter()))
+
+    def detener(self):
+        self.servidor.stop(0)
+        self.servicio.pool.cerrar()
+
+
+def medir(num_procesos, ventana, mensajes, puerto_base):
+    procesos = {f"P{i}": ("localhost", puerto_base + i) for i in range(num_procesos)}
+    nodos = {id_p: Nodo(id_p, procesos, ventana) for id_p in procesos}
+    total = num_procesos * mensajes
+    envios = {}
+
+    def emisor(id_p):
+        for i in range(mensajes):
+            envios[(id_p, i + 1)] = time.perf_counter()
+            respuesta = nodos[id_p].servicio.BroadcastMessage(
+                services_pb2.BroadcastRequest(sender_id="BENCH", message=f"{id_p}-{i}", total_order=True), None)
+            assert respuesta.status == "OK", respuesta.status
+
+    inicio = time.perf_counter()
+    hilos = [threading.Thread(target=emisor, args=(id_p,)) for id_p in procesos]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    while any(len(nodo.entregas) < total for nodo in nodos.values()):
+        time.sleep(0.001)
+    duracion = time.perf_counter() - inicio
+
+    ordenes = [[clave for clave, _ in nodo.entregas] for nodo in nodos.values()]
+    assert all(orden == ordenes[0] for orden in ordenes), "los procesos entregaron en órdenes distintos"
+    ultima_entrega = {}
+    for nodo in nodos.values():
+        for clave, instante in nodo.entregas:
+            ultima_entrega[clave] = max(ultima_entrega.get(clave, 0), instante)
+    latencias = np.array([ultima_entrega[clave] - envios[clave] for clave in envios])
+    acks = sum(nodo.acks for nodo in nodos.values())
+
+    # Dejar salir las últimas confirmaciones antes de apagar los servidores
+    time.sleep(2 * ventana + 0.1)
+    for nodo in nodos.values():
+        nodo.detener()
+    return total / duracion, latencias.mean(), np.percentile(latencias, 99), acks / total
+
+
+def main():
+    mensajes = int(sys.argv[1]) if len(sys.argv) > 1 else MENSAJES
+    # La bitácora escribe en stdout: se desactiva para medir solo el protocolo
+    Bitacora.registrar = classmethod(lambda cls, *args, **kwargs: None)
+
+    print(f"Multidifusión con orden total ({mensajes} mensajes por proceso)")
+    print(f"{'procesos':>9} {'ventana':>9} {'msg/s':>10} {'lat. media':>11} {'lat. p99':>10} {'acks/msg':>9}")
+    puerto_base = PUERTO_BASE
+    for num_procesos in PROCESOS:
+        for ventana in VENTANAS:
+            # Puertos nuevos en cada corrida: las anteriores no reciben mensajes de esta
+            rendimiento, media, p99, acks = medir(num_procesos, ventana, mensajes, puerto_base)
+            puerto_base += num_procesos
+            print(f"{num_procesos:>9} {ventana * 1000:>7.0f}ms {rendimiento:>10,.0f} "
+                  f"{media * 1000:>9.1f}ms {p99 * 1000:>8.1f}ms {acks:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
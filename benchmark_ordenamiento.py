@@ -0,0 +1,110 @@
+"""
+BENCHMARK DEL MOTOR DE ORDENAMIENTO
+Compara los algoritmos de motor_ordenamiento.py (quicksort_listas es la
+implementación original de P4) sobre varias distribuciones de entrada:
+- aleatoria: enteros de 0 a 10^9
+- pocos_valores: enteros de 0 a 100 (como QuickSort de P4)
+- ordenada / invertida
+- organo: sube y luego baja (mata pivotes ingenuos)
+
+quicksort_listas recursa una vez por nivel: con entradas que la hacen
+degenerar se marca como "recursión" si supera el límite de Python.
+
+Después mide los cruces de counting sort y radix sort contra sorted() e
+introsort según n y el rango de claves, y los de counting_sort_numpy contra
+numpy.sort (la ruta de SortStream). De ahí salen MINIMO_CONTEO y
+PROPORCION_CONTEO de la selección "auto".
+
+Uso: python benchmark_ordenamiento.py [tamaño ...]
+"""
+
+import random
+import sys
+import time
+import numpy as np
+from motor_ordenamiento import ALGORITMOS, counting_sort_numpy, elegir_algoritmo
+
+TAMANOS = (10**3, 10**4, 10**5)
+REPETICIONES = 3
+
+TAMANOS_CRUCE = (10**2, 10**3, 2 * 10**3, 4096, 10**4, 10**5, 10**6)
+RANGOS_CRUCE = (10**2, 10**3, 10**4, 10**5, 10**6)
+ALGORITMOS_CRUCE = ("conteo", "radix", "introsort", "integrado")
+TAMANOS_CRUCE_NUMPY = (10**4, 10**5, 10**6, 10**7)
+
+DISTRIBUCIONES = {
+    "aleatoria": lambda n: [random.randint(0, 10**9) for _ in range(n)],
+    "pocos_valores": lambda n: [random.randint(0, 100) for _ in range(n)],
+    "ordenada": lambda n: list(range(n)),
+    "invertida": lambda n: list(range(n, 0, -1)),
+    "organo": lambda n: list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+}
+
+
+def cronometrar(algoritmo, datos):
+    """Mejor tiempo de REPETICIONES corridas, o None si se desborda la recursión"""
+    mejor = None
+    for _ in range(REPETICIONES):
+        copia = list(datos)
+        inicio = time.perf_counter()
+        try:
+            resultado = ALGORITMOS[algoritmo](copia)
+        except RecursionError:
+            return None
+        transcurrido = time.perf_counter() - inicio
+        assert resultado == sorted(datos), f"{algoritmo} ordenó mal"
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor
+
+
+def mejor_tiempo(funcion, datos):
+    mejor = None
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion(datos)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor
+
+
+def cruces_listas():
+    print(f"\n{'tamaño':>10} {'rango':>10} " + " ".join(f"{nombre:>12}" for nombre in ALGORITMOS_CRUCE)
+          + f" {'más rápido':>12} {'auto':>12}")
+    for tamano in TAMANOS_CRUCE:
+        for rango in RANGOS_CRUCE:
+            datos = [random.randint(0, rango - 1) for _ in range(tamano)]
+            # introsort ordena in-place: se le pasa una copia en cada corrida
+            tiempos = [mejor_tiempo(lambda d: ALGORITMOS[nombre](list(d)), datos) for nombre in ALGORITMOS_CRUCE]
+            ganador = ALGORITMOS_CRUCE[tiempos.index(min(tiempos))]
+            print(f"{tamano:>10,} {rango:>10,} " + " ".join(f"{formatear(t):>12}" for t in tiempos)
+                  + f" {ganador:>12} {elegir_algoritmo(datos):>12}")
+
+
+def cruces_numpy():
+    rng = np.random.default_rng()
+    print(f"\n{'tamaño':>10} {'rango':>10} {'bincount':>12} {'numpy.sort':>12}")
+    for tamano in TAMANOS_CRUCE_NUMPY:
+        for rango in RANGOS_CRUCE:
+            datos = rng.integers(0, rango, tamano)
+            print(f"{tamano:>10,} {rango:>10,} {formatear(mejor_tiempo(counting_sort_numpy, datos)):>12} "
+                  f"{formatear(mejor_tiempo(np.sort, datos)):>12}")
+
+
+def formatear(segundos):
+    return "recursión" if segundos is None else f"{segundos * 1000:.2f} ms"
+
+
+def main():
+    tamanos = [int(argumento) for argumento in sys.argv[1:]] or TAMANOS
+    print(f"{'tamaño':>10} {'distribución':>14} " + " ".join(f"{nombre:>17}" for nombre in ALGORITMOS))
+    for tamano in tamanos:
+        for distribucion, generar in DISTRIBUCIONES.items():
+            datos = generar(tamano)
+            tiempos = [cronometrar(algoritmo, datos) for algoritmo in ALGORITMOS]
+            print(f"{tamano:>10,} {distribucion:>14} " + " ".join(f"{formatear(t):>17}" for t in tiempos))
+    cruces_listas()
+    cruces_numpy()
+
+
+if __name__ == '__main__':
+    main()
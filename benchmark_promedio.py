@@ -0,0 +1,65 @@
+"""
+BENCHMARK DE CalculateAverage: LISTAS DE PYTHON vs NUMPY
+Compara, para 50, 10^4, 10^6 y 10^8 números:
+- lista: [random.uniform(0, 10) ...] + sum()/len() + campo repeated double
+- numpy: numpy.random.Generator + mean() + bytes del arreglo (numbers_packed)
+Se mide por separado la generación + reducción y la serialización de la respuesta.
+
+La ruta de listas a 10^8 necesita varios GB de RAM; se omite salvo que se
+pase --lista-completa.
+
+Uso: python benchmark_promedio.py [--lista-completa]
+"""
+
+import random
+import sys
+import time
+import numpy as np
+import services_pb2
+
+TAMANOS = (50, 10**4, 10**6, 10**8)
+LIMITE_LISTA = 10**7
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def ruta_lista(tamano):
+    numeros, t_calculo = cronometrar(lambda: [random.uniform(0, 10) for _ in range(tamano)])
+    _, t_reduccion = cronometrar(lambda: sum(numeros) / len(numeros))
+    _, t_serializacion = cronometrar(
+        lambda: services_pb2.AverageResponse(numbers=numeros).SerializeToString())
+    return t_calculo + t_reduccion, t_serializacion
+
+
+def ruta_numpy(tamano):
+    rng = np.random.default_rng()
+    numeros, t_calculo = cronometrar(lambda: rng.uniform(0, 10, tamano))
+    _, t_reduccion = cronometrar(lambda: float(numeros.mean()))
+    _, t_serializacion = cronometrar(
+        lambda: services_pb2.AverageResponse(numbers_packed=numeros.tobytes()).SerializeToString())
+    return t_calculo + t_reduccion, t_serializacion
+
+
+def formatear(segundos):
+    return "-" if segundos is None else f"{segundos * 1000:.3f} ms"
+
+
+def main():
+    lista_completa = '--lista-completa' in sys.argv
+    print(f"{'tamaño':>12} {'lista calc':>14} {'lista serial':>14} {'numpy calc':>14} {'numpy serial':>14}")
+    for tamano in TAMANOS:
+        if tamano <= LIMITE_LISTA or lista_completa:
+            lista = ruta_lista(tamano)
+        else:
+            lista = (None, None)
+        numpy_ = ruta_numpy(tamano)
+        print(f"{tamano:>12,} {formatear(lista[0]):>14} {formatear(lista[1]):>14} "
+              f"{formatear(numpy_[0]):>14} {formatear(numpy_[1]):>14}")
+
+
+if __name__ == '__main__':
+    main()
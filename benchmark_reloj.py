@@ -0,0 +1,71 @@
+"""
+MICROBENCHMARK DEL RELOJ DE LAMPORT
+Compara, con 1 a 64 hilos, el patrón original (actualizar/incrementar y
+luego obtener_tiempo, dos adquisiciones del lock por evento) contra
+RelojLamport (una adquisición) y RelojLamportFragmentado.
+Cada iteración simula una petición: un RECEIVE y un evento INTERNAL.
+
+Uso: python benchmark_reloj.py [iteraciones_por_hilo]
+"""
+
+import sys
+import threading
+import time
+from reloj_lamport import RelojLamport, RelojLamportFragmentado
+
+
+class RelojLamportOriginal(RelojLamport):
+    """Uso original: cada evento vuelve a leer el reloj con obtener_tiempo()"""
+    def incrementar(self):
+        super().incrementar()
+        return self.obtener_tiempo()
+
+    def actualizar(self, tiempo_recibido):
+        super().actualizar(tiempo_recibido)
+        return self.obtener_tiempo()
+
+
+def simular_peticiones(reloj, iteraciones, barrera):
+    barrera.wait()
+    for i in range(iteraciones):
+        reloj.actualizar(i)
+        reloj.incrementar()
+
+
+def medir(crear_reloj, num_hilos, iteraciones):
+    """Devuelve eventos por segundo con num_hilos hilos concurrentes"""
+    reloj = crear_reloj()
+    barrera = threading.Barrier(num_hilos + 1)
+    hilos = [
+        threading.Thread(target=simular_peticiones, args=(reloj, iteraciones, barrera))
+        for _ in range(num_hilos)
+    ]
+    for hilo in hilos:
+        hilo.start()
+
+    inicio = time.perf_counter()
+    barrera.wait()
+    for hilo in hilos:
+        hilo.join()
+    duracion = time.perf_counter() - inicio
+
+    return (2 * iteraciones * num_hilos) / duracion
+
+
+def main():
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    relojes = [
+        ("original", RelojLamportOriginal),
+        ("simple", RelojLamport),
+        ("fragmentado", RelojLamportFragmentado),
+    ]
+
+    print(f"Eventos por segundo ({iteraciones} peticiones por hilo)")
+    print(f"{'hilos':>6}" + "".join(f"{nombre:>14}" for nombre, _ in relojes))
+    for num_hilos in (1, 2, 4, 8, 16, 32, 64):
+        fila = [medir(crear, num_hilos, iteraciones) for _, crear in relojes]
+        print(f"{num_hilos:>6}" + "".join(f"{valor:>14,.0f}" for valor in fila))
+
+
+if __name__ == '__main__':
+    main()
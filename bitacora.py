@@ -0,0 +1,158 @@
+"""
+BITÁCORA DE EVENTOS NO BLOQUEANTE
+Bitacora.registrar() solo guarda el evento en un buffer circular en memoria;
+un hilo en segundo plano le da formato y lo escribe en stdout por lotes.
+Cada registro lleva: hora de pared, tipo de evento, proceso, par (proceso
+origen/destino del mensaje), valor del reloj de Lamport y detalles.
+
+Configuración (variables de entorno o Bitacora.configurar):
+- FORMATO_BITACORA: "json" (una línea JSON por evento) o "texto" (formato clásico)
+- CAPACIDAD_BITACORA: máximo de eventos pendientes en el buffer
+- POLITICA_BITACORA: qué hacer con el buffer lleno
+    "descartar_antiguo" (por defecto), "descartar_nuevo" o "bloquear"
+- DIRECTORIO_DIARIO: si se indica, los eventos también se guardan en el
+    diario binario persistente del proceso (ver diario_eventos.py). El
+    diario se escribe al registrar el evento, sin pasar por el buffer, así
+    que no pierde eventos aunque la política de desborde los descarte
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from diario_eventos import DiarioEventos
+
+POLITICAS_DESBORDE = ("descartar_antiguo", "descartar_nuevo", "bloquear")
+
+
+class Bitacora:
+    """Sistema de registro de eventos con buffer y escritura en segundo plano"""
+    id_proceso = None
+    formato = os.environ.get("FORMATO_BITACORA", "json")
+    capacidad = int(os.environ.get("CAPACIDAD_BITACORA", "65536"))
+    politica = os.environ.get("POLITICA_BITACORA", "descartar_antiguo")
+    intervalo = 0.2  # segundos máximos entre escrituras
+    diario = None
+
+    buffer = deque()
+    descartados = 0
+    lock = threading.Lock()
+    hay_registros = threading.Condition(lock)
+    hay_espacio = threading.Condition(lock)
+    hilo = None
+    detenido = False
+
+    @classmethod
+    def configurar(cls, id_proceso, formato=None, capacidad=None, politica=None,
+                   directorio_diario=None):
+        """Fija el proceso dueño de la bitácora y, opcionalmente, la configuración"""
+        if politica is not None and politica not in POLITICAS_DESBORDE:
+            raise ValueError(f"Política de desborde desconocida: {politica}")
+        if directorio_diario is None:
+            directorio_diario = os.environ.get("DIRECTORIO_DIARIO")
+        with cls.lock:
+            cls.id_proceso = id_proceso
+            if directorio_diario and cls.diario is None:
+                cls.diario = DiarioEventos(directorio_diario, id_proceso)
+            if formato is not None:
+                cls.formato = formato
+            if capacidad is not None:
+                cls.capacidad = capacidad
+            if politica is not None:
+                cls.politica = politica
+            cls._iniciar_hilo()
+
+    @classmethod
+    def registrar(cls, tipo_evento, detalles, valor_reloj, par=None):
+        registro = (time.time(), tipo_evento, cls.id_proceso, par, valor_reloj, detalles)
+        diario = cls.diario
+        if diario is not None:
+            diario.agregar([(registro[0], tipo_evento, par, valor_reloj, detalles)])
+
+        with cls.lock:
+            if cls.hilo is None:
+                cls._iniciar_hilo()
+
+            if len(cls.buffer) >= cls.capacidad:
+                if cls.politica == "descartar_nuevo":
+                    cls.descartados += 1
+                    return
+                if cls.politica == "bloquear":
+                    while len(cls.buffer) >= cls.capacidad and not cls.detenido:
+                        cls.hay_espacio.wait()
+                else:
+                    cls.buffer.popleft()
+                    cls.descartados += 1
+
+            cls.buffer.append(registro)
+            if len(cls.buffer) >= cls.capacidad // 2:
+                cls.hay_registros.notify()
+
+    @classmethod
+    def cerrar(cls):
+        """Escribe los eventos pendientes y detiene el hilo de escritura"""
+        with cls.lock:
+            hilo = cls.hilo
+            cls.detenido = True
+            cls.hay_registros.notify()
+            cls.hay_espacio.notify_all()
+        if hilo is not None:
+            hilo.join()
+
+    @classmethod
+    def _iniciar_hilo(cls):
+        # Se llama con el lock tomado
+        if cls.hilo is None:
+            cls.detenido = False
+            cls.hilo = threading.Thread(target=cls._escribir_pendientes, daemon=True)
+            cls.hilo.start()
+
+    @classmethod
+    def _escribir_pendientes(cls):
+        while True:
+            with cls.lock:
+                if not cls.buffer and not cls.detenido:
+                    cls.hay_registros.wait(cls.intervalo)
+                lote = cls.buffer
+                cls.buffer = deque()
+                descartados = cls.descartados
+                cls.descartados = 0
+                detenido = cls.detenido
+                cls.hay_espacio.notify_all()
+
+            if descartados:
+                lote.append((time.time(), "DROPPED", cls.id_proceso, None, None,
+                             f"{descartados} eventos descartados por buffer lleno"))
+
+            if lote:
+                sys.stdout.write("".join(cls._formatear(registro) for registro in lote))
+                sys.stdout.flush()
+
+            if detenido:
+                with cls.lock:
+                    cls.hilo = None
+                    if cls.diario is not None:
+                        cls.diario.cerrar()
+                        cls.diario = None
+                return
+
+    @classmethod
+    def _formatear(cls, registro):
+        hora, tipo_evento, id_proceso, par, valor_reloj, detalles = registro
+        if cls.formato == "texto":
+            marca_temporal = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(hora))
+            return f"[{marca_temporal}] [{tipo_evento}] {detalles} clock={valor_reloj}\n"
+        return json.dumps({
+            "hora": round(hora, 6),
+            "tipo": tipo_evento,
+            "proceso": id_proceso,
+            "par": par,
+            "reloj": valor_reloj,
+            "detalles": detalles,
+        }, ensure_ascii=False) + "\n"
+
+
+atexit.register(Bitacora.cerrar)
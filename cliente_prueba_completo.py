@@ -5,9 +5,33 @@ y verificando que el reloj de Lamport funciona correctamente.
 """
 
 import grpc
+import os
 import services_pb2
 import services_pb2_grpc
 import time
+from balanceo import Balanceador
+from pool_canales import PoolCanales, OPCIONES_CANAL, OPCIONES_TAMANO_MENSAJE
+from topologia import Topologia
+
+# Endpoints de los procesos vistos desde el host (puertos publicados por
+# docker-compose). Para repartir entre las réplicas, p. ej.:
+# ENDPOINTS_P3_MATRIX="localhost:50053,localhost:50531,localhost:50532"
+TOPOLOGIA_CLIENTE = {
+    "P1_MATH": ["localhost:50051"],
+    "P2_AVG": ["localhost:50052"],
+    "P3_MATRIX": ["localhost:50053"],
+    "P4_SORT": ["localhost:50054"],
+    "P5_SEARCH": ["localhost:50055"],
+}
+
+# Stubs balanceados (round_robin o menos_pendientes, POLITICA_BALANCEO). Los
+# canales aceptan mensajes grandes, como los de P2 y P3
+BALANCEADOR = Balanceador(
+    PoolCanales(OPCIONES_CANAL + OPCIONES_TAMANO_MENSAJE),
+    Topologia(os.environ.get("ARCHIVO_TOPOLOGIA_CLIENTE", ""), directorio_registro="",
+              por_defecto=TOPOLOGIA_CLIENTE),
+    politica=os.environ.get("POLITICA_BALANCEO", "menos_pendientes")
+)
 
 class RelojLamportCliente:
     """Reloj de Lamport para el cliente"""
@@ -36,9 +60,8 @@ def probar_proceso1_matematicas():
     
     reloj = RelojLamportCliente()
     
-    # Conectar al servidor del proceso 1 (puerto 50051)
-    canal = grpc.insecure_channel('localhost:50051')
-    cliente = services_pb2_grpc.MathServiceStub(canal)
+    # Stub repartido entre las réplicas del proceso 1
+    cliente = BALANCEADOR.stub("P1_MATH", services_pb2_grpc.MathServiceStub)
     
     try:
         # Prueba 1: SUMA
@@ -108,9 +131,8 @@ def probar_proceso2_promedio():
     
     reloj = RelojLamportCliente()
     
-    # Conectar al servidor del proceso 2 (puerto 50052)
-    canal = grpc.insecure_channel('localhost:50052')
-    cliente = services_pb2_grpc.AverageServiceStub(canal)
+    # Stub repartido entre las réplicas del proceso 2
+    cliente = BALANCEADOR.stub("P2_AVG", services_pb2_grpc.AverageServiceStub)
     
     try:
         print("\n[ENVIANDO] Solicitando calculo de promedio de 50 numeros aleatorios...")
@@ -143,9 +165,8 @@ def probar_proceso3_matrices():
     
     reloj = RelojLamportCliente()
     
-    # Conectar al servidor del proceso 3 (puerto 50053)
-    canal = grpc.insecure_channel('localhost:50053')
-    cliente = services_pb2_grpc.MatrixServiceStub(canal)
+    # Stub repartido entre las réplicas del proceso 3
+    cliente = BALANCEADOR.stub("P3_MATRIX", services_pb2_grpc.MatrixServiceStub)
     
     try:
         print("\n[ENVIANDO] Solicitando multiplicacion de matrices 2x2...")
@@ -192,9 +213,8 @@ def probar_proceso4_quicksort():
     
     reloj = RelojLamportCliente()
     
-    # Conectar al servidor del proceso 4 (puerto 50054)
-    canal = grpc.insecure_channel('localhost:50054')
-    cliente = services_pb2_grpc.SortServiceStub(canal)
+    # Stub repartido entre las réplicas del proceso 4
+    cliente = BALANCEADOR.stub("P4_SORT", services_pb2_grpc.SortServiceStub)
     
     try:
         print("\n[ENVIANDO] Solicitando ordenamiento de 100 numeros aleatorios...")
@@ -228,9 +248,8 @@ def probar_proceso5_busqueda():
     
     reloj = RelojLamportCliente()
     
-    # Conectar al servidor del proceso 5 (puerto 50055)
-    canal = grpc.insecure_channel('localhost:50055')
-    cliente = services_pb2_grpc.SearchServiceStub(canal)
+    # Stub repartido entre las réplicas del proceso 5
+    cliente = BALANCEADOR.stub("P5_SEARCH", services_pb2_grpc.SearchServiceStub)
     
     try:
         print("\n[ENVIANDO] Solicitando busqueda de [3, 22, 50] en 200 numeros...")
@@ -261,6 +280,17 @@ def probar_proceso5_busqueda():
         print("[AVISO] Asegurate de que el proceso5_busqueda.py este corriendo")
 
 
+def mostrar_replicas():
+    """Llamadas, errores y latencia media por réplica"""
+    print("\n" + "="*60)
+    print("REPLICAS")
+    print("="*60)
+    for endpoint, (llamadas, errores, en_curso, latencia, sana) in sorted(BALANCEADOR.estado().items()):
+        latencia = "-" if latencia is None else f"{latencia:.1f} ms"
+        print(f"   {endpoint:<22} llamadas={llamadas} errores={errores} latencia={latencia} "
+              f"{'sana' if sana else 'fuera'}")
+
+
 def menu_principal():
     """Menú interactivo para probar los procesos"""
     print("\n" + "="*60)
@@ -302,6 +332,7 @@ if __name__ == '__main__':
             probar_proceso4_quicksort()
             time.sleep(1)
             probar_proceso5_busqueda()
+            mostrar_replicas()
         elif opcion == '7':
             print("\n[SALIR] Hasta luego!")
             break
@@ -0,0 +1,149 @@
+"""
+DIARIO PERSISTENTE DE EVENTOS LAMPORT
+Cada proceso agrega registros binarios de tamaño fijo a un archivo mapeado
+en memoria (<proceso>.diario). El texto de cada evento va a un archivo
+aparte (<proceso>.payload) y el registro guarda su desplazamiento y longitud.
+
+Formato del .diario:
+- Cabecera (64 bytes): firma, versión, número de registros, id del proceso
+- Registros (48 bytes): reloj, hora de pared, desplazamiento y longitud del
+  payload, tipo de evento y par (proceso origen/destino)
+
+Cada vez que el proceso arranca se escribe un registro INICIO, para que la
+herramienta de reproducción separe las ejecuciones (el reloj vuelve a 0).
+La hora de pared del INICIO es la que alinea las ejecuciones de los distintos
+procesos.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import numpy as np
+
+FIRMA = b'LAMPDIAR'
+VERSION = 1
+FORMATO_CABECERA = '<8sHxxxxxxQ32s8x'
+TAMANO_CABECERA = struct.calcsize(FORMATO_CABECERA)
+FORMATO_REGISTRO = '<QdQIB3x16s'
+TAMANO_REGISTRO = struct.calcsize(FORMATO_REGISTRO)
+REGISTROS_INICIALES = 4096
+
+# Mismo layout que FORMATO_REGISTRO, para leer el diario con NumPy sin copiar
+DTYPE_REGISTRO = np.dtype([
+    ('reloj', '<u8'),
+    ('hora', '<f8'),
+    ('desplazamiento', '<u8'),
+    ('longitud', '<u4'),
+    ('tipo', 'u1'),
+    ('relleno', 'V3'),
+    ('par', 'S16'),
+])
+
+TIPOS_EVENTO = {"INICIO": 0, "INTERNAL": 1, "SEND": 2, "RECEIVE": 3, "DROPPED": 4}
+NOMBRES_TIPO = {codigo: nombre for nombre, codigo in TIPOS_EVENTO.items()}
+TIPO_DESCONOCIDO = 255
+
+
+class DiarioEventos:
+    """Diario binario de un proceso, mapeado en memoria y de solo agregar"""
+    def __init__(self, directorio, id_proceso):
+        os.makedirs(directorio, exist_ok=True)
+        self.id_proceso = id_proceso
+        self.ruta = os.path.join(directorio, f"{id_proceso}.diario")
+        self.lock = threading.Lock()
+        self.cerrado = False
+
+        self.archivo = open(self.ruta, 'a+b')
+        self.payload = open(os.path.join(directorio, f"{id_proceso}.payload"), 'ab')
+        self.desplazamiento_payload = self.payload.seek(0, os.SEEK_END)
+
+        tamano = os.fstat(self.archivo.fileno()).st_size
+        if tamano < TAMANO_CABECERA:
+            tamano = TAMANO_CABECERA + REGISTROS_INICIALES * TAMANO_REGISTRO
+            self.archivo.truncate(tamano)
+            self.mapa = mmap.mmap(self.archivo.fileno(), tamano)
+            self.num_registros = 0
+            self._escribir_cabecera()
+        else:
+            self.mapa = mmap.mmap(self.archivo.fileno(), tamano)
+            firma, version, self.num_registros, _ = struct.unpack_from(FORMATO_CABECERA, self.mapa, 0)
+            if firma != FIRMA or version != VERSION:
+                raise ValueError(f"{self.ruta} no es un diario de eventos válido")
+
+        self.agregar([(time.time(), "INICIO", None, 0, f"{id_proceso} iniciado")])
+
+    def _escribir_cabecera(self):
+        struct.pack_into(FORMATO_CABECERA, self.mapa, 0, FIRMA, VERSION,
+                         self.num_registros, self.id_proceso.encode()[:32])
+
+    def _asegurar_espacio(self, registros_nuevos):
+        necesario = TAMANO_CABECERA + (self.num_registros + registros_nuevos) * TAMANO_REGISTRO
+        if necesario <= len(self.mapa):
+            return
+        tamano = len(self.mapa)
+        while tamano < necesario:
+            tamano *= 2
+        self.mapa.flush()
+        self.mapa.close()
+        self.archivo.truncate(tamano)
+        self.mapa = mmap.mmap(self.archivo.fileno(), tamano)
+
+    def agregar(self, eventos):
+        """Agrega un lote de eventos (hora, tipo, par, reloj, detalles); se ignora si ya se cerró"""
+        with self.lock:
+            if self.cerrado:
+                return
+            self._asegurar_espacio(len(eventos))
+            posicion = TAMANO_CABECERA + self.num_registros * TAMANO_REGISTRO
+            textos = []
+            for hora, tipo_evento, par, valor_reloj, detalles in eventos:
+                texto = str(detalles).encode()
+                struct.pack_into(FORMATO_REGISTRO, self.mapa, posicion,
+                                 valor_reloj or 0, hora, self.desplazamiento_payload, len(texto),
+                                 TIPOS_EVENTO.get(tipo_evento, TIPO_DESCONOCIDO),
+                                 (par or "").encode()[:16])
+                textos.append(texto)
+                self.desplazamiento_payload += len(texto)
+                posicion += TAMANO_REGISTRO
+
+            # El payload se escribe antes de publicar los registros en la cabecera
+            self.payload.write(b"".join(textos))
+            self.payload.flush()
+            self.num_registros += len(eventos)
+            self._escribir_cabecera()
+
+    def cerrar(self):
+        with self.lock:
+            if self.cerrado:
+                return
+            self.cerrado = True
+            self.mapa.flush()
+            self.mapa.close()
+            self.archivo.close()
+            self.payload.close()
+
+
+def leer_diario(ruta):
+    """
+    Abre un diario sin copiarlo: devuelve (id_proceso, registros, payload),
+    donde registros es un arreglo NumPy sobre el archivo mapeado y payload
+    un mmap del archivo de textos (o b"" si está vacío).
+    """
+    with open(ruta, 'rb') as archivo:
+        firma, version, num_registros, id_proceso = struct.unpack(
+            FORMATO_CABECERA, archivo.read(TAMANO_CABECERA))
+    if firma != FIRMA or version != VERSION:
+        raise ValueError(f"{ruta} no es un diario de eventos válido")
+
+    registros = np.memmap(ruta, dtype=DTYPE_REGISTRO, mode='r',
+                          offset=TAMANO_CABECERA, shape=(num_registros,))
+
+    ruta_payload = ruta[:-len('.diario')] + '.payload'
+    payload = b""
+    if os.path.exists(ruta_payload) and os.path.getsize(ruta_payload) > 0:
+        with open(ruta_payload, 'rb') as archivo:
+            payload = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return id_proceso.rstrip(b'\0').decode(), registros, payload
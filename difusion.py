@@ -0,0 +1,548 @@
+"""
+DIFUSIÓN (BroadcastService)
+Servicio común a los cinco procesos: el proceso que recibe BroadcastMessage
+entrega el mensaje a todos los demás por MessageService.SendMessage.
+- Las entregas salen a la vez desde un pool de hilos, sobre los canales
+  compartidos del pool, cada una con su propio plazo (PLAZO_DIFUSION segundos).
+- La respuesta vuelve en cuanto confirma el quórum (QUORUM_DIFUSION pares,
+  o el campo quorum de la petición; 0 = todos) o cuando ya no puede
+  alcanzarse. Las entregas que siguen en curso terminan por su cuenta y sus
+  confirmaciones igual adelantan el reloj.
+- En Lamport la difusión es un solo envío: un SEND por par con el mismo
+  tiempo, y un RECEIVE por cada confirmación.
+
+Con causal=True el mensaje va a todos los demás procesos (también a quien
+pidió la difusión) por DeliverCausal, con el reloj vectorial del emisor, y
+cada receptor lo entrega en orden causal (reloj_vectorial.ColaCausal). El
+emisor guarda sus últimas HISTORIAL_CAUSAL difusiones: si la confirmación
+de un par muestra que le faltan difusiones anteriores (se perdieron por un
+fallo), se las reenvía para que no quede retenido para siempre. Solo
+cuentan como entregados (y para el quórum) los pares cuya confirmación
+(CausalAck.delivered, o la del reenvío) muestra que ya entregaron esta
+difusión; los que la siguen reteniendo se informan aparte (held), aunque
+hayan respondido DUPLICADO porque ya la tenían retenida.
+
+Con total_order=True el mensaje va a todos los demás procesos por
+DeliverOrdered y todos lo entregan en el mismo orden total, el de la clave
+(reloj de Lamport, id del emisor) (orden_total.ColaOrdenTotal). Las
+confirmaciones (AckOrdered) son acumulativas y salen por lotes: una por
+VENTANA_ACK_ORDEN segundos como máximo (0 = una por mensaje recibido).
+Un mensaje que no llega a un par detendría la entrega en todos, así que el
+emisor guarda sus últimas HISTORIAL_ORDEN multidifusiones y, por cada par,
+las que no le pudo entregar. Las reintenta tras PLAZO_DIFUSION segundos
+(hasta REINTENTOS_ORDEN veces seguidas) y cada vez que una confirmación del
+par muestra que le faltan (OrderAck.received). Si no lo logra, o si el
+mensaje ya salió del historial, lo informa; los receptores también avisan
+cuando la cola queda detenida esperando mensajes de un proceso.
+
+Los procesos salen de la topología (topologia.py) al crear el servicio: un
+destino por id lógico, su primer endpoint. El conjunto queda fijo mientras
+el proceso corre, porque los relojes vectoriales y el orden total necesitan
+que todos los miembros sean los mismos en cada proceso.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent import futures
+import grpc
+import services_pb2
+import services_pb2_grpc
+from bitacora import Bitacora
+from reloj_vectorial import ColaCausal, codificar_vector, decodificar_vector
+from orden_total import ColaOrdenTotal
+from topologia import obtener_topologia
+
+PLAZO_DIFUSION = float(os.environ.get("PLAZO_DIFUSION", "2.0"))
+QUORUM_DIFUSION = int(os.environ.get("QUORUM_DIFUSION", "0"))
+HISTORIAL_CAUSAL = 1024
+HISTORIAL_ORDEN = 1024
+REINTENTOS_ORDEN = 3
+VENTANA_ACK_ORDEN = float(os.environ.get("VENTANA_ACK_ORDEN", "0.005"))
+
+
+class Entrega:
+    """Estado de una difusión en curso: confirmaciones y fallos por par"""
+    def __init__(self, total, quorum, vector=None, orden=None):
+        self.total = total
+        self.quorum = quorum
+        self.vector = vector  # difusión causal: vector del mensaje
+        self.orden = orden    # orden total: (reloj, secuencia) del mensaje
+        self.tiempo_peticion = 0  # reloj al recibir el BroadcastMessage
+        self.entregados = []
+        self.fallidos = []
+        self.retenidos = []  # difusión causal: pares que la recibieron pero aún no la entregan
+        self.timestamp_maximo = 0
+        self.condicion = threading.Condition()
+        self.al_decidir = None  # aviso al event loop de un BroadcastMessage aio
+
+    def decidida(self):
+        """True si ya se alcanzó el quórum o ya no es posible alcanzarlo"""
+        return (len(self.entregados) >= self.quorum
+                or self.total - len(self.fallidos) - len(self.retenidos) < self.quorum)
+
+    def avisar(self):
+        """Despierta a quien espera el quórum; se llama con la condición tomada"""
+        self.condicion.notify_all()
+        if self.al_decidir is not None and self.decidida():
+            self.al_decidir()
+
+    async def esperar_async(self):
+        """Espera el quórum desde el event loop sin ocupar un hilo"""
+        loop = asyncio.get_running_loop()
+        decidida = loop.create_future()
+
+        def resolver():
+            if not decidida.done():
+                decidida.set_result(None)
+
+        with self.condicion:
+            if self.decidida():
+                return
+            self.al_decidir = lambda: loop.call_soon_threadsafe(resolver)
+        await decidida
+
+
+class ServicioDifusion(services_pb2_grpc.BroadcastServiceServicer):
+    """Implementación del servicio de difusión"""
+
+    def __init__(self, id_proceso, reloj, pool, procesos=None, plazo=PLAZO_DIFUSION, quorum=QUORUM_DIFUSION,
+                 ventana_ack=VENTANA_ACK_ORDEN, al_entregar=None):
+        self.id_proceso = id_proceso
+        self.reloj = reloj
+        self.pool = pool
+        # id -> (host, puerto)
+        self.procesos = obtener_topologia().procesos() if procesos is None else procesos
+        self.plazo = plazo
+        self.quorum = quorum
+        # Hilos para varias difusiones a la vez; una entrega vive a lo más self.plazo segundos
+        self.hilos = futures.ThreadPoolExecutor(max_workers=4 * len(self.procesos),
+                                                thread_name_prefix="difusion")
+        self.causal = ColaCausal(self.procesos, id_proceso)
+        self.historial = {}  # secuencia -> CausalMessage de las últimas difusiones causales propias
+        self.lock_historial = threading.Lock()
+        # Orden total: el reloj y la secuencia de cada mensaje propio (y de cada
+        # confirmación) se toman juntos bajo lock_orden
+        self.orden_total = ColaOrdenTotal(self.procesos, id_proceso)
+        self.enviados_orden = 0
+        self.lock_orden = threading.Lock()
+        self.lock_entrega_orden = threading.Lock()
+        self.historial_orden = {}  # secuencia -> OrderedMessage de las últimas multidifusiones propias
+        self.faltantes_orden = {id_par: set() for id_par in self.procesos if id_par != id_proceso}
+        self.reparando_orden = set()  # pares a los que se les está reenviando
+        self.atraso_desde = {}  # id -> (recibidos, desde cuándo, ya informado) de los procesos atrasados
+        self.ventana_ack = ventana_ack
+        self.ack_pendiente = threading.Event()
+        self.hilo_acks = None
+        # Función (remitente, secuencia, contenido) llamada en cada entrega en orden total
+        self.al_entregar = al_entregar
+
+    def pares(self, remitente):
+        """Destinos de la difusión: todos menos este proceso y quien la pidió"""
+        return {id_par: destino for id_par, destino in self.procesos.items()
+                if id_par not in (self.id_proceso, remitente)}
+
+    def _reenviar_faltantes(self, cliente, id_par, entregados, secuencia):
+        """
+        Reenvía al par las difusiones causales propias entre entregados y
+        secuencia; devuelve cuántas de este proceso tiene entregadas el par después.
+        """
+        for faltante in range(entregados + 1, secuencia):
+            with self.lock_historial:
+                mensaje = self.historial.get(faltante)
+            if mensaje is None:
+                continue
+            try:
+                respuesta = cliente.DeliverCausal(mensaje, timeout=self.plazo)
+            except grpc.RpcError as e:
+                print(f"[ERROR] Difusión causal: no se pudo reenviar #{faltante} a {id_par}: {e}")
+                break
+            entregados = max(entregados, respuesta.delivered)
+        return entregados
+
+    def _entregar(self, entrega, id_par, host, puerto, peticion):
+        """Hilo de una entrega: SendMessage (DeliverCausal, DeliverOrdered) al par con su plazo"""
+        causal = isinstance(peticion, services_pb2.CausalMessage)
+        try:
+            if causal:
+                cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.BroadcastServiceStub)
+                respuesta = cliente.DeliverCausal(peticion, timeout=self.plazo)
+                if respuesta.status.startswith("ERROR"):
+                    raise RuntimeError(respuesta.status)
+            elif isinstance(peticion, services_pb2.OrderedMessage):
+                cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.BroadcastServiceStub)
+                try:
+                    respuesta = cliente.DeliverOrdered(peticion, timeout=self.plazo)
+                except grpc.RpcError:
+                    # Sin este mensaje el par no puede entregar nada posterior: se reintenta
+                    with self.lock_orden:
+                        self.faltantes_orden[id_par].add(peticion.sequence)
+                    self._programar_reparacion(id_par, 0)
+                    raise
+                if respuesta.status.startswith("ERROR"):
+                    raise RuntimeError(respuesta.status)
+            else:
+                cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.MessageServiceStub)
+                respuesta = cliente.SendMessage(peticion, timeout=self.plazo)
+        except (grpc.RpcError, RuntimeError) as e:
+            self.pool.reportar_error(host, puerto, e)
+            print(f"[ERROR] Difusión: {id_par} no confirmó: {e}")
+            with entrega.condicion:
+                entrega.fallidos.append(id_par)
+                entrega.avisar()
+            return
+
+        tiempo = self.reloj.actualizar(respuesta.timestamp)
+        Bitacora.registrar("RECEIVE",
+                          f"{self.id_proceso} <- {id_par} ACK de difusión",
+                          tiempo, par=id_par)
+
+        entregado = True
+        if causal:
+            secuencia = decodificar_vector(peticion.vector_delta)[self.causal.propio]
+            entregados = respuesta.delivered
+            if entregados < secuencia - 1:
+                # Al par le faltan difusiones anteriores: con el reenvío puede entregar esta también
+                entregados = self._reenviar_faltantes(cliente, id_par, entregados, secuencia)
+            # Solo cuenta el contador de entregados del par: un DUPLICADO puede
+            # ser un mensaje que el par ya tenía pero sigue reteniendo
+            entregado = entregados >= secuencia
+        with entrega.condicion:
+            (entrega.entregados if entregado else entrega.retenidos).append(id_par)
+            entrega.timestamp_maximo = max(entrega.timestamp_maximo, respuesta.timestamp)
+            entrega.avisar()
+
+    def difundir(self, mensaje, remitente="", quorum=0, vector=None, orden=None, esperar=True):
+        """
+        Entrega el mensaje a los pares y, con esperar, espera el quórum; devuelve la Entrega.
+        Con vector (difusión causal) va por DeliverCausal, y con orden
+        ((reloj, secuencia) ya tomados) por DeliverOrdered, a todos los demás procesos.
+        """
+        pares = self.pares(remitente if vector is None and orden is None else self.id_proceso)
+        quorum = min(quorum or self.quorum or len(pares), len(pares))
+        entrega = Entrega(len(pares), quorum, vector, orden)
+
+        if orden is not None:
+            tiempo, secuencia = orden
+            mensaje_ordenado = services_pb2.OrderedMessage(
+                sender_id=self.id_proceso,
+                timestamp=tiempo,
+                sequence=secuencia,
+                message=mensaje
+            )
+            with self.lock_orden:
+                self.historial_orden[secuencia] = mensaje_ordenado
+                if len(self.historial_orden) > HISTORIAL_ORDEN:
+                    del self.historial_orden[min(self.historial_orden)]
+        else:
+            tiempo = self.reloj.incrementar()
+        if vector is not None:
+            mensaje_causal = services_pb2.CausalMessage(
+                sender_id=self.id_proceso,
+                vector_delta=codificar_vector(vector),
+                timestamp=tiempo,
+                message=mensaje
+            )
+            with self.lock_historial:
+                self.historial[vector[self.causal.propio]] = mensaje_causal
+                if len(self.historial) > HISTORIAL_CAUSAL:
+                    del self.historial[min(self.historial)]
+
+        for id_par, (host, puerto) in pares.items():
+            modo = " causal" if vector is not None else " ordenada" if orden is not None else ""
+            Bitacora.registrar("SEND",
+                              f"{self.id_proceso} -> {id_par} difusión{modo}='{mensaje}'",
+                              tiempo, par=id_par)
+            if vector is not None:
+                peticion = mensaje_causal
+            elif orden is not None:
+                peticion = mensaje_ordenado
+            else:
+                peticion = services_pb2.MessageRequest(
+                    sender_id=self.id_proceso,
+                    receiver_id=id_par,
+                    message=mensaje,
+                    timestamp=tiempo
+                )
+            self.hilos.submit(self._entregar, entrega, id_par, host, puerto, peticion)
+
+        if esperar:
+            with entrega.condicion:
+                # Cada entrega termina a más tardar en su plazo, así que la espera está acotada
+                entrega.condicion.wait_for(entrega.decidida)
+        return entrega
+
+    def iniciar_difusion(self, peticion):
+        """
+        Primera mitad de BroadcastMessage: registra la petición y lanza las
+        entregas sin esperar el quórum. Devuelve (entrega, None), o
+        (None, respuesta) si la petición no es válida.
+        """
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        Bitacora.registrar("RECEIVE",
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=DIFUNDIR('{peticion.message}')",
+                          tiempo, par=peticion.sender_id)
+
+        if peticion.quorum < 0:
+            return None, services_pb2.BroadcastResponse(timestamp=tiempo,
+                                                        status="ERROR: quorum no puede ser negativo")
+        if peticion.causal and peticion.total_order:
+            return None, services_pb2.BroadcastResponse(timestamp=tiempo,
+                                                        status="ERROR: causal y total_order son excluyentes")
+
+        # Difusión causal: la propia queda entregada aquí al tomar su vector
+        vector = self.causal.preparar_envio() if peticion.causal else None
+        orden = None
+        if peticion.total_order:
+            with self.lock_orden:
+                self.enviados_orden += 1
+                orden = (self.reloj.incrementar(), self.enviados_orden)
+            self.orden_total.agregar_propio(*orden, peticion.message)
+        entrega = self.difundir(peticion.message, peticion.sender_id, peticion.quorum, vector, orden,
+                                esperar=False)
+        entrega.tiempo_peticion = tiempo
+        return entrega, None
+
+    def responder_difusion(self, entrega):
+        """Segunda mitad de BroadcastMessage, con la entrega ya decidida"""
+        if entrega.orden is not None:
+            self.entregar_ordenados()
+        with entrega.condicion:
+            entregados = list(entrega.entregados)
+            fallidos = list(entrega.fallidos)
+            retenidos = list(entrega.retenidos)
+            timestamp_maximo = entrega.timestamp_maximo
+
+        if len(entregados) >= entrega.quorum:
+            estado = "OK"
+        else:
+            estado = f"ERROR: quórum no alcanzado ({len(entregados)}/{entrega.quorum})"
+        return services_pb2.BroadcastResponse(
+            status=estado,
+            delivered_to=entregados,
+            failed=fallidos,
+            held=retenidos,
+            timestamp=self.reloj.obtener_tiempo(),
+            max_timestamp=max(timestamp_maximo, entrega.tiempo_peticion),
+            quorum=entrega.quorum,
+            vector_delta=codificar_vector(entrega.vector) if entrega.vector else []
+        )
+
+    def BroadcastMessage(self, peticion, contexto):
+        entrega, respuesta = self.iniciar_difusion(peticion)
+        if entrega is None:
+            return respuesta
+        with entrega.condicion:
+            # Cada entrega termina a más tardar en su plazo, así que la espera está acotada
+            entrega.condicion.wait_for(entrega.decidida)
+        return self.responder_difusion(entrega)
+
+    def DeliverCausal(self, peticion, contexto):
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        vector = decodificar_vector(peticion.vector_delta)
+        try:
+            entregados = self.causal.recibir(peticion.sender_id, vector, peticion.message)
+        except ValueError as e:
+            Bitacora.registrar("RECEIVE",
+                              f"{self.id_proceso} <- {peticion.sender_id} difusión causal rechazada: {e}",
+                              tiempo, par=peticion.sender_id)
+            return services_pb2.CausalAck(status=f"ERROR: {e}", timestamp=tiempo)
+
+        secuencia = vector[self.causal.indices[peticion.sender_id]]
+        if entregados is None:
+            estado = "DUPLICADO"
+        else:
+            estado = "ENTREGADO" if entregados else "RETENIDO"
+        Bitacora.registrar("RECEIVE",
+                          f"{self.id_proceso} <- {peticion.sender_id} difusión causal #{secuencia} vector={vector} {estado}",
+                          tiempo, par=peticion.sender_id)
+        for remitente, numero, contenido in entregados or []:
+            tiempo = self.reloj.incrementar()
+            Bitacora.registrar("INTERNAL",
+                              f"{self.id_proceso} entregó la difusión causal {remitente}#{numero}='{contenido}'",
+                              tiempo)
+
+        return services_pb2.CausalAck(
+            status=estado,
+            timestamp=tiempo,
+            delivered=self.causal.entregados_de(peticion.sender_id)
+        )
+
+    def entregar_ordenados(self):
+        """Entrega, en orden total, los mensajes de la cabeza de la cola que ya son estables"""
+        # Un solo hilo a la vez, para que las entregas salgan en el orden en que se sacan
+        with self.lock_entrega_orden:
+            for reloj, remitente, secuencia, contenido in self.orden_total.entregables():
+                tiempo = self.reloj.incrementar()
+                Bitacora.registrar("INTERNAL",
+                                  f"{self.id_proceso} entregó en orden total ({reloj}, {remitente})#{secuencia}='{contenido}'",
+                                  tiempo)
+                if self.al_entregar is not None:
+                    self.al_entregar(remitente, secuencia, contenido)
+            self._informar_atraso()
+
+    def _informar_atraso(self):
+        """
+        Avisa si la cola lleva más de 2 plazos detenida esperando los mismos
+        mensajes de otro proceso (un hueco breve es normal: el mensaje va en camino)
+        """
+        atrasados = self.orden_total.atrasados() if self.orden_total.pendientes() else {}
+        ahora = time.monotonic()
+        for id_par in list(self.atraso_desde):
+            if id_par not in atrasados:
+                del self.atraso_desde[id_par]
+        for id_par, (recibidos, anunciados) in atrasados.items():
+            anterior = self.atraso_desde.get(id_par)
+            if anterior is None or anterior[0] != recibidos:
+                self.atraso_desde[id_par] = (recibidos, ahora, False)
+            elif not anterior[2] and ahora - anterior[1] > 2 * self.plazo:
+                self.atraso_desde[id_par] = (recibidos, anterior[1], True)
+                print(f"[ERROR] Orden total: {self.id_proceso} espera desde hace {ahora - anterior[1]:.1f} s "
+                      f"los mensajes #{recibidos + 1}-#{anunciados} de {id_par}; "
+                      f"{self.orden_total.pendientes()} mensajes retenidos hasta que lleguen")
+
+    def _programar_reparacion(self, id_par, intento):
+        """Reintenta en PLAZO_DIFUSION segundos los mensajes que el par no recibió"""
+        temporizador = threading.Timer(self.plazo, self._reparar_orden, args=(id_par, intento))
+        temporizador.daemon = True
+        temporizador.start()
+
+    def _reparar_orden(self, id_par, intento=0):
+        """Reenvía al par, en orden, las multidifusiones propias que le faltan"""
+        with self.lock_orden:
+            if id_par in self.reparando_orden:
+                return
+            self.reparando_orden.add(id_par)
+        host, puerto = self.procesos[id_par]
+        try:
+            cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.BroadcastServiceStub)
+            while True:
+                # Los que fallen mientras tanto se suman a faltantes_orden y salen en la siguiente vuelta
+                with self.lock_orden:
+                    faltantes = sorted(self.faltantes_orden[id_par])
+                if not faltantes:
+                    return
+                for secuencia in faltantes:
+                    with self.lock_orden:
+                        mensaje = self.historial_orden.get(secuencia)
+                    if mensaje is not None:
+                        respuesta = cliente.DeliverOrdered(mensaje, timeout=self.plazo)
+                        self.reloj.actualizar(respuesta.timestamp)
+                    else:
+                        print(f"[ERROR] Orden total: #{secuencia} de {self.id_proceso} ya no está en el historial; "
+                              f"{id_par} no podrá entregar más mensajes de este proceso")
+                    with self.lock_orden:
+                        self.faltantes_orden[id_par].discard(secuencia)
+        except grpc.RpcError as e:
+            self.pool.reportar_error(host, puerto, e)
+            if intento + 1 < REINTENTOS_ORDEN:
+                self._programar_reparacion(id_par, intento + 1)
+            else:
+                print(f"[ERROR] Orden total: {id_par} sigue sin recibir {faltantes} de {self.id_proceso} "
+                      f"tras {REINTENTOS_ORDEN} reintentos; se reenviarán cuando vuelva a confirmar: {e}")
+        finally:
+            with self.lock_orden:
+                self.reparando_orden.discard(id_par)
+
+    def _revisar_recibidos(self, id_par, recibidos):
+        """Confirmación del par: lo que ya recibió deja de faltar y lo demás se reenvía"""
+        with self.lock_orden:
+            faltantes = self.faltantes_orden[id_par]
+            faltantes.difference_update([secuencia for secuencia in faltantes if secuencia <= recibidos])
+            hay_faltantes = bool(faltantes)
+        if hay_faltantes:
+            self.hilos.submit(self._reparar_orden, id_par)
+
+    def _enviar_ack(self, id_par, host, puerto, ack):
+        try:
+            cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.BroadcastServiceStub)
+            respuesta = cliente.AckOrdered(ack, timeout=self.plazo)
+        except (grpc.RpcError, RuntimeError) as e:
+            self.pool.reportar_error(host, puerto, e)
+            print(f"[ERROR] Orden total: no se pudo confirmar a {id_par}: {e}")
+            return
+        self.reloj.actualizar(respuesta.timestamp)
+
+    def confirmar_ordenados(self):
+        """Manda a todos los pares una confirmación acumulativa: reloj actual y mensajes difundidos"""
+        with self.lock_orden:
+            tiempo = self.reloj.incrementar()
+            ack = services_pb2.OrderAck(sender_id=self.id_proceso, timestamp=tiempo, sent=self.enviados_orden,
+                                        received=self.orden_total.recibidos_de())
+        for id_par, (host, puerto) in self.pares(self.id_proceso).items():
+            Bitacora.registrar("SEND",
+                              f"{self.id_proceso} -> {id_par} ACK de orden total (enviados={ack.sent})",
+                              tiempo, par=id_par)
+            self.hilos.submit(self._enviar_ack, id_par, host, puerto, ack)
+
+    def _ciclo_acks(self):
+        """Hilo de confirmaciones: una por ventana, solo si llegó algo desde la anterior"""
+        while True:
+            self.ack_pendiente.wait()
+            time.sleep(self.ventana_ack)
+            self.ack_pendiente.clear()
+            self.confirmar_ordenados()
+
+    def programar_ack(self):
+        if self.ventana_ack <= 0:
+            self.confirmar_ordenados()
+            return
+        with self.lock_orden:
+            if self.hilo_acks is None:
+                self.hilo_acks = threading.Thread(target=self._ciclo_acks, daemon=True)
+                self.hilo_acks.start()
+        self.ack_pendiente.set()
+
+    def DeliverOrdered(self, peticion, contexto):
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        try:
+            nuevo = self.orden_total.agregar_mensaje(peticion.sender_id, peticion.timestamp,
+                                                     peticion.sequence, peticion.message)
+        except ValueError as e:
+            return services_pb2.MessageResponse(status=f"ERROR: {e}", timestamp=tiempo)
+        Bitacora.registrar("RECEIVE",
+                          f"{self.id_proceso} <- {peticion.sender_id} difusión ordenada ({peticion.timestamp}, {peticion.sender_id})#{peticion.sequence}{'' if nuevo else ' DUPLICADA'}",
+                          tiempo, par=peticion.sender_id)
+        if nuevo:
+            self.programar_ack()
+            self.entregar_ordenados()
+        return services_pb2.MessageResponse(status="ACK", timestamp=tiempo)
+
+    def AckOrdered(self, peticion, contexto):
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        try:
+            self.orden_total.agregar_ack(peticion.sender_id, peticion.timestamp, peticion.sent)
+        except ValueError as e:
+            return services_pb2.MessageResponse(status=f"ERROR: {e}", timestamp=tiempo)
+        Bitacora.registrar("RECEIVE",
+                          f"{self.id_proceso} <- {peticion.sender_id} ACK de orden total (enviados={peticion.sent})",
+                          tiempo, par=peticion.sender_id)
+        self._revisar_recibidos(peticion.sender_id, peticion.received.get(self.id_proceso, 0))
+        self.entregar_ordenados()
+        return services_pb2.MessageResponse(status="ACK", timestamp=tiempo)
+
+
+class ServicioDifusionAsync(ServicioDifusion):
+    """
+    Versión asíncrona (grpc.aio) del servicio de difusión. Los handlers solo
+    toman los locks de las colas y el reloj (los envíos y reenvíos van en los
+    hilos de la difusión), así que corren en el event loop; BroadcastMessage
+    espera el quórum con un future, sin ocupar un hilo.
+    """
+
+    async def BroadcastMessage(self, peticion, contexto):
+        entrega, respuesta = self.iniciar_difusion(peticion)
+        if entrega is None:
+            return respuesta
+        await entrega.esperar_async()
+        return self.responder_difusion(entrega)
+
+    async def DeliverCausal(self, peticion, contexto):
+        return super().DeliverCausal(peticion, contexto)
+
+    async def DeliverOrdered(self, peticion, contexto):
+        return super().DeliverOrdered(peticion, contexto)
+
+    async def AckOrdered(self, peticion, contexto):
+        return super().AckOrdered(peticion, contexto)
@@ -0,0 +1,36 @@
+"""
+FORMA DE LAS RESPUESTAS
+Por defecto los servicios de P2-P5 devuelven los datos de entrada junto con
+el resultado. Con el campo response_shape de la petición el cliente pide
+solo lo que va a usar:
+- FULL: datos de entrada y resultado (comportamiento original)
+- RESULT_ONLY: solo el resultado
+- SUMMARY: solo un ResultSummary (conteo, mínimo, máximo y media) y los
+  valores escalares del resultado (el promedio, los resultados de búsqueda)
+"""
+
+import numpy as np
+import services_pb2
+
+
+def incluir_entrada(peticion):
+    """True si la respuesta debe llevar los datos de entrada"""
+    return peticion.response_shape == services_pb2.FULL
+
+
+def incluir_resultado(peticion):
+    """True si la respuesta debe llevar el resultado completo"""
+    return peticion.response_shape != services_pb2.SUMMARY
+
+
+def resumir(valores):
+    """ResultSummary de una secuencia o arreglo de números"""
+    arreglo = np.asarray(valores, dtype=np.float64).ravel()
+    if arreglo.size == 0:
+        return services_pb2.ResultSummary()
+    return services_pb2.ResultSummary(
+        count=arreglo.size,
+        min=float(arreglo.min()),
+        max=float(arreglo.max()),
+        mean=float(arreglo.mean())
+    )
@@ -0,0 +1,95 @@
+"""
+MULTIPLICACIÓN DE MATRICES POR BLOQUES
+Divide el producto C = A * B en bloques C[i0:i1, j0:j1] = A[i0:i1, :] * B[:, j0:j1]
+y reparte los bloques entre los procesos de un ProcessPoolExecutor
+(dividir_cuadricula arma la cuadrícula con que P3 los reparte entre réplicas).
+
+A, B y C viven en memoria compartida (multiprocessing.shared_memory): los
+trabajadores se conectan por nombre y escriben su bloque directamente en C,
+así que los operandos no se copian ni se serializan por bloque.
+"""
+
+import multiprocessing
+from concurrent import futures
+from multiprocessing import shared_memory
+import numpy as np
+
+
+def crear_ejecutor(num_procesos=None):
+    """Pool de procesos para los bloques ("spawn": no hereda el estado de gRPC)"""
+    return futures.ProcessPoolExecutor(max_workers=num_procesos,
+                                       mp_context=multiprocessing.get_context("spawn"))
+
+
+def dividir(total, tamano_bloque):
+    """Rangos [inicio, fin) de tamaño tamano_bloque que cubren 0..total"""
+    return [(inicio, min(inicio + tamano_bloque, total)) for inicio in range(0, total, tamano_bloque)]
+
+
+def dividir_en_partes(total, partes):
+    """Rangos [inicio, fin) casi iguales que reparten 0..total en `partes` trozos"""
+    limites = np.linspace(0, total, partes + 1).astype(int)
+    return [(int(inicio), int(fin)) for inicio, fin in zip(limites[:-1], limites[1:]) if fin > inicio]
+
+
+def dividir_cuadricula(filas, columnas, partes):
+    """
+    (partes_filas, partes_columnas) con producto `partes` que reparte C en una
+    cuadrícula de bloques enviando lo menos posible: cada bloque necesita sus
+    filas de A y sus columnas de B, filas / partes_filas + columnas / partes_columnas
+    """
+    divisores = [d for d in range(1, partes + 1) if partes % d == 0]
+    partes_filas = min(divisores, key=lambda d: filas / d + columnas / (partes // d))
+    return partes_filas, partes // partes_filas
+
+
+def _abrir(nombre, forma):
+    # Los trabajadores comparten el resource_tracker del proceso padre, que es
+    # quien libera (unlink) la memoria al terminar el producto
+    memoria = shared_memory.SharedMemory(name=nombre)
+    return memoria, np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+
+
+def _multiplicar_bloque(nombres, formas, filas, columnas):
+    """Trabajador: C[filas, columnas] = A[filas, :] @ B[:, columnas] en memoria compartida"""
+    memorias = []
+    try:
+        (mem_a, a), (mem_b, b), (mem_c, c) = [_abrir(n, f) for n, f in zip(nombres, formas)]
+        memorias = [mem_a, mem_b, mem_c]
+        np.matmul(a[filas[0]:filas[1], :], b[:, columnas[0]:columnas[1]],
+                  out=c[filas[0]:filas[1], columnas[0]:columnas[1]])
+    finally:
+        # Soltar las vistas antes de cerrar la memoria compartida
+        a = b = c = None
+        for memoria in memorias:
+            memoria.close()
+
+
+def _compartir(arreglo):
+    memoria = shared_memory.SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+    copia = np.ndarray(arreglo.shape, dtype=np.float64, buffer=memoria.buf)
+    copia[...] = arreglo
+    return memoria, copia
+
+
+def multiplicar_por_bloques(matriz_a, matriz_b, ejecutor, tamano_bloque=1024):
+    """Calcula A @ B repartiendo los bloques de C entre los procesos del ejecutor"""
+    filas, columnas = matriz_a.shape[0], matriz_b.shape[1]
+    mem_a, _ = _compartir(matriz_a)
+    mem_b, _ = _compartir(matriz_b)
+    mem_c = shared_memory.SharedMemory(create=True, size=max(filas * columnas * 8, 1))
+    try:
+        nombres = (mem_a.name, mem_b.name, mem_c.name)
+        formas = (matriz_a.shape, matriz_b.shape, (filas, columnas))
+        tareas = [
+            ejecutor.submit(_multiplicar_bloque, nombres, formas, rango_filas, rango_columnas)
+            for rango_filas in dividir(filas, tamano_bloque)
+            for rango_columnas in dividir(columnas, tamano_bloque)
+        ]
+        for tarea in tareas:
+            tarea.result()
+        return np.ndarray((filas, columnas), dtype=np.float64, buffer=mem_c.buf).copy()
+    finally:
+        for memoria in (mem_a, mem_b, mem_c):
+            memoria.close()
+            memoria.unlink()
@@ -0,0 +1,220 @@
+"""
+MOTOR DE BÚSQUEDA
+Estrategias disponibles para SearchService. Todas devuelven, para cada
+objetivo, la posición de su primera aparición en la lista (-1 si no está):
+- lineal: recorre la lista una vez por objetivo; O(n·k). Es la búsqueda
+  original de P5 y para un solo objetivo se detiene al encontrarlo.
+- indice: arma en un solo recorrido un diccionario valor -> primera
+  posición y responde cada objetivo en O(1); O(n + k).
+- binaria: ordena los pares (valor, posición) y busca cada objetivo con
+  bisect; O(n log n + k log n). No usa hashing, así que sirve para valores
+  que solo se pueden comparar.
+- auto: lineal con un solo objetivo, si no indice.
+Para arreglos de NumPy (datos enviados por el cliente), buscar_numpy, con
+las mismas estrategias vectorizadas:
+- lineal: una pasada por objetivo, comparando por bloques con ==, que para
+  en la primera aparición.
+- indice: numpy.unique con return_index da cada valor distinto con su
+  primera posición, y los objetivos se buscan ahí con numpy.searchsorted.
+- binaria: ordena una copia (argsort estable) y usa numpy.searchsorted.
+- auto: una sola pasada por bloques para todos los objetivos (numpy.isin
+  con pocos, numpy.searchsorted entre los objetivos con muchos) que para en
+  cuanto aparecieron todos.
+El método informado lleva la estrategia, p. ej. "indice(numpy.unique)".
+buscar_objetivos_numpy acepta objetivos enteros y reales mezclados: cada
+grupo se busca con el tipo exacto de los datos, sin pasar los enteros a
+float64, y las posiciones vuelven en el orden de los objetivos.
+"""
+
+from bisect import bisect_left
+import numpy as np
+
+# buscar_numpy recorre el arreglo en bloques de este tamaño (32 MB de int64)
+TAMANO_BLOQUE_BUSQUEDA = 1 << 22
+
+# Hasta aquí numpy.isin compara el bloque con cada objetivo; con más, searchsorted
+MAXIMO_OBJETIVOS_ISIN = 8
+
+
+def busqueda_lineal(numeros, objetivos):
+    """Una pasada por objetivo hasta la primera aparición"""
+    posiciones = []
+    for objetivo in objetivos:
+        posicion = -1
+        for i, valor in enumerate(numeros):
+            if valor == objetivo:
+                posicion = i
+                break
+        posiciones.append(posicion)
+    return posiciones
+
+
+def construir_indice(numeros):
+    """Diccionario valor -> posición de su primera aparición, en un recorrido"""
+    indice = {}
+    for i, valor in enumerate(numeros):
+        indice.setdefault(valor, i)
+    return indice
+
+
+def busqueda_indice(numeros, objetivos):
+    indice = construir_indice(numeros)
+    return [indice.get(objetivo, -1) for objetivo in objetivos]
+
+
+def busqueda_binaria(numeros, objetivos):
+    """bisect sobre los valores ordenados; a igual valor queda primero la menor posición"""
+    pares = sorted((valor, i) for i, valor in enumerate(numeros))
+    valores = [valor for valor, _ in pares]
+    posiciones = []
+    for objetivo in objetivos:
+        k = bisect_left(valores, objetivo)
+        posiciones.append(pares[k][1] if k < len(valores) and valores[k] == objetivo else -1)
+    return posiciones
+
+
+def elegir_estrategia(numeros, objetivos):
+    """Estrategia que usa "auto" para esta búsqueda"""
+    return "lineal" if len(objetivos) <= 1 else "indice"
+
+
+ESTRATEGIAS = {
+    "lineal": busqueda_lineal,
+    "indice": busqueda_indice,
+    "binaria": busqueda_binaria,
+}
+
+
+def buscar(numeros, objetivos, estrategia="lineal"):
+    """
+    Devuelve (posiciones de la primera aparición de cada objetivo, estrategia
+    usada). Con "auto" la estrategia se elige según la cantidad de objetivos.
+    """
+    if estrategia == "auto":
+        estrategia = elegir_estrategia(numeros, objetivos)
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia de búsqueda desconocida: {estrategia}")
+    return ESTRATEGIAS[estrategia](numeros, objetivos), estrategia
+
+
+def _primeras_lineal(arreglo, objetivos, tamano_bloque):
+    """Una pasada por objetivo hasta su primera aparición, por bloques"""
+    primeras = np.full(len(objetivos), -1, dtype=np.int64)
+    for k, objetivo in enumerate(objetivos):
+        for inicio in range(0, len(arreglo), tamano_bloque):
+            indices = np.flatnonzero(arreglo[inicio:inicio + tamano_bloque] == objetivo)
+            if len(indices):
+                primeras[k] = inicio + indices[0]
+                break
+    return primeras
+
+
+def _primeras_indice(arreglo, objetivos):
+    """Índice valor -> primera posición con numpy.unique, consultado con searchsorted"""
+    valores, primeras = np.unique(arreglo, return_index=True)
+    k = np.searchsorted(valores, objetivos)
+    acotado = np.minimum(k, len(valores) - 1)
+    encontrado = (k < len(valores)) & (valores[acotado] == objetivos)
+    return np.where(encontrado, primeras[acotado], -1).astype(np.int64)
+
+
+def _primeras_isin(arreglo, objetivos, tamano_bloque):
+    """Primera posición de cada objetivo recorriendo el arreglo por bloques"""
+    unicos, inversa = np.unique(objetivos, return_inverse=True)
+    primeras = np.full(len(unicos), -1, dtype=np.int64)
+    pendientes = len(unicos)
+    for inicio in range(0, len(arreglo), tamano_bloque):
+        bloque = arreglo[inicio:inicio + tamano_bloque]
+        if len(unicos) <= MAXIMO_OBJETIVOS_ISIN:
+            indices = np.flatnonzero(np.isin(bloque, unicos))
+            cuales = np.searchsorted(unicos, bloque[indices])
+        else:
+            # Con muchos objetivos, una búsqueda binaria por valor entre los
+            # objetivos ordenados le gana al isin por ordenamiento
+            cuales = np.minimum(np.searchsorted(unicos, bloque), len(unicos) - 1)
+            indices = np.flatnonzero(unicos[cuales] == bloque)
+            cuales = cuales[indices]
+        if not len(indices):
+            continue
+        # return_index da la primera aparición de cada objetivo dentro del bloque
+        cuales, primeros = np.unique(cuales, return_index=True)
+        nuevas = primeras[cuales] == -1
+        primeras[cuales[nuevas]] = inicio + indices[primeros[nuevas]]
+        pendientes -= int(nuevas.sum())
+        if not pendientes:
+            break
+    return primeras[inversa]
+
+
+def _primeras_ordenado(arreglo, objetivos):
+    """Primera posición de cada objetivo con searchsorted sobre una copia ordenada"""
+    # Con argsort estable, entre valores iguales queda primero la menor posición
+    orden = np.argsort(arreglo, kind='stable')
+    ordenado = arreglo[orden]
+    k = np.searchsorted(ordenado, objetivos)
+    acotado = np.minimum(k, len(ordenado) - 1)
+    encontrado = (k < len(ordenado)) & (ordenado[acotado] == objetivos)
+    return np.where(encontrado, orden[acotado], -1).astype(np.int64)
+
+
+def buscar_numpy(arreglo, objetivos, estrategia="lineal", tamano_bloque=TAMANO_BLOQUE_BUSQUEDA):
+    """
+    Versión vectorizada de buscar para un arreglo de NumPy: devuelve (arreglo
+    int64 de posiciones, método usado).
+    """
+    if estrategia not in ESTRATEGIAS and estrategia != "auto":
+        raise ValueError(f"Estrategia de búsqueda desconocida: {estrategia}")
+    objetivos = np.asarray(objetivos)
+    if not len(arreglo) or not len(objetivos):
+        return np.full(len(objetivos), -1, dtype=np.int64), f"{estrategia}(numpy)"
+    if estrategia == "lineal":
+        return _primeras_lineal(arreglo, objetivos, tamano_bloque), "lineal(numpy ==)"
+    if estrategia == "indice":
+        return _primeras_indice(arreglo, objetivos), "indice(numpy.unique)"
+    if estrategia == "binaria":
+        return _primeras_ordenado(arreglo, objetivos), "binaria(numpy.argsort+searchsorted)"
+    metodo = "numpy.isin" if len(np.unique(objetivos)) <= MAXIMO_OBJETIVOS_ISIN else "numpy.searchsorted"
+    return _primeras_isin(arreglo, objetivos, tamano_bloque), f"auto({metodo})"
+
+
+def _objetivos_exactos(objetivos, tipo):
+    """
+    (posiciones dentro de objetivos, arreglo de tipo) de los objetivos que
+    pueden ser iguales a algún valor de tipo; los demás no se buscan.
+    """
+    posiciones, valores = [], []
+    for i, objetivo in enumerate(objetivos):
+        if np.issubdtype(tipo, np.integer):
+            # Un real solo puede estar entre enteros si es entero y cabe en el tipo
+            if isinstance(objetivo, float) and not objetivo.is_integer():
+                continue
+            objetivo = int(objetivo)
+            if not np.iinfo(tipo).min <= objetivo <= np.iinfo(tipo).max:
+                continue
+        elif isinstance(objetivo, int) and float(objetivo) != objetivo:
+            # Entero que float64 no representa (más allá de 2**53): ningún real es igual
+            continue
+        posiciones.append(i)
+        valores.append(objetivo)
+    return posiciones, np.array(valores, dtype=tipo)
+
+
+def buscar_objetivos_numpy(arreglo, objetivos, estrategia="lineal", tamano_bloque=TAMANO_BLOQUE_BUSQUEDA):
+    """
+    buscar_numpy para una lista de objetivos int y float de Python: los enteros
+    y los reales se buscan por separado, cada grupo convertido exactamente al
+    dtype del arreglo. Devuelve (arreglo int64 de posiciones en el orden de
+    objetivos, método usado).
+    """
+    posiciones = np.full(len(objetivos), -1, dtype=np.int64)
+    metodos = []
+    for clase in (int, float):
+        grupo = [i for i, objetivo in enumerate(objetivos) if isinstance(objetivo, clase)]
+        if not grupo:
+            continue
+        buscables, valores = _objetivos_exactos([objetivos[i] for i in grupo], arreglo.dtype)
+        encontradas, metodo = buscar_numpy(arreglo, valores, estrategia, tamano_bloque)
+        posiciones[np.array(grupo, dtype=np.int64)[buscables]] = encontradas
+        if metodo not in metodos:
+            metodos.append(metodo)
+    return posiciones, "+".join(metodos) or f"{estrategia}(numpy)"
@@ -0,0 +1,268 @@
+"""
+MOTOR DE ORDENAMIENTO
+Algoritmos disponibles para SortService:
+- introsort: quicksort iterativo in-place (pivote por mediana de tres,
+  partición de Hoare) que pasa a heapsort si la profundidad supera
+  2*log2(n) y deja los tramos pequeños a un solo pase final de inserción.
+  Usa memoria O(log n) (la pila de tramos) y nunca recursión.
+- quicksort_listas: la implementación original con tres listas por nivel,
+  recursiva; se conserva como referencia para el benchmark.
+- integrado: sorted() de Python (Timsort, en C).
+- conteo: counting sort para enteros; O(n + rango de claves).
+- radix: radix sort LSD para enteros, por dígitos de BITS_RADIX bits.
+- auto: conteo si las claves son enteras y de rango pequeño respecto a n,
+  si no integrado (ver elegir_algoritmo y benchmark_ordenamiento.py). QuickSort
+  lo usa solo si la petición pide AUTO; sin algoritmo pedido usa introsort.
+  radix nunca gana a sorted() en Python puro, así que "auto" no lo elige.
+Para arreglos de NumPy, counting_sort_numpy (bincount) y usar_conteo_numpy.
+"""
+
+from collections import Counter
+from itertools import repeat
+import numpy as np
+
+# Tramos de este tamaño o menos se dejan para el pase final de inserción
+UMBRAL_INSERCION = 16
+
+BITS_RADIX = 8
+
+# "auto" usa counting sort desde MINIMO_CONTEO valores si el rango de claves
+# es a lo más n / PROPORCION_CONTEO (cruces medidos con benchmark_ordenamiento.py).
+# Con las claves de QuickSort (0 a 100) el cruce con sorted() está entre 2000 y
+# 4096 valores: con 100 valores conteo tarda ~34 us y sorted() ~3 us (introsort
+# ~38 us), con 2000 ~196 us contra ~172 us y con 4096 ~316 us contra ~408 us.
+# Por debajo del mínimo "auto" usa sorted(), que también es lo más rápido ahí
+MINIMO_CONTEO = 4096
+PROPORCION_CONTEO = 64
+
+# Con NumPy, bincount le gana a numpy.sort desde MINIMO_CONTEO_NUMPY valores si
+# el rango está entre n / 1000 y n / 10; con menos claves numpy.sort ya es muy rápido
+MINIMO_CONTEO_NUMPY = 100_000
+
+# Rango de claves máximo para counting_sort_numpy (el arreglo de conteos ocupa 8 bytes por clave)
+RANGO_MAXIMO_CONTEO = 1 << 26
+
+
+def _insercion(arreglo, inicio, fin):
+    """Inserción directa sobre arreglo[inicio..fin] (ambos incluidos)"""
+    for i in range(inicio + 1, fin + 1):
+        valor = arreglo[i]
+        j = i - 1
+        while j >= inicio and arreglo[j] > valor:
+            arreglo[j + 1] = arreglo[j]
+            j -= 1
+        arreglo[j + 1] = valor
+
+
+def _heapsort(arreglo, inicio, fin):
+    """Heapsort sobre arreglo[inicio..fin]: O(n log n) en el peor caso"""
+    n = fin - inicio + 1
+
+    def hundir(raiz, limite):
+        valor = arreglo[inicio + raiz]
+        while True:
+            hijo = 2 * raiz + 1
+            if hijo >= limite:
+                break
+            if hijo + 1 < limite and arreglo[inicio + hijo + 1] > arreglo[inicio + hijo]:
+                hijo += 1
+            if arreglo[inicio + hijo] <= valor:
+                break
+            arreglo[inicio + raiz] = arreglo[inicio + hijo]
+            raiz = hijo
+        arreglo[inicio + raiz] = valor
+
+    for raiz in range(n // 2 - 1, -1, -1):
+        hundir(raiz, n)
+    for limite in range(n - 1, 0, -1):
+        arreglo[inicio], arreglo[inicio + limite] = arreglo[inicio + limite], arreglo[inicio]
+        hundir(0, limite)
+
+
+def _particionar(arreglo, inicio, fin):
+    """
+    Partición de Hoare con pivote por mediana de tres. Devuelve j tal que
+    arreglo[inicio..j] <= pivote <= arreglo[j+1..fin], con ambos lados no vacíos.
+    """
+    medio = (inicio + fin) // 2
+    if arreglo[medio] < arreglo[inicio]:
+        arreglo[medio], arreglo[inicio] = arreglo[inicio], arreglo[medio]
+    if arreglo[fin] < arreglo[inicio]:
+        arreglo[fin], arreglo[inicio] = arreglo[inicio], arreglo[fin]
+    if arreglo[fin] < arreglo[medio]:
+        arreglo[fin], arreglo[medio] = arreglo[medio], arreglo[fin]
+    pivote = arreglo[medio]
+
+    i, j = inicio - 1, fin + 1
+    while True:
+        i += 1
+        while arreglo[i] < pivote:
+            i += 1
+        j -= 1
+        while arreglo[j] > pivote:
+            j -= 1
+        if i >= j:
+            return j
+        arreglo[i], arreglo[j] = arreglo[j], arreglo[i]
+
+
+def introsort(arreglo):
+    """Ordena la lista in-place y la devuelve"""
+    if len(arreglo) < 2:
+        return arreglo
+
+    pila = [(0, len(arreglo) - 1, 2 * len(arreglo).bit_length())]
+    while pila:
+        inicio, fin, profundidad = pila.pop()
+        while fin - inicio + 1 > UMBRAL_INSERCION:
+            if profundidad == 0:
+                _heapsort(arreglo, inicio, fin)
+                break
+            profundidad -= 1
+            corte = _particionar(arreglo, inicio, fin)
+            # Se apila el lado mayor y se sigue con el menor: la pila queda en O(log n)
+            if corte - inicio < fin - corte:
+                pila.append((corte + 1, fin, profundidad))
+                fin = corte
+            else:
+                pila.append((inicio, corte, profundidad))
+                inicio = corte + 1
+
+    # Cada elemento está a menos de UMBRAL_INSERCION posiciones de su lugar
+    _insercion(arreglo, 0, len(arreglo) - 1)
+    return arreglo
+
+
+def quicksort_listas(arreglo):
+    """Quick Sort original: crea tres listas por nivel y recursa sin límite"""
+    if len(arreglo) <= 1:
+        return arreglo
+
+    pivote = arreglo[len(arreglo) // 2]
+    menores = [x for x in arreglo if x < pivote]
+    iguales = [x for x in arreglo if x == pivote]
+    mayores = [x for x in arreglo if x > pivote]
+
+    return quicksort_listas(menores) + iguales + quicksort_listas(mayores)
+
+
+def _validar_enteros(arreglo):
+    if not all(type(valor) is int for valor in arreglo):
+        raise ValueError("counting sort y radix sort solo ordenan enteros")
+
+
+def counting_sort(arreglo):
+    """Counting sort de enteros: cuenta cada clave (Counter, en C) y las reescribe en orden"""
+    _validar_enteros(arreglo)
+    if len(arreglo) < 2:
+        return arreglo
+
+    conteos = Counter(arreglo)
+    minimo, maximo = min(conteos), max(conteos)
+    resultado = []
+    if maximo - minimo + 1 <= 4 * len(conteos):
+        # Claves densas: recorrer el rango es más barato que ordenar las claves
+        for clave in range(minimo, maximo + 1):
+            conteo = conteos.get(clave)
+            if conteo:
+                resultado.extend(repeat(clave, conteo))
+    else:
+        for clave in sorted(conteos):
+            resultado.extend(repeat(clave, conteos[clave]))
+    arreglo[:] = resultado
+    return arreglo
+
+
+def radix_sort(arreglo):
+    """Radix sort LSD de enteros en cubetas de BITS_RADIX bits (negativos con desplazamiento)"""
+    _validar_enteros(arreglo)
+    if len(arreglo) < 2:
+        return arreglo
+
+    minimo = min(arreglo)
+    claves = [valor - minimo for valor in arreglo]
+    maximo = max(claves)
+    mascara = (1 << BITS_RADIX) - 1
+    desplazamiento = 0
+    while maximo >> desplazamiento:
+        cubetas = [[] for _ in range(1 << BITS_RADIX)]
+        for clave in claves:
+            cubetas[(clave >> desplazamiento) & mascara].append(clave)
+        claves = [clave for cubeta in cubetas for clave in cubeta]
+        desplazamiento += BITS_RADIX
+    arreglo[:] = [clave + minimo for clave in claves]
+    return arreglo
+
+
+def elegir_algoritmo(numeros):
+    """Algoritmo que usa "auto" para estos números"""
+    if len(numeros) < MINIMO_CONTEO or not all(type(valor) is int for valor in numeros):
+        return "integrado"
+    if max(numeros) - min(numeros) + 1 <= len(numeros) // PROPORCION_CONTEO:
+        return "conteo"
+    return "integrado"
+
+
+def usar_conteo_numpy(arreglo):
+    """True si counting_sort_numpy conviene más que numpy.sort para este arreglo"""
+    if len(arreglo) < MINIMO_CONTEO_NUMPY or not np.issubdtype(arreglo.dtype, np.integer):
+        return False
+    rango = int(arreglo.max()) - int(arreglo.min()) + 1
+    return len(arreglo) // 1000 <= rango <= len(arreglo) // 10
+
+
+def counting_sort_numpy(arreglo):
+    """Counting sort de un arreglo entero de NumPy (bincount + repeat); devuelve uno nuevo"""
+    if not np.issubdtype(arreglo.dtype, np.integer):
+        raise ValueError("counting sort solo ordena enteros")
+    if not len(arreglo):
+        return arreglo.copy()
+    minimo, maximo = arreglo.min(), arreglo.max()
+    if int(maximo) - int(minimo) >= RANGO_MAXIMO_CONTEO:
+        raise ValueError(f"el rango de claves supera {RANGO_MAXIMO_CONTEO} para counting sort")
+    conteos = np.bincount(arreglo - minimo, minlength=int(maximo - minimo) + 1)
+    return np.arange(minimo, maximo + 1, dtype=arreglo.dtype).repeat(conteos)
+
+
+def elegir_separadores(arreglo, partes, sobremuestreo=64, rng=None):
+    """
+    Sample sort: toma partes * sobremuestreo valores al azar, los ordena y
+    devuelve los partes - 1 cuantiles que reparten el arreglo en rangos
+    de tamaño parecido.
+    """
+    if partes <= 1 or not len(arreglo):
+        return arreglo[:0]
+    rng = rng or np.random.default_rng()
+    muestra = np.sort(rng.choice(arreglo, size=min(len(arreglo), partes * sobremuestreo)))
+    posiciones = (np.arange(1, partes) * len(muestra)) // partes
+    return muestra[posiciones]
+
+
+def particionar(arreglo, separadores):
+    """Lista de len(separadores) + 1 arreglos: los valores de cada rango, sin ordenar"""
+    cubetas = np.searchsorted(separadores, arreglo, side='right')
+    limites = np.concatenate(([0], np.cumsum(np.bincount(cubetas, minlength=len(separadores) + 1))))
+    # argsort estable de claves pequeñas: radix sort de NumPy, O(n)
+    agrupados = arreglo[np.argsort(cubetas.astype(np.uint16), kind='stable')]
+    return [agrupados[inicio:fin] for inicio, fin in zip(limites[:-1], limites[1:])]
+
+
+ALGORITMOS = {
+    "introsort": introsort,
+    "quicksort_listas": quicksort_listas,
+    "integrado": sorted,
+    "conteo": counting_sort,
+    "radix": radix_sort,
+}
+
+
+def ordenar(numeros, algoritmo="introsort"):
+    """
+    Devuelve (lista nueva con los números ordenados, algoritmo usado); la
+    entrada no se modifica. Con "auto" el algoritmo se elige según los datos.
+    """
+    if algoritmo == "auto":
+        algoritmo = elegir_algoritmo(numeros)
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo de ordenamiento desconocido: {algoritmo}")
+    return ALGORITMOS[algoritmo](list(numeros)), algoritmo
@@ -0,0 +1,95 @@
+"""
+MULTIDIFUSIÓN CON ORDEN TOTAL
+Algoritmo de Lamport: cada mensaje lleva la clave (reloj de Lamport del
+envío, id del emisor), única y totalmente ordenada. Todos los procesos lo
+guardan en un heap por esa clave y entregan la cabeza cuando ya no puede
+llegar ningún mensaje con clave menor, es decir, cuando de cada otro
+proceso q se sabe que:
+- ya se recibieron todos los mensajes que q difundió hasta ahora, y
+- q ya tenía el reloj >= al de la cabeza (sus mensajes futuros llevarán
+  un reloj mayor).
+Ambas cosas llegan en los propios mensajes de q y en sus confirmaciones
+(OrderAck). Una confirmación es acumulativa: lleva el reloj de q y cuántos
+mensajes lleva difundidos, así que los procesos las mandan por lotes (una
+por ventana) en vez de una por mensaje. No hace falta que los canales sean
+FIFO: la secuencia de cada emisor permite saber si falta alguno.
+Si falta alguno, la cabeza no se entrega hasta que llegue: las
+confirmaciones llevan también el prefijo recibido de cada emisor
+(recibidos_de) para que el emisor reenvíe lo que falta, y atrasados()
+dice de quién se está esperando.
+"""
+
+import heapq
+import threading
+
+
+class ColaOrdenTotal:
+    """Cola de prioridad (reloj, id) de un proceso y lo que sabe de los demás"""
+
+    def __init__(self, procesos, id_proceso):
+        self.id_proceso = id_proceso
+        self.otros = [id_p for id_p in procesos if id_p != id_proceso]
+        self.heap = []
+        self.recibidos = {id_p: 0 for id_p in self.otros}      # prefijo contiguo de secuencias recibidas
+        self.fuera_de_orden = {id_p: set() for id_p in self.otros}
+        self.anunciados = {id_p: 0 for id_p in self.otros}     # mensajes que q dice haber difundido
+        self.reloj_visto = {id_p: 0 for id_p in self.otros}    # mayor reloj de q conocido
+        self.lock = threading.Lock()
+
+    def _conocer(self, remitente, reloj, enviados):
+        self.reloj_visto[remitente] = max(self.reloj_visto[remitente], reloj)
+        self.anunciados[remitente] = max(self.anunciados[remitente], enviados)
+
+    def agregar_propio(self, reloj, secuencia, contenido):
+        """Mensaje difundido por este proceso"""
+        with self.lock:
+            heapq.heappush(self.heap, (reloj, self.id_proceso, secuencia, contenido))
+
+    def agregar_mensaje(self, remitente, reloj, secuencia, contenido):
+        """Mensaje de otro proceso; False si es un duplicado. ValueError si el remitente no existe"""
+        if remitente not in self.recibidos:
+            raise ValueError(f"proceso desconocido: {remitente}")
+        with self.lock:
+            if secuencia <= self.recibidos[remitente] or secuencia in self.fuera_de_orden[remitente]:
+                return False
+            self.fuera_de_orden[remitente].add(secuencia)
+            while self.recibidos[remitente] + 1 in self.fuera_de_orden[remitente]:
+                self.recibidos[remitente] += 1
+                self.fuera_de_orden[remitente].remove(self.recibidos[remitente])
+            self._conocer(remitente, reloj, secuencia)
+            heapq.heappush(self.heap, (reloj, remitente, secuencia, contenido))
+            return True
+
+    def agregar_ack(self, remitente, reloj, enviados):
+        """Confirmación acumulativa de otro proceso"""
+        if remitente not in self.recibidos:
+            raise ValueError(f"proceso desconocido: {remitente}")
+        with self.lock:
+            self._conocer(remitente, reloj, enviados)
+
+    def entregables(self):
+        """Saca del heap, en orden total, los mensajes que ya pueden entregarse"""
+        entregados = []
+        with self.lock:
+            while self.heap:
+                reloj = self.heap[0][0]
+                if not all(self.recibidos[q] >= self.anunciados[q] and self.reloj_visto[q] >= reloj
+                           for q in self.otros):
+                    break
+                entregados.append(heapq.heappop(self.heap))
+        return entregados
+
+    def recibidos_de(self):
+        """Copia de id -> prefijo contiguo de secuencias recibidas de ese proceso"""
+        with self.lock:
+            return dict(self.recibidos)
+
+    def atrasados(self):
+        """id -> (recibidos, anunciados) de los procesos de los que faltan mensajes ya anunciados"""
+        with self.lock:
+            return {q: (self.recibidos[q], self.anunciados[q]) for q in self.otros
+                    if self.recibidos[q] < self.anunciados[q]}
+
+    def pendientes(self):
+        with self.lock:
+            return len(self.heap)
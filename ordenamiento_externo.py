@@ -0,0 +1,142 @@
+"""
+ORDENAMIENTO EXTERNO
+Ordena más datos de los que caben en memoria:
+1. Los valores recibidos se escriben tal cual en archivos temporales ("runs")
+   de a lo más elementos_por_run valores.
+2. Cada run completo se ordena en un proceso del pool: el trabajador lo abre
+   con numpy.memmap y lo ordena in-place, sin copiarlo.
+3. Los runs ordenados se fusionan por bloques (fusionar_runs): un heap con el
+   último valor del bloque cargado de cada run da el límite hasta el que
+   todos los bloques pueden emitirse ya ordenados.
+
+Memoria: mientras se ordenan, cada proceso tiene un run en memoria, así que
+elementos_por_run = memoria_maxima / (tamaño del valor * procesos). En la
+fusión se cargan k bloques que en total ocupan memoria_maxima / 2.
+Disco: la suma de los runs, limitada por disco_maximo.
+"""
+
+import heapq
+import multiprocessing
+import os
+import shutil
+import tempfile
+import weakref
+from concurrent import futures
+import numpy as np
+
+
+def crear_ejecutor(num_procesos=None):
+    """Pool de procesos para ordenar runs ("spawn": no hereda el estado de gRPC)"""
+    return futures.ProcessPoolExecutor(max_workers=num_procesos,
+                                       mp_context=multiprocessing.get_context("spawn"))
+
+
+def _ordenar_run(ruta, dtype, kind):
+    """Trabajador: ordena in-place el run mapeado en memoria"""
+    run = np.memmap(ruta, dtype=dtype, mode='r+')
+    run.sort(kind=kind)
+    run.flush()
+    del run
+
+
+def fusionar_runs(rutas, dtype, elementos_por_bloque):
+    """Genera arreglos ordenados cuya concatenación es la fusión de los runs"""
+    runs = [np.memmap(ruta, dtype=dtype, mode='r') for ruta in rutas]
+    posiciones = [0] * len(runs)
+    bloques = [None] * len(runs)
+    heap = []
+
+    def cargar(indice):
+        inicio = posiciones[indice]
+        fin = min(inicio + elementos_por_bloque, len(runs[indice]))
+        if inicio >= fin:
+            bloques[indice] = None
+            return
+        bloques[indice] = np.array(runs[indice][inicio:fin])
+        posiciones[indice] = fin
+        heapq.heappush(heap, (bloques[indice][-1], indice))
+
+    for indice in range(len(runs)):
+        cargar(indice)
+
+    while heap:
+        # Lo que falta por leer de cada run es >= el último valor de su bloque,
+        # así que todo lo que sea <= al menor de esos valores ya puede salir
+        limite, indice = heapq.heappop(heap)
+        partes = []
+        for otro, bloque in enumerate(bloques):
+            if bloque is None or not len(bloque):
+                continue
+            corte = int(np.searchsorted(bloque, limite, side='right'))
+            if corte:
+                partes.append(bloque[:corte])
+                bloques[otro] = bloque[corte:]
+        if partes:
+            salida = np.concatenate(partes)
+            # Son tramos ya ordenados: el sort estable los fusiona
+            salida.sort(kind='stable')
+            yield salida
+        cargar(indice)
+
+
+class OrdenamientoExterno:
+    """Runs en disco de un flujo de valores de un solo dtype"""
+    def __init__(self, dtype, ejecutor, memoria_maxima, disco_maximo, procesos,
+                 directorio=None, kind="quicksort"):
+        self.dtype = np.dtype(dtype)
+        self.ejecutor = ejecutor
+        self.memoria_maxima = memoria_maxima
+        self.disco_maximo = disco_maximo
+        self.kind = kind
+        self.elementos_por_run = max(1, memoria_maxima // (self.dtype.itemsize * max(1, procesos)))
+        self.directorio = tempfile.mkdtemp(prefix="orden_", dir=directorio)
+        # Los runs se borran aunque el flujo se abandone sin llamar a limpiar()
+        self.finalizador = weakref.finalize(self, shutil.rmtree, self.directorio, ignore_errors=True)
+        self.rutas = []
+        self.tareas = []
+        self.archivo = None
+        self.en_run = 0
+        self.cantidad = 0
+
+    def _cerrar_run(self):
+        if self.archivo is None:
+            return
+        self.archivo.close()
+        self.archivo = None
+        self.tareas.append(self.ejecutor.submit(_ordenar_run, self.rutas[-1], self.dtype.str, self.kind))
+
+    def agregar(self, bloque):
+        """Escribe el bloque en los runs; ValueError si se supera disco_maximo"""
+        bloque = np.asarray(bloque, dtype=self.dtype)
+        if (self.cantidad + len(bloque)) * self.dtype.itemsize > self.disco_maximo:
+            raise ValueError(f"el ordenamiento externo supera los {self.disco_maximo} bytes de disco")
+        while len(bloque):
+            if self.archivo is None:
+                self.rutas.append(os.path.join(self.directorio, f"run_{len(self.rutas):05d}.bin"))
+                self.archivo = open(self.rutas[-1], 'wb')
+                self.en_run = 0
+            parte = bloque[:self.elementos_por_run - self.en_run]
+            parte.tofile(self.archivo)
+            self.en_run += len(parte)
+            self.cantidad += len(parte)
+            bloque = bloque[len(parte):]
+            if self.en_run == self.elementos_por_run:
+                self._cerrar_run()
+
+    def ordenar(self):
+        """Espera a que todos los runs estén ordenados y genera la fusión por bloques"""
+        self._cerrar_run()
+        for tarea in self.tareas:
+            tarea.result()
+        elementos_por_bloque = max(1024, self.memoria_maxima // (2 * self.dtype.itemsize * max(1, len(self.rutas))))
+        return fusionar_runs(self.rutas, self.dtype, elementos_por_bloque)
+
+    def limpiar(self):
+        """Borra los runs temporales"""
+        if self.archivo is not None:
+            self.archivo.close()
+            self.archivo = None
+        for tarea in self.tareas:
+            tarea.cancel()
+        futures.wait(self.tareas)
+        self.finalizador()
@@ -0,0 +1,103 @@
+"""
+POOL DE CANALES gRPC COMPARTIDO
+Mantiene un canal reutilizable por destino (host:puerto) para que los
+procesos no abran una conexión TCP+HTTP/2 nueva en cada mensaje.
+- Keepalive para detectar conexiones muertas entre mensajes
+- Reconexión cuando el canal queda en TRANSIENT_FAILURE o una llamada
+  falla con UNAVAILABLE: la siguiente llamada abre un canal nuevo en vez de
+  esperar el backoff de reconexión del canal caído
+- Cierre explícito de todos los canales al detener el proceso
+"""
+
+import grpc
+import threading
+
+# Opciones de keepalive para los canales cliente
+OPCIONES_CANAL = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+]
+
+# Opciones del servidor para aceptar los pings de keepalive de los clientes
+OPCIONES_SERVIDOR = [
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 10000),
+    ('grpc.http2.max_ping_strikes', 0),
+]
+
+# Límite de tamaño de mensaje para los servicios que devuelven arreglos grandes
+# (matrices de P3, muestras de P2); el límite por defecto de gRPC es 4 MB
+TAMANO_MAXIMO_MENSAJE = 512 * 1024 * 1024
+OPCIONES_TAMANO_MENSAJE = [
+    ('grpc.max_receive_message_length', TAMANO_MAXIMO_MENSAJE),
+    ('grpc.max_send_message_length', TAMANO_MAXIMO_MENSAJE),
+]
+
+
+class PoolCanales:
+    """Pool de canales gRPC, uno por destino, con thread-safety"""
+    def __init__(self, opciones=None):
+        self.opciones = OPCIONES_CANAL if opciones is None else opciones
+        self.canales = {}
+        self.estados = {}
+        self.lock = threading.Lock()
+        self.cerrado = False
+
+    def _crear_canal(self, destino):
+        canal = grpc.insecure_channel(destino, options=self.opciones)
+
+        def observar_estado(estado):
+            # Llega desde un hilo de gRPC. Se ignoran los avisos tardíos de un canal ya reemplazado
+            with self.lock:
+                if self.canales.get(destino, (None,))[0] is canal:
+                    self.estados[destino] = estado
+
+        self.canales[destino] = (canal, observar_estado)
+        self.estados[destino] = grpc.ChannelConnectivity.IDLE
+        canal.subscribe(observar_estado)
+        return canal
+
+    def _descartar_canal(self, destino):
+        canal, observador = self.canales.pop(destino)
+        self.estados.pop(destino, None)
+        canal.unsubscribe(observador)
+        canal.close()
+
+    def obtener_canal(self, host, puerto):
+        """Devuelve el canal del destino, creándolo o reconectándolo si es necesario"""
+        destino = f'{host}:{puerto}'
+        with self.lock:
+            if self.cerrado:
+                raise RuntimeError("El pool de canales ya fue cerrado")
+
+            if destino in self.canales:
+                if self.estados.get(destino) != grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+                    return self.canales[destino][0]
+                self._descartar_canal(destino)
+
+            return self._crear_canal(destino)
+
+    def obtener_stub(self, host, puerto, clase_stub):
+        """Crea un stub sobre el canal compartido del destino"""
+        return clase_stub(self.obtener_canal(host, puerto))
+
+    def invalidar(self, host, puerto):
+        """Descarta el canal del destino para que la próxima llamada reconecte"""
+        destino = f'{host}:{puerto}'
+        with self.lock:
+            if destino in self.canales:
+                self._descartar_canal(destino)
+
+    def reportar_error(self, host, puerto, error):
+        """Invalida el canal si el error indica que la conexión está caída"""
+        if isinstance(error, grpc.RpcError) and error.code() == grpc.StatusCode.UNAVAILABLE:
+            self.invalidar(host, puerto)
+
+    def cerrar(self):
+        """Cierra todos los canales del pool"""
+        with self.lock:
+            self.cerrado = True
+            for destino in list(self.canales):
+                self._descartar_canal(destino)
@@ -4,173 +4,281 @@ Este proceso:
 1. Evento interno: Operaciones matemáticas
 2. Envía mensaje a P3
 3. Evento interno: generar número aleatorio
+Además atiende lotes de operaciones (BatchCompute) vectorizados con NumPy
+y flujos continuos de operaciones (StreamCompute).
 """
 
 import grpc
-from concurrent import futures
 import time
 import random
+import operator
+import queue
+import numpy as np
 import services_pb2
 import services_pb2_grpc
 import threading
-
-class RelojLamport:
-    """Reloj de Lamport con thread-safety"""
-    def __init__(self):
-        self.tiempo = 0
-        self.lock = threading.Lock()
-    
-    def incrementar(self):
-        with self.lock:
-            self.tiempo += 1
-            return self.tiempo
-    
-    def actualizar(self, tiempo_recibido):
-        with self.lock:
-            self.tiempo = max(self.tiempo, tiempo_recibido) + 1
-            return self.tiempo
-    
-    def obtener_tiempo(self):
-        with self.lock:
-            return self.tiempo
-
-
-class Bitacora:
-    """Sistema de registro de eventos"""
-    @staticmethod
-    def registrar(tipo_evento, detalles, valor_reloj):
-        marca_temporal = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{marca_temporal}] [{tipo_evento}] {detalles} clock={valor_reloj}")
+from bitacora import Bitacora
+from servidor_proceso import ejecutar_proceso, en_ejecutor, enviar_mensaje_a_proceso
 
 
 class ServicioMatematicas(services_pb2_grpc.MathServiceServicer):
     """Implementación del servicio de matemáticas"""
     
+    # Operación del lote -> (nombre, función vectorizada)
+    OPERACIONES_LOTE = {
+        services_pb2.ADD: ("SUMA", np.add),
+        services_pb2.SUBTRACT: ("RESTA", np.subtract),
+        services_pb2.MULTIPLY: ("MULTIPLICACIÓN", np.multiply),
+        services_pb2.DIVIDE: ("DIVISIÓN", np.divide),
+    }
+    
+    # Operación del flujo -> función escalar
+    OPERACIONES_ESCALARES = {
+        services_pb2.ADD: operator.add,
+        services_pb2.SUBTRACT: operator.sub,
+        services_pb2.MULTIPLY: operator.mul,
+        services_pb2.DIVIDE: operator.truediv,
+    }
+    
+    # Peticiones del flujo leídas por adelantado antes de aplicar contrapresión
+    TAMANO_COLA_FLUJO = 64
+    
     def __init__(self, id_proceso, reloj):
         self.id_proceso = id_proceso
         self.reloj = reloj
     
     def Add(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
                           f"{self.id_proceso} <- {peticion.sender_id} operacion=SUMAR({peticion.num1}, {peticion.num2})",
-                          self.reloj.obtener_tiempo())
+                          tiempo, par=peticion.sender_id)
         
         resultado = peticion.num1 + peticion.num2
-        self.reloj.incrementar()
+        tiempo = self.reloj.incrementar()
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} calculó SUMA resultado={resultado}",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
         return services_pb2.MathResponse(
             result=resultado,
-            timestamp=self.reloj.obtener_tiempo(),
+            timestamp=tiempo,
             status="OK"
         )
     
     def Subtract(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
                           f"{self.id_proceso} <- {peticion.sender_id} operacion=RESTAR({peticion.num1}, {peticion.num2})",
-                          self.reloj.obtener_tiempo())
+                          tiempo, par=peticion.sender_id)
         
         resultado = peticion.num1 - peticion.num2
-        self.reloj.incrementar()
+        tiempo = self.reloj.incrementar()
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} calculó RESTA resultado={resultado}",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
         return services_pb2.MathResponse(
             result=resultado,
-            timestamp=self.reloj.obtener_tiempo(),
+            timestamp=tiempo,
             status="OK"
         )
     
     def Multiply(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
                           f"{self.id_proceso} <- {peticion.sender_id} operacion=MULTIPLICAR({peticion.num1}, {peticion.num2})",
-                          self.reloj.obtener_tiempo())
+                          tiempo, par=peticion.sender_id)
         
         resultado = peticion.num1 * peticion.num2
-        self.reloj.incrementar()
+        tiempo = self.reloj.incrementar()
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} calculó MULTIPLICACIÓN resultado={resultado}",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
         return services_pb2.MathResponse(
             result=resultado,
-            timestamp=self.reloj.obtener_tiempo(),
+            timestamp=tiempo,
             status="OK"
         )
     
     def Divide(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
                           f"{self.id_proceso} <- {peticion.sender_id} operacion=DIVIDIR({peticion.num1}, {peticion.num2})",
-                          self.reloj.obtener_tiempo())
+                          tiempo, par=peticion.sender_id)
         
         if peticion.num2 == 0:
             return services_pb2.MathResponse(
                 result=0,
-                timestamp=self.reloj.obtener_tiempo(),
+                timestamp=tiempo,
                 status="ERROR: División por cero"
             )
         
         resultado = peticion.num1 / peticion.num2
-        self.reloj.incrementar()
+        tiempo = self.reloj.incrementar()
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} calculó DIVISIÓN resultado={resultado}",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
         return services_pb2.MathResponse(
             result=resultado,
-            timestamp=self.reloj.obtener_tiempo(),
+            timestamp=tiempo,
             status="OK"
         )
-
-
-class ServicioMensajes(services_pb2_grpc.MessageServiceServicer):
-    """Servicio para recibir mensajes de otros procesos"""
     
-    def __init__(self, id_proceso, reloj):
-        self.id_proceso = id_proceso
-        self.reloj = reloj
+    def calcular_lote(self, operacion, num1, num2):
+        """Aplica la operación a todo el lote en una sola pasada de NumPy.
+        Devuelve los resultados y las posiciones con división por cero."""
+        a = np.fromiter(num1, dtype=np.float64, count=len(num1))
+        b = np.fromiter(num2, dtype=np.float64, count=len(num2))
+        
+        if operacion != services_pb2.DIVIDE:
+            return self.OPERACIONES_LOTE[operacion][1](a, b), np.empty(0, dtype=np.intp)
+        
+        # Las divisiones por cero quedan en 0, igual que en Divide
+        divisor_valido = b != 0
+        resultados = np.divide(a, b, out=np.zeros_like(a), where=divisor_valido)
+        return resultados, np.flatnonzero(~divisor_valido)
     
-    def SendMessage(self, peticion, contexto):
-        # Actualizar reloj al recibir mensaje
-        self.reloj.actualizar(peticion.timestamp)
+    def BatchCompute(self, peticion, contexto):
+        nombre, _ = self.OPERACIONES_LOTE.get(peticion.operation, ("DESCONOCIDA", None))
+        cantidad = len(peticion.num1)
+        
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} mensaje='{peticion.message}'",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=LOTE_{nombre}({cantidad} pares)",
+                          tiempo, par=peticion.sender_id)
         
-        return services_pb2.MessageResponse(
-            status="ACK",
-            timestamp=self.reloj.obtener_tiempo()
+        if peticion.operation not in self.OPERACIONES_LOTE:
+            return services_pb2.MathBatchResponse(
+                timestamp=tiempo,
+                status=f"ERROR: Operación desconocida ({peticion.operation})"
+            )
+        
+        if cantidad != len(peticion.num2):
+            return services_pb2.MathBatchResponse(
+                timestamp=tiempo,
+                status="ERROR: num1 y num2 deben tener la misma longitud"
+            )
+        
+        resultados, errores = self.calcular_lote(peticion.operation, peticion.num1, peticion.num2)
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} calculó LOTE de {cantidad} {nombre}(s), divisiones por cero={len(errores)}",
+                          tiempo)
+        
+        return services_pb2.MathBatchResponse(
+            results=resultados.tolist(),
+            error_indices=errores.tolist(),
+            timestamp=tiempo,
+            status="OK" if len(errores) == 0 else f"PARCIAL: {len(errores)} divisiones por cero"
         )
-
-
-def enviar_mensaje_a_proceso(id_origen, id_destino, mensaje, timestamp, host, puerto):
-    """Función para enviar mensaje a otro proceso"""
-    try:
-        canal = grpc.insecure_channel(f'{host}:{puerto}')
-        cliente = services_pb2_grpc.MessageServiceStub(canal)
+    
+    def calcular_peticion_flujo(self, peticion):
+        """Atiende una petición del flujo con la misma semántica que las RPC unarias"""
+        nombre, _ = self.OPERACIONES_LOTE.get(peticion.operation, ("DESCONOCIDA", None))
+        
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        Bitacora.registrar("RECEIVE", 
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=FLUJO_{nombre}({peticion.num1}, {peticion.num2})",
+                          tiempo, par=peticion.sender_id)
+        
+        if peticion.operation not in self.OPERACIONES_ESCALARES:
+            return services_pb2.MathResponse(
+                result=0,
+                timestamp=tiempo,
+                status=f"ERROR: Operación desconocida ({peticion.operation})"
+            )
+        
+        if peticion.operation == services_pb2.DIVIDE and peticion.num2 == 0:
+            return services_pb2.MathResponse(
+                result=0,
+                timestamp=tiempo,
+                status="ERROR: División por cero"
+            )
         
-        peticion = services_pb2.MessageRequest(
-            sender_id=id_origen,
-            receiver_id=id_destino,
-            message=mensaje,
-            timestamp=timestamp
+        resultado = self.OPERACIONES_ESCALARES[peticion.operation](peticion.num1, peticion.num2)
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} calculó {nombre} resultado={resultado}",
+                          tiempo)
+        
+        return services_pb2.MathResponse(
+            result=resultado,
+            timestamp=tiempo,
+            status="OK"
         )
+    
+    def StreamCompute(self, iterador_peticiones, contexto):
+        """
+        Flujo bidireccional de operaciones:
+        un hilo lector recibe peticiones mientras se calculan y envían las respuestas.
+        La cola acotada aplica contrapresión: si se llena, se deja de leer y el
+        control de flujo de HTTP/2 frena al productor.
+        """
+        cola = queue.Queue(maxsize=self.TAMANO_COLA_FLUJO)
+        fin_flujo = object()
+        
+        def encolar(elemento):
+            while contexto.is_active():
+                try:
+                    cola.put(elemento, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def leer_peticiones():
+            try:
+                for peticion in iterador_peticiones:
+                    if not encolar(peticion):
+                        return
+            except grpc.RpcError:
+                pass
+            finally:
+                encolar(fin_flujo)
+        
+        threading.Thread(target=leer_peticiones, daemon=True).start()
         
-        respuesta = cliente.SendMessage(peticion, timeout=5.0)
-        return respuesta.timestamp
-    except Exception as e:
-        print(f"[ERROR] No se pudo enviar mensaje a {id_destino}: {e}")
-        return timestamp
+        while contexto.is_active():
+            try:
+                peticion = cola.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if peticion is fin_flujo:
+                break
+            yield self.calcular_peticion_flujo(peticion)
 
 
-def tarea_proceso1(id_proceso, reloj):
+class ServicioMatematicasAsync(ServicioMatematicas):
+    """
+    Versión asíncrona (grpc.aio) del servicio de matemáticas. Las operaciones
+    escalares solo toman los locks del reloj y la bitácora y corren en el
+    event loop; los lotes se calculan en el ejecutor de cálculo.
+    """
+    
+    async def Add(self, peticion, contexto):
+        return super().Add(peticion, contexto)
+    
+    async def Subtract(self, peticion, contexto):
+        return super().Subtract(peticion, contexto)
+    
+    async def Multiply(self, peticion, contexto):
+        return super().Multiply(peticion, contexto)
+    
+    async def Divide(self, peticion, contexto):
+        return super().Divide(peticion, contexto)
+    
+    async def BatchCompute(self, peticion, contexto):
+        return await en_ejecutor(super().BatchCompute, peticion, contexto)
+    
+    async def StreamCompute(self, iterador_peticiones, contexto):
+        # En grpc.aio cada lectura y escritura espera al control de flujo de HTTP/2
+        async for peticion in iterador_peticiones:
+            yield self.calcular_peticion_flujo(peticion)
+
+
+def tarea_proceso1(id_proceso, reloj, pool):
     """
     Tarea específica del Proceso 1:
     1. Evento interno: Calcular suma, resta, multiplicación y división de 2 números
@@ -181,7 +289,7 @@ def tarea_proceso1(id_proceso, reloj):
     time.sleep(3)
     
     # 1. EVENTO INTERNO: Operaciones matemáticas con 2 números
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     num1 = 25.5
     num2 = 10.3
     suma = num1 + num2
@@ -190,21 +298,20 @@ def tarea_proceso1(id_proceso, reloj):
     division = num1 / num2
     Bitacora.registrar("INTERNAL", 
                       f"{id_proceso} operaciones: {num1}+{num2}={suma:.2f}, {num1}-{num2}={resta:.2f}, {num1}*{num2}={multiplicacion:.2f}, {num1}/{num2}={division:.2f}",
-                      reloj.obtener_tiempo())
+                      tiempo)
     
     time.sleep(1)
     
     # 2. ENVIAR MENSAJE A P3
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     Bitacora.registrar("SEND", 
                       f"{id_proceso} -> P3_MATRIX mensaje='Hola P3, operaciones completadas'",
-                      reloj.obtener_tiempo())
+                      tiempo, par="P3_MATRIX")
     
     timestamp_recibido = enviar_mensaje_a_proceso(
-        id_proceso, "P3_MATRIX", 
+        pool, id_proceso, "P3_MATRIX", 
         f"Hola P3, operaciones completadas: suma={suma:.2f}",
-        reloj.obtener_tiempo(),
-        "proceso3", 50053  # En Docker: hostname proceso3
+        tiempo
     )
     
     # Actualizar reloj con respuesta
@@ -213,45 +320,22 @@ def tarea_proceso1(id_proceso, reloj):
     time.sleep(1)
     
     # 3. EVENTO INTERNO: Generar número aleatorio
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     numero_aleatorio = random.randint(1, 100)
     Bitacora.registrar("INTERNAL", 
                       f"{id_proceso} generó número aleatorio = {numero_aleatorio}",
-                      reloj.obtener_tiempo())
+                      tiempo)
+
+
+def agregar_servicios(servidor, id_proceso, reloj, pool, aio):
+    """Registra MathService; MessageService y BroadcastService los agrega servidor_proceso"""
+    servicio = ServicioMatematicasAsync if aio else ServicioMatematicas
+    services_pb2_grpc.add_MathServiceServicer_to_server(servicio(id_proceso, reloj), servidor)
 
 
 def iniciar_servidor():
     """Función principal que inicia el servidor gRPC"""
-    id_proceso = "P1_MATH"
-    reloj = RelojLamport()
-    
-    # Crear servidor con pool de hilos
-    servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    
-    # Registrar AMBOS servicios
-    services_pb2_grpc.add_MathServiceServicer_to_server(
-        ServicioMatematicas(id_proceso, reloj), servidor
-    )
-    services_pb2_grpc.add_MessageServiceServicer_to_server(
-        ServicioMensajes(id_proceso, reloj), servidor
-    )
-    
-    # Escuchar en el puerto 50051
-    servidor.add_insecure_port('[::]:50051')
-    servidor.start()
-    
-    print(f"{id_proceso} servidor iniciado en puerto 50051")
-    Bitacora.registrar("INTERNAL", f"{id_proceso} inicializado", reloj.obtener_tiempo())
-    
-    # Iniciar tarea de comunicación en un hilo separado
-    threading.Thread(target=tarea_proceso1, args=(id_proceso, reloj), daemon=True).start()
-    
-    # Mantener el servidor corriendo
-    try:
-        servidor.wait_for_termination()
-    except KeyboardInterrupt:
-        print(f"\n{id_proceso} detenido")
-        servidor.stop(0)
+    ejecutar_proceso("P1_MATH", agregar_servicios, tarea_proceso1)
 
 
 if __name__ == '__main__':
@@ -4,44 +4,72 @@ Este proceso:
 1. Evento interno: Promedio de 50 números aleatorios en un rango de 0 a 10
 2. Envía mensaje a P1
 3. Recibe mensaje de P4
+Además calcula estadísticas (media, varianza, mínimo, máximo) de flujos de
+datos enviados por el cliente (StreamStatistics) en memoria constante.
 """
 
-import grpc
-from concurrent import futures
 import time
-import random
 import math
+import grpc
+import numpy as np
 import services_pb2
 import services_pb2_grpc
-import threading
+from pool_canales import OPCIONES_CANAL, OPCIONES_SERVIDOR, OPCIONES_TAMANO_MENSAJE, TAMANO_MAXIMO_MENSAJE
+from bitacora import Bitacora
+from servidor_proceso import ejecutar_proceso, en_ejecutor, enviar_mensaje_a_proceso
+from forma_respuesta import incluir_entrada, resumir
+
+# Tamaño de la muestra aleatoria de CalculateAverage
+TAMANO_MUESTRA_DEFECTO = 50
+TAMANO_MUESTRA_MAXIMO = 10**8
+# Con FULL y sin packed_numbers cada número se vuelve un float de Python en un
+# campo repeated: por encima de este tamaño hay que pedir packed_numbers
+TAMANO_MUESTRA_MAXIMO_LISTA = 10**6
+# Con FULL la respuesta lleva 8 bytes por número y debe caber en un mensaje
+# (TAMANO_MAXIMO_MENSAJE, también en el cliente); se deja 1 KB para los demás campos
+TAMANO_MUESTRA_MAXIMO_RESPUESTA = (TAMANO_MAXIMO_MENSAJE - 1024) // 8
+OPCIONES_SERVIDOR_PROMEDIO = OPCIONES_SERVIDOR + OPCIONES_TAMANO_MENSAJE
+
+
+def generar_muestra(tamano):
+    """Genera `tamano` números uniformes en [0, 10) como arreglo float64 de NumPy"""
+    return np.random.default_rng().uniform(0, 10, tamano)
 
-class RelojLamport:
-    """Reloj de Lamport con thread-safety"""
+
+class EstadisticasWelford:
+    """
+    Media, varianza, mínimo y máximo de un flujo de datos en memoria O(1).
+    Cada bloque se resume con NumPy y se combina con el acumulado usando la
+    actualización de Welford generalizada a bloques (Chan et al.).
+    """
     def __init__(self):
-        self.tiempo = 0
-        self.lock = threading.Lock()
+        self.cantidad = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
     
-    def incrementar(self):
-        with self.lock:
-            self.tiempo += 1
-            return self.tiempo
+    def agregar(self, valores):
+        cantidad_bloque = len(valores)
+        if cantidad_bloque == 0:
+            return
+        
+        media_bloque = float(valores.mean())
+        m2_bloque = float(np.square(valores - media_bloque).sum())
+        
+        total = self.cantidad + cantidad_bloque
+        delta = media_bloque - self.media
+        self.media += delta * cantidad_bloque / total
+        self.m2 += m2_bloque + delta * delta * self.cantidad * cantidad_bloque / total
+        self.cantidad = total
+        self.minimo = min(self.minimo, float(valores.min()))
+        self.maximo = max(self.maximo, float(valores.max()))
     
-    def actualizar(self, tiempo_recibido):
-        with self.lock:
-            self.tiempo = max(self.tiempo, tiempo_recibido) + 1
-            return self.tiempo
+    def varianza(self):
+        return self.m2 / self.cantidad if self.cantidad > 0 else 0.0
     
-    def obtener_tiempo(self):
-        with self.lock:
-            return self.tiempo
-
-
-class Bitacora:
-    """Sistema de registro de eventos"""
-    @staticmethod
-    def registrar(tipo_evento, detalles, valor_reloj):
-        marca_temporal = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{marca_temporal}] [{tipo_evento}] {detalles} clock={valor_reloj}")
+    def varianza_muestral(self):
+        return self.m2 / (self.cantidad - 1) if self.cantidad > 1 else 0.0
 
 
 class ServicioPromedio(services_pb2_grpc.AverageServiceServicer):
@@ -51,71 +79,144 @@ class ServicioPromedio(services_pb2_grpc.AverageServiceServicer):
         self.id_proceso = id_proceso
         self.reloj = reloj
     
+    def respuesta_demasiado_grande(self, contexto, tiempo, motivo):
+        """Rechaza con INVALID_ARGUMENT una muestra cuya respuesta no se puede enviar"""
+        contexto.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+        contexto.set_details(motivo)
+        return services_pb2.AverageResponse(timestamp=tiempo, status=f"ERROR: {motivo}")
+    
     def CalculateAverage(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        tamano = peticion.sample_size or TAMANO_MUESTRA_DEFECTO
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} operacion=CALCULAR_PROMEDIO(50 números)",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=CALCULAR_PROMEDIO({tamano} números)",
+                          tiempo, par=peticion.sender_id)
         
-        self.reloj.incrementar()
-        numeros = [random.uniform(0, 10) for _ in range(50)]
+        if not 0 < tamano <= TAMANO_MUESTRA_MAXIMO:
+            return services_pb2.AverageResponse(
+                timestamp=tiempo,
+                status=f"ERROR: sample_size debe estar entre 1 y {TAMANO_MUESTRA_MAXIMO}"
+            )
+        if incluir_entrada(peticion) and not peticion.packed_numbers and tamano > TAMANO_MUESTRA_MAXIMO_LISTA:
+            return self.respuesta_demasiado_grande(
+                contexto, tiempo,
+                f"más de {TAMANO_MUESTRA_MAXIMO_LISTA} números requiere packed_numbers "
+                f"o un response_shape sin los datos de entrada"
+            )
+        if incluir_entrada(peticion) and tamano > TAMANO_MUESTRA_MAXIMO_RESPUESTA:
+            return self.respuesta_demasiado_grande(
+                contexto, tiempo,
+                f"más de {TAMANO_MUESTRA_MAXIMO_RESPUESTA} números no caben en un mensaje; "
+                f"use un response_shape sin los datos de entrada o StreamStatistics"
+            )
+        
+        tiempo = self.reloj.incrementar()
+        numeros = generar_muestra(tamano)
         Bitacora.registrar("INTERNAL", 
-                          f"{self.id_proceso} generó 50 números aleatorios",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} generó {tamano} números aleatorios",
+                          tiempo)
         
-        self.reloj.incrementar()
-        promedio = sum(numeros) / len(numeros)
+        tiempo = self.reloj.incrementar()
+        promedio = float(numeros.mean())
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} calculó PROMEDIO resultado={promedio:.4f}",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
+        
+        if not incluir_entrada(peticion):
+            respuesta = services_pb2.AverageResponse(
+                average=promedio,
+                timestamp=tiempo,
+                status="OK"
+            )
+            if peticion.response_shape == services_pb2.SUMMARY:
+                respuesta.summary.CopyFrom(resumir(numeros))
+            return respuesta
+        
+        if peticion.packed_numbers:
+            # Se copia el buffer del arreglo tal cual, sin crear un float de Python por elemento
+            return services_pb2.AverageResponse(
+                numbers_packed=numeros.astype('<f8', copy=False).tobytes(),
+                average=promedio,
+                timestamp=tiempo,
+                status="OK"
+            )
         
         return services_pb2.AverageResponse(
-            numbers=numeros,
+            numbers=numeros.tolist(),
             average=promedio,
-            timestamp=self.reloj.obtener_tiempo()
+            timestamp=tiempo,
+            status="OK"
         )
-
-
-class ServicioMensajes(services_pb2_grpc.MessageServiceServicer):
-    """Servicio para recibir mensajes de otros procesos"""
     
-    def __init__(self, id_proceso, reloj):
-        self.id_proceso = id_proceso
-        self.reloj = reloj
+    def agregar_bloque(self, estadisticas, bloque):
+        estadisticas.agregar(np.fromiter(bloque.values, dtype=np.float64, count=len(bloque.values)))
     
-    def SendMessage(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+    def resumir_flujo(self, estadisticas, remitente, num_bloques, timestamp_maximo):
+        """Un evento RECEIVE por el flujo completo y un evento INTERNAL por el resumen"""
+        tiempo = self.reloj.actualizar(timestamp_maximo)
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} mensaje='{peticion.message}'",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {remitente} operacion=ESTADISTICAS_FLUJO({estadisticas.cantidad} números en {num_bloques} bloques)",
+                          tiempo, par=remitente)
+        
+        if estadisticas.cantidad == 0:
+            return services_pb2.StatisticsSummary(
+                timestamp=tiempo,
+                status="ERROR: El flujo no contenía datos"
+            )
         
-        return services_pb2.MessageResponse(
-            status="ACK",
-            timestamp=self.reloj.obtener_tiempo()
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} calculó media={estadisticas.media:.4f} varianza={estadisticas.varianza():.4f}",
+                          tiempo)
+        
+        return services_pb2.StatisticsSummary(
+            count=estadisticas.cantidad,
+            mean=estadisticas.media,
+            variance=estadisticas.varianza(),
+            sample_variance=estadisticas.varianza_muestral(),
+            min=estadisticas.minimo,
+            max=estadisticas.maximo,
+            timestamp=tiempo,
+            status="OK"
         )
+    
+    def StreamStatistics(self, iterador_bloques, contexto):
+        estadisticas = EstadisticasWelford()
+        remitente = ""
+        num_bloques = 0
+        timestamp_maximo = 0
+        for bloque in iterador_bloques:
+            self.agregar_bloque(estadisticas, bloque)
+            remitente = remitente or bloque.sender_id
+            num_bloques += 1
+            timestamp_maximo = max(timestamp_maximo, bloque.timestamp)
+        
+        return self.resumir_flujo(estadisticas, remitente, num_bloques, timestamp_maximo)
 
 
-def enviar_mensaje_a_proceso(id_origen, id_destino, mensaje, timestamp, host, puerto):
-    """Función para enviar mensaje a otro proceso"""
-    try:
-        canal = grpc.insecure_channel(f'{host}:{puerto}')
-        cliente = services_pb2_grpc.MessageServiceStub(canal)
-        
-        peticion = services_pb2.MessageRequest(
-            sender_id=id_origen,
-            receiver_id=id_destino,
-            message=mensaje,
-            timestamp=timestamp
-        )
+class ServicioPromedioAsync(ServicioPromedio):
+    """Versión asíncrona (grpc.aio) del servicio de cálculo de promedio"""
+    
+    async def CalculateAverage(self, peticion, contexto):
+        # Las muestras se generan y reducen en el ejecutor de cálculo
+        return await en_ejecutor(super().CalculateAverage, peticion, contexto)
+    
+    async def StreamStatistics(self, iterador_bloques, contexto):
+        estadisticas = EstadisticasWelford()
+        remitente = ""
+        num_bloques = 0
+        timestamp_maximo = 0
+        async for bloque in iterador_bloques:
+            await en_ejecutor(self.agregar_bloque, estadisticas, bloque)
+            remitente = remitente or bloque.sender_id
+            num_bloques += 1
+            timestamp_maximo = max(timestamp_maximo, bloque.timestamp)
         
-        respuesta = cliente.SendMessage(peticion, timeout=5.0)
-        return respuesta.timestamp
-    except Exception as e:
-        print(f"[ERROR] No se pudo enviar mensaje a {id_destino}: {e}")
-        return timestamp
+        # El resumen ya está calculado: solo quedan el reloj y la bitácora
+        return self.resumir_flujo(estadisticas, remitente, num_bloques, timestamp_maximo)
 
 
-def tarea_proceso2(id_proceso, reloj):
+def tarea_proceso2(id_proceso, reloj, pool):
     """
     Tarea específica del Proceso 2:
     1. Evento interno: Promedio de 50 números aleatorios en un rango de 0 a 10
@@ -125,26 +226,25 @@ def tarea_proceso2(id_proceso, reloj):
     time.sleep(4)
     
     # 1. EVENTO INTERNO: Promedio de 50 números aleatorios (0 a 10)
-    reloj.incrementar()
-    numeros = [random.uniform(0, 10) for _ in range(50)]
-    promedio = sum(numeros) / len(numeros)
+    tiempo = reloj.incrementar()
+    numeros = generar_muestra(TAMANO_MUESTRA_DEFECTO)
+    promedio = float(numeros.mean())
     Bitacora.registrar("INTERNAL", 
-                      f"{id_proceso} calculó promedio de 50 números (0-10) = {promedio:.4f}",
-                      reloj.obtener_tiempo())
+                      f"{id_proceso} calculó promedio de {TAMANO_MUESTRA_DEFECTO} números (0-10) = {promedio:.4f}",
+                      tiempo)
     
     time.sleep(1)
     
     # 2. ENVIAR MENSAJE A P1
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     Bitacora.registrar("SEND", 
                       f"{id_proceso} -> P1_MATH mensaje='Hola P1, promedio: {promedio:.4f}'",
-                      reloj.obtener_tiempo())
+                      tiempo, par="P1_MATH")
     
     timestamp_recibido = enviar_mensaje_a_proceso(
-        id_proceso, "P1_MATH", 
+        pool, id_proceso, "P1_MATH", 
         f"Hola P1, promedio: {promedio:.4f}",
-        reloj.obtener_tiempo(),
-        "proceso1", 50051
+        tiempo
     )
     
     reloj.actualizar(timestamp_recibido)
@@ -153,33 +253,16 @@ def tarea_proceso2(id_proceso, reloj):
     print(f"[INFO] {id_proceso} esperando mensaje de P4...")
 
 
+def agregar_servicios(servidor, id_proceso, reloj, pool, aio):
+    """Registra AverageService; MessageService y BroadcastService los agrega servidor_proceso"""
+    servicio = ServicioPromedioAsync if aio else ServicioPromedio
+    services_pb2_grpc.add_AverageServiceServicer_to_server(servicio(id_proceso, reloj), servidor)
+
+
 def iniciar_servidor():
     """Función principal que inicia el servidor gRPC"""
-    id_proceso = "P2_AVG"
-    reloj = RelojLamport()
-    
-    servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    
-    services_pb2_grpc.add_AverageServiceServicer_to_server(
-        ServicioPromedio(id_proceso, reloj), servidor
-    )
-    services_pb2_grpc.add_MessageServiceServicer_to_server(
-        ServicioMensajes(id_proceso, reloj), servidor
-    )
-    
-    servidor.add_insecure_port('[::]:50052')
-    servidor.start()
-    
-    print(f"{id_proceso} servidor iniciado en puerto 50052")
-    Bitacora.registrar("INTERNAL", f"{id_proceso} inicializado", reloj.obtener_tiempo())
-    
-    threading.Thread(target=tarea_proceso2, args=(id_proceso, reloj), daemon=True).start()
-    
-    try:
-        servidor.wait_for_termination()
-    except KeyboardInterrupt:
-        print(f"\n{id_proceso} detenido")
-        servidor.stop(0)
+    ejecutar_proceso("P2_AVG", agregar_servicios, tarea_proceso2,
+                     OPCIONES_SERVIDOR_PROMEDIO, OPCIONES_CANAL + OPCIONES_TAMANO_MENSAJE)
 
 
 if __name__ == '__main__':
@@ -4,51 +4,127 @@ Este proceso:
 1. Recibe mensaje de P1
 2. Evento interno: Matriz resultante del producto de 2 matrices de 2×2 con números aleatorios (0 a 10)
 3. Envía mensaje a P5
+Además multiplica matrices generales de N x M (MatMul) con NumPy (BLAS).
+Los productos grandes se reparten por bloques entre procesos locales o, si
+hay réplicas de P3 configuradas, entre este proceso y las réplicas (MultiplyTile).
+Las matrices que no caben en un mensaje viajan en fragmentos de filas
+(MultiplyStream y MatMulStream).
 """
 
 import grpc
 from concurrent import futures
+from functools import partial
+import os
 import time
 import random
+import numpy as np
 import services_pb2
 import services_pb2_grpc
 import threading
+from pool_canales import OPCIONES_CANAL, OPCIONES_SERVIDOR, OPCIONES_TAMANO_MENSAJE
+from matrices_bloques import crear_ejecutor, dividir_cuadricula, dividir_en_partes, multiplicar_por_bloques
+from bitacora import Bitacora
+from servidor_proceso import ejecutar_proceso, en_ejecutor, iterar_en_ejecutor, enviar_mensaje_a_proceso
+from topologia import obtener_topologia, separar_endpoint
+from forma_respuesta import incluir_entrada, incluir_resultado, resumir
 
-class RelojLamport:
-    """Reloj de Lamport con thread-safety"""
-    def __init__(self):
-        self.tiempo = 0
-        self.lock = threading.Lock()
-    
-    def incrementar(self):
-        with self.lock:
-            self.tiempo += 1
-            return self.tiempo
-    
-    def actualizar(self, tiempo_recibido):
-        with self.lock:
-            self.tiempo = max(self.tiempo, tiempo_recibido) + 1
-            return self.tiempo
-    
-    def obtener_tiempo(self):
-        with self.lock:
-            return self.tiempo
+# Las matrices de 1000 x 1000 ya ocupan 8 MB, más que el límite por defecto de gRPC (4 MB)
+OPCIONES_SERVIDOR_MATRICES = OPCIONES_SERVIDOR + OPCIONES_TAMANO_MENSAJE
+
+# Productos grandes: desde UMBRAL_BLOQUES filas o columnas en el resultado se
+# reparten en bloques de TAMANO_BLOQUE entre PROCESOS_BLOQUES procesos locales
+UMBRAL_BLOQUES = int(os.environ.get("UMBRAL_BLOQUES", "2048"))
+TAMANO_BLOQUE = int(os.environ.get("TAMANO_BLOQUE", "1024"))
+PROCESOS_BLOQUES = int(os.environ.get("PROCESOS_BLOQUES", str(os.cpu_count() or 1)))
+
+# Segundos que se espera a una réplica por su bloque (MultiplyTile) antes de calcularlo aquí
+PLAZO_BLOQUE = float(os.environ.get("PLAZO_BLOQUE", "120.0"))
+
+# Dimensión máxima de las matrices que genera el servidor
+DIMENSION_MAXIMA = 4096
+
+# Transferencia en fragmentos: bytes máximos de datos por MatrixChunk
+TAMANO_FRAGMENTO = int(os.environ.get("TAMANO_FRAGMENTO_MATRIZ", str(1024 * 1024)))
+TIPOS_FRAGMENTO = {"<f8": np.float64, "<f4": np.float32}
+
+
+def matriz_a_numpy(matriz):
+    """Convierte un mensaje Matrix en un arreglo de NumPy de rows x cols"""
+    if matriz.rows <= 0 or matriz.cols <= 0:
+        raise ValueError(f"dimensiones inválidas {matriz.rows}x{matriz.cols}")
+    if len(matriz.values) != matriz.rows * matriz.cols:
+        raise ValueError(f"se esperaban {matriz.rows * matriz.cols} valores y llegaron {len(matriz.values)}")
+    valores = np.fromiter(matriz.values, dtype=np.float64, count=len(matriz.values))
+    return valores.reshape(matriz.rows, matriz.cols)
 
 
-class Bitacora:
-    """Sistema de registro de eventos"""
-    @staticmethod
-    def registrar(tipo_evento, detalles, valor_reloj):
-        marca_temporal = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{marca_temporal}] [{tipo_evento}] {detalles} clock={valor_reloj}")
+def numpy_a_matriz(arreglo):
+    """Convierte un arreglo 2D de NumPy en un mensaje Matrix"""
+    filas, columnas = arreglo.shape
+    return services_pb2.Matrix(rows=filas, cols=columnas, values=arreglo.ravel().tolist())
+
+
+def fragmentar_matriz(matriz, operando, id_proceso, timestamp, fila_inicial=0, total_filas=None,
+                      indice_inicial=0, status=""):
+    """
+    Genera los MatrixChunk de una matriz (o de un bloque de filas que empieza en
+    fila_inicial dentro de una matriz de total_filas filas), de a lo más
+    TAMANO_FRAGMENTO bytes cada uno.
+    """
+    matriz = np.ascontiguousarray(matriz, dtype='<f8')
+    filas, columnas = matriz.shape
+    filas_por_fragmento = max(1, TAMANO_FRAGMENTO // max(1, columnas * matriz.itemsize))
+    for indice, inicio in enumerate(range(0, filas, filas_por_fragmento), start=indice_inicial):
+        bloque = matriz[inicio:inicio + filas_por_fragmento]
+        yield services_pb2.MatrixChunk(
+            sender_id=id_proceso,
+            timestamp=timestamp,
+            operand=operando,
+            rows=filas if total_filas is None else total_filas,
+            cols=columnas,
+            dtype="<f8",
+            chunk_index=indice,
+            row_offset=fila_inicial + inicio,
+            chunk_rows=len(bloque),
+            data=bloque.tobytes(),
+            status=status
+        )
+
+
+def fragmento_a_numpy(fragmento):
+    """Vista de NumPy (sin copia) sobre las filas de un MatrixChunk"""
+    tipo = TIPOS_FRAGMENTO.get(fragmento.dtype or "<f8")
+    if tipo is None:
+        raise ValueError(f"dtype no soportado: {fragmento.dtype}")
+    if fragmento.rows <= 0 or fragmento.cols <= 0 or fragmento.chunk_rows <= 0:
+        raise ValueError(f"dimensiones inválidas en el fragmento {fragmento.chunk_index}")
+    if fragmento.row_offset < 0 or fragmento.row_offset + fragmento.chunk_rows > fragmento.rows:
+        raise ValueError(f"el fragmento {fragmento.chunk_index} se sale de las {fragmento.rows} filas")
+    if len(fragmento.data) != fragmento.chunk_rows * fragmento.cols * np.dtype(tipo).itemsize:
+        raise ValueError(f"el tamaño de los datos del fragmento {fragmento.chunk_index} no coincide")
+    return np.frombuffer(fragmento.data, dtype=tipo).reshape(fragmento.chunk_rows, fragmento.cols)
+
+
+class ProductoEnFlujo:
+    """Estado de un MultiplyStream: B se va llenando y A se procesa por bloques"""
+    def __init__(self):
+        self.remitente = None
+        self.matriz_b = None
+        self.filas_b = None  # máscara de las filas de B ya recibidas
+        self.filas_a = 0
+        self.indice_salida = 0
+        self.terminado = False
 
 
 class ServicioMatrices(services_pb2_grpc.MatrixServiceServicer):
     """Implementación del servicio de multiplicación de matrices"""
     
-    def __init__(self, id_proceso, reloj):
+    def __init__(self, id_proceso, reloj, pool=None):
         self.id_proceso = id_proceso
         self.reloj = reloj
+        self.pool = pool
+        self.ejecutor = None
+        self.lock_ejecutor = threading.Lock()
     
     def generar_matriz_2x2(self):
         return [random.uniform(0, 10) for _ in range(4)]
@@ -65,76 +141,357 @@ class ServicioMatrices(services_pb2_grpc.MatrixServiceServicer):
         return [c00, c01, c10, c11]
     
     def MultiplyMatrices(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
                           f"{self.id_proceso} <- {peticion.sender_id} operacion=MULTIPLICAR_MATRICES(2x2)",
-                          self.reloj.obtener_tiempo())
+                          tiempo, par=peticion.sender_id)
         
-        self.reloj.incrementar()
+        tiempo = self.reloj.incrementar()
         matriz_a = self.generar_matriz_2x2()
         matriz_b = self.generar_matriz_2x2()
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} generó matrices A y B aleatorias",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
-        self.reloj.incrementar()
+        tiempo = self.reloj.incrementar()
         resultado = self.multiplicar_matrices_2x2(matriz_a, matriz_b)
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} multiplicó matrices A * B",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
-        return services_pb2.MatrixResponse(
-            matrix_a=services_pb2.Matrix2x2(values=matriz_a),
-            matrix_b=services_pb2.Matrix2x2(values=matriz_b),
-            result=services_pb2.Matrix2x2(values=resultado),
-            timestamp=self.reloj.obtener_tiempo()
-        )
-
-
-class ServicioMensajes(services_pb2_grpc.MessageServiceServicer):
-    """Servicio para recibir mensajes de otros procesos"""
+        respuesta = services_pb2.MatrixResponse(timestamp=tiempo)
+        if incluir_entrada(peticion):
+            respuesta.matrix_a.values.extend(matriz_a)
+            respuesta.matrix_b.values.extend(matriz_b)
+        if incluir_resultado(peticion):
+            respuesta.result.values.extend(resultado)
+        else:
+            respuesta.summary.CopyFrom(resumir(resultado))
+        return respuesta
     
-    def __init__(self, id_proceso, reloj, evento_recibido):
-        self.id_proceso = id_proceso
-        self.reloj = reloj
-        self.evento_recibido = evento_recibido
+    def obtener_operandos(self, peticion):
+        """Devuelve (A, B, generados): los operandos del cliente o unos aleatorios"""
+        if peticion.HasField("matrix_a") or peticion.HasField("matrix_b"):
+            return matriz_a_numpy(peticion.matrix_a), matriz_a_numpy(peticion.matrix_b), False
+        
+        dimensiones = (peticion.rows, peticion.inner, peticion.cols)
+        if not all(0 < dimension <= DIMENSION_MAXIMA for dimension in dimensiones):
+            raise ValueError(f"rows, inner y cols deben estar entre 1 y {DIMENSION_MAXIMA}")
+        rng = np.random.default_rng()
+        matriz_a = rng.uniform(0, 10, (peticion.rows, peticion.inner))
+        matriz_b = rng.uniform(0, 10, (peticion.inner, peticion.cols))
+        return matriz_a, matriz_b, True
+    
+    def MatMul(self, peticion, contexto):
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        Bitacora.registrar("RECEIVE", 
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=MULTIPLICAR_MATRICES(NxM)",
+                          tiempo, par=peticion.sender_id)
+        
+        try:
+            matriz_a, matriz_b, generados = self.obtener_operandos(peticion)
+        except ValueError as e:
+            return services_pb2.MatMulResponse(timestamp=tiempo, status=f"ERROR: {e}")
+        
+        if matriz_a.shape[1] != matriz_b.shape[0]:
+            return services_pb2.MatMulResponse(
+                timestamp=tiempo,
+                status=f"ERROR: dimensiones incompatibles {matriz_a.shape} * {matriz_b.shape}"
+            )
+        
+        resultado, modo = self.multiplicar(matriz_a, matriz_b)
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} multiplicó A{matriz_a.shape} * B{matriz_b.shape} ({modo})",
+                          tiempo)
+        
+        respuesta = services_pb2.MatMulResponse(timestamp=tiempo, status="OK")
+        if incluir_resultado(peticion):
+            respuesta.result.CopyFrom(numpy_a_matriz(resultado))
+        else:
+            respuesta.summary.CopyFrom(resumir(resultado))
+        if generados and incluir_entrada(peticion):
+            respuesta.matrix_a.CopyFrom(numpy_a_matriz(matriz_a))
+            respuesta.matrix_b.CopyFrom(numpy_a_matriz(matriz_b))
+        return respuesta
+    
+    def procesar_fragmento(self, flujo, fragmento):
+        """
+        Atiende un fragmento de MultiplyStream y devuelve los fragmentos de
+        respuesta: ninguno para B y los de A[bloque] * B para cada bloque de A.
+        """
+        if flujo.remitente is None:
+            flujo.remitente = fragmento.sender_id
+            tiempo = self.reloj.actualizar(fragmento.timestamp)
+            Bitacora.registrar("RECEIVE", 
+                              f"{self.id_proceso} <- {fragmento.sender_id} operacion=MULTIPLICAR_MATRICES_FLUJO",
+                              tiempo, par=fragmento.sender_id)
+        
+        try:
+            bloque = fragmento_a_numpy(fragmento)
+            if fragmento.operand == services_pb2.OPERAND_B:
+                if flujo.matriz_b is None:
+                    flujo.matriz_b = np.empty((fragmento.rows, fragmento.cols))
+                    flujo.filas_b = np.zeros(fragmento.rows, dtype=bool)
+                elif flujo.matriz_b.shape != (fragmento.rows, fragmento.cols):
+                    raise ValueError("los fragmentos de B no tienen la misma forma")
+                if flujo.filas_a:
+                    raise ValueError("B debe enviarse completa antes que A")
+                flujo.matriz_b[fragmento.row_offset:fragmento.row_offset + fragmento.chunk_rows] = bloque
+                # Un fragmento repetido o solapado marca las mismas filas: no cuenta dos veces
+                flujo.filas_b[fragmento.row_offset:fragmento.row_offset + fragmento.chunk_rows] = True
+                return []
+            
+            if fragmento.operand != services_pb2.OPERAND_A:
+                raise ValueError(f"operando inesperado ({fragmento.operand})")
+            if flujo.matriz_b is None or not flujo.filas_b.all():
+                raise ValueError("B debe enviarse completa antes que A")
+            if fragmento.cols != flujo.matriz_b.shape[0]:
+                raise ValueError(f"dimensiones incompatibles ({fragmento.rows}, {fragmento.cols}) * {flujo.matriz_b.shape}")
+        except ValueError as e:
+            flujo.terminado = True
+            return [services_pb2.MatrixChunk(
+                sender_id=self.id_proceso,
+                timestamp=self.reloj.obtener_tiempo(),
+                operand=services_pb2.OPERAND_RESULT,
+                status=f"ERROR: {e}"
+            )]
+        
+        resultado = bloque @ flujo.matriz_b
+        flujo.filas_a += fragmento.chunk_rows
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} multiplicó filas {fragmento.row_offset}:{fragmento.row_offset + fragmento.chunk_rows} de A * B{flujo.matriz_b.shape}",
+                          tiempo)
+        
+        respuesta = list(fragmentar_matriz(resultado, services_pb2.OPERAND_RESULT, self.id_proceso, tiempo,
+                                           fila_inicial=fragmento.row_offset, total_filas=fragmento.rows,
+                                           indice_inicial=flujo.indice_salida, status="OK"))
+        flujo.indice_salida += len(respuesta)
+        return respuesta
+    
+    def MultiplyStream(self, iterador_fragmentos, contexto):
+        flujo = ProductoEnFlujo()
+        for fragmento in iterador_fragmentos:
+            yield from self.procesar_fragmento(flujo, fragmento)
+            if flujo.terminado:
+                return
     
-    def SendMessage(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+    def fragmentos_producto(self, peticion):
+        """Fragmentos de MatMulStream: operandos (si se generaron) y luego C por bloques de filas"""
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} mensaje='{peticion.message}'",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=MULTIPLICAR_MATRICES_FLUJO(NxM)",
+                          tiempo, par=peticion.sender_id)
+        
+        try:
+            matriz_a, matriz_b, generados = self.obtener_operandos(peticion)
+            if matriz_a.shape[1] != matriz_b.shape[0]:
+                raise ValueError(f"dimensiones incompatibles {matriz_a.shape} * {matriz_b.shape}")
+        except ValueError as e:
+            yield services_pb2.MatrixChunk(
+                sender_id=self.id_proceso,
+                timestamp=tiempo,
+                operand=services_pb2.OPERAND_RESULT,
+                status=f"ERROR: {e}"
+            )
+            return
+        
+        if generados and incluir_entrada(peticion):
+            yield from fragmentar_matriz(matriz_a, services_pb2.OPERAND_A, self.id_proceso, tiempo, status="OK")
+            yield from fragmentar_matriz(matriz_b, services_pb2.OPERAND_B, self.id_proceso, tiempo, status="OK")
+        
+        # Cada bloque de filas de C se calcula justo antes de enviarse; con SUMMARY
+        # solo se acumula su resumen y al final se envía un único fragmento
+        filas, columnas = matriz_a.shape[0], matriz_b.shape[1]
+        filas_por_bloque = max(1, TAMANO_FRAGMENTO // (columnas * 8))
+        enviar_resultado = incluir_resultado(peticion)
+        minimo, maximo, suma = np.inf, -np.inf, 0.0
+        for indice, inicio in enumerate(range(0, filas, filas_por_bloque)):
+            fin = min(inicio + filas_por_bloque, filas)
+            resultado = matriz_a[inicio:fin] @ matriz_b
+            tiempo = self.reloj.incrementar()
+            Bitacora.registrar("INTERNAL", 
+                              f"{self.id_proceso} multiplicó filas {inicio}:{fin} de A{matriz_a.shape} * B{matriz_b.shape}",
+                              tiempo)
+            if enviar_resultado:
+                yield from fragmentar_matriz(resultado, services_pb2.OPERAND_RESULT, self.id_proceso, tiempo,
+                                             fila_inicial=inicio, total_filas=filas, indice_inicial=indice,
+                                             status="OK")
+            else:
+                minimo = min(minimo, float(resultado.min()))
+                maximo = max(maximo, float(resultado.max()))
+                suma += float(resultado.sum())
+        
+        if not enviar_resultado:
+            yield services_pb2.MatrixChunk(
+                sender_id=self.id_proceso,
+                timestamp=tiempo,
+                operand=services_pb2.OPERAND_RESULT,
+                rows=filas,
+                cols=columnas,
+                status="OK",
+                summary=services_pb2.ResultSummary(
+                    count=filas * columnas,
+                    min=minimo,
+                    max=maximo,
+                    mean=suma / (filas * columnas)
+                )
+            )
+    
+    def MatMulStream(self, peticion, contexto):
+        return self.fragmentos_producto(peticion)
+    
+    def obtener_ejecutor(self):
+        with self.lock_ejecutor:
+            if self.ejecutor is None:
+                self.ejecutor = crear_ejecutor(PROCESOS_BLOQUES)
+            return self.ejecutor
+    
+    def multiplicar(self, matriz_a, matriz_b):
+        """Devuelve (A @ B, modo) eligiendo entre producto directo, bloques locales o réplicas"""
+        if max(matriz_a.shape[0], matriz_b.shape[1]) < UMBRAL_BLOQUES:
+            return matriz_a @ matriz_b, "directo"
+        # Con otras réplicas de P3 en la topología, los productos grandes se
+        # reparten entre ellas y este proceso en lugar de los procesos locales
+        replicas = obtener_topologia().replicas(self.id_proceso)
+        if replicas and self.pool is not None:
+            return (self.multiplicar_distribuido(matriz_a, matriz_b, replicas),
+                    f"repartido en {len(replicas) + 1} nodos")
+        resultado = multiplicar_por_bloques(matriz_a, matriz_b, self.obtener_ejecutor(), TAMANO_BLOQUE)
+        return resultado, f"bloques de {TAMANO_BLOQUE} en {PROCESOS_BLOQUES} procesos"
+    
+    def multiplicar_distribuido(self, matriz_a, matriz_b, replicas):
+        """
+        Reparte C en una cuadrícula de bloques, uno por nodo (este proceso y
+        sus réplicas), y junta los resultados. Cada réplica recibe solo las
+        filas de A y las columnas de B de su bloque.
+        """
+        filas, interna = matriz_a.shape
+        columnas = matriz_b.shape[1]
+        resultado = np.empty((filas, columnas))
+        nodos = [None] + replicas  # None: el bloque se calcula en este proceso
+        partes_filas, partes_columnas = dividir_cuadricula(filas, columnas, len(nodos))
+        bloques = [(rango_filas, rango_columnas)
+                   for rango_filas in dividir_en_partes(filas, partes_filas)
+                   for rango_columnas in dividir_en_partes(columnas, partes_columnas)]
         
-        # Señalar que recibimos el mensaje de P1
-        self.evento_recibido.set()
+        def calcular_bloque(nodo, bloque):
+            (fila_inicio, fila_fin), (columna_inicio, columna_fin) = bloque
+            destino = resultado[fila_inicio:fila_fin, columna_inicio:columna_fin]
+            if nodo is not None and self.multiplicar_en_replica(nodo, matriz_a, matriz_b, bloque, destino):
+                return
+            np.matmul(matriz_a[fila_inicio:fila_fin], matriz_b[:, columna_inicio:columna_fin], out=destino)
         
-        return services_pb2.MessageResponse(
-            status="ACK",
-            timestamp=self.reloj.obtener_tiempo()
+        with futures.ThreadPoolExecutor(max_workers=len(bloques)) as hilos:
+            list(hilos.map(calcular_bloque, nodos, bloques))
+        return resultado
+    
+    def multiplicar_en_replica(self, replica, matriz_a, matriz_b, bloque, destino):
+        """Pide un bloque de C a una réplica de P3 y lo escribe en destino; False si falló"""
+        (fila_inicio, fila_fin), (columna_inicio, columna_fin) = bloque
+        descripcion = f"bloque [{fila_inicio}:{fila_fin}, {columna_inicio}:{columna_fin}]"
+        host, puerto = separar_endpoint(replica)
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("SEND", 
+                          f"{self.id_proceso} -> {replica} {descripcion}",
+                          tiempo, par=self.id_proceso)
+        try:
+            cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.MatrixServiceStub)
+            respuesta = cliente.MultiplyTile(services_pb2.TileRequest(
+                sender_id=self.id_proceso,
+                timestamp=tiempo,
+                row_offset=fila_inicio,
+                rows=fila_fin - fila_inicio,
+                inner=matriz_a.shape[1],
+                col_offset=columna_inicio,
+                cols=columna_fin - columna_inicio,
+                a_rows=np.ascontiguousarray(matriz_a[fila_inicio:fila_fin], dtype='<f8').tobytes(),
+                b=np.ascontiguousarray(matriz_b[:, columna_inicio:columna_fin], dtype='<f8').tobytes()
+            ), timeout=PLAZO_BLOQUE)
+            tiempo = self.reloj.actualizar(respuesta.timestamp)
+            Bitacora.registrar("RECEIVE", 
+                              f"{self.id_proceso} <- {replica} {descripcion} status={respuesta.status}",
+                              tiempo, par=self.id_proceso)
+            if respuesta.status != "OK":
+                raise RuntimeError(respuesta.status)
+            destino[...] = np.frombuffer(respuesta.result, dtype='<f8').reshape(destino.shape)
+            return True
+        except (grpc.RpcError, RuntimeError) as e:
+            # Si la réplica falla o no responde a tiempo, el bloque se calcula aquí
+            self.pool.reportar_error(host, puerto, e)
+            print(f"[ERROR] Réplica {replica} no calculó el {descripcion}: {e}")
+            return False
+    
+    def MultiplyTile(self, peticion, contexto):
+        fin = peticion.row_offset + peticion.rows
+        fin_columnas = peticion.col_offset + peticion.cols
+        descripcion = f"[{peticion.row_offset}:{fin}, {peticion.col_offset}:{fin_columnas}]"
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        Bitacora.registrar("RECEIVE", 
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=MULTIPLICAR_BLOQUE({descripcion})",
+                          tiempo, par=peticion.sender_id)
+        
+        if (len(peticion.a_rows) != 8 * peticion.rows * peticion.inner
+                or len(peticion.b) != 8 * peticion.inner * peticion.cols):
+            return services_pb2.TileResponse(
+                row_offset=peticion.row_offset,
+                col_offset=peticion.col_offset,
+                timestamp=tiempo,
+                status="ERROR: el tamaño de los bloques no coincide con las dimensiones"
+            )
+        
+        # Vistas directas sobre los bytes recibidos, sin copia
+        matriz_a = np.frombuffer(peticion.a_rows, dtype='<f8').reshape(peticion.rows, peticion.inner)
+        matriz_b = np.frombuffer(peticion.b, dtype='<f8').reshape(peticion.inner, peticion.cols)
+        tiempo = self.reloj.incrementar()
+        resultado = matriz_a @ matriz_b
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} multiplicó bloque {descripcion}",
+                          tiempo)
+        
+        return services_pb2.TileResponse(
+            row_offset=peticion.row_offset,
+            col_offset=peticion.col_offset,
+            rows=peticion.rows,
+            cols=peticion.cols,
+            result=resultado.tobytes(),
+            timestamp=tiempo,
+            status="OK"
         )
 
 
-def enviar_mensaje_a_proceso(id_origen, id_destino, mensaje, timestamp, host, puerto):
-    """Función para enviar mensaje a otro proceso"""
-    try:
-        canal = grpc.insecure_channel(f'{host}:{puerto}')
-        cliente = services_pb2_grpc.MessageServiceStub(canal)
-        
-        peticion = services_pb2.MessageRequest(
-            sender_id=id_origen,
-            receiver_id=id_destino,
-            message=mensaje,
-            timestamp=timestamp
-        )
-        
-        respuesta = cliente.SendMessage(peticion, timeout=5.0)
-        return respuesta.timestamp
-    except Exception as e:
-        print(f"[ERROR] No se pudo enviar mensaje a {id_destino}: {e}")
-        return timestamp
+class ServicioMatricesAsync(ServicioMatrices):
+    """
+    Versión asíncrona (grpc.aio) del servicio de multiplicación de matrices.
+    Los productos (BLAS) se calculan en el ejecutor de cálculo; el de 2x2 es
+    trivial y corre en el event loop.
+    """
+    
+    async def MultiplyMatrices(self, peticion, contexto):
+        return super().MultiplyMatrices(peticion, contexto)
+    
+    async def MatMul(self, peticion, contexto):
+        return await en_ejecutor(super().MatMul, peticion, contexto)
+    
+    async def MultiplyTile(self, peticion, contexto):
+        return await en_ejecutor(super().MultiplyTile, peticion, contexto)
+    
+    async def MultiplyStream(self, iterador_fragmentos, contexto):
+        # Cada bloque se multiplica en el ejecutor mientras siguen llegando fragmentos
+        flujo = ProductoEnFlujo()
+        async for fragmento in iterador_fragmentos:
+            for respuesta in await en_ejecutor(self.procesar_fragmento, flujo, fragmento):
+                yield respuesta
+            if flujo.terminado:
+                return
+    
+    async def MatMulStream(self, peticion, contexto):
+        async for fragmento in iterar_en_ejecutor(self.fragmentos_producto(peticion)):
+            yield fragmento
 
 
-def tarea_proceso3(id_proceso, reloj, evento_recibido):
+def tarea_proceso3(id_proceso, reloj, pool, evento_recibido):
     """
     Tarea específica del Proceso 3:
     1. Recibe mensaje de P1 (espera)
@@ -148,7 +505,7 @@ def tarea_proceso3(id_proceso, reloj, evento_recibido):
     time.sleep(1)
     
     # 2. EVENTO INTERNO: Multiplicar matrices 2x2 con números aleatorios (0-10)
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     # Generar matrices con números aleatorios de 0 a 10
     matriz_a = [random.uniform(0, 10) for _ in range(4)]
     matriz_b = [random.uniform(0, 10) for _ in range(4)]
@@ -165,54 +522,36 @@ def tarea_proceso3(id_proceso, reloj, evento_recibido):
     
     Bitacora.registrar("INTERNAL", 
                       f"{id_proceso} multiplicó matrices 2x2 (valores 0-10), resultado=[{resultado[0]:.2f}, {resultado[1]:.2f}, {resultado[2]:.2f}, {resultado[3]:.2f}]",
-                      reloj.obtener_tiempo())
+                      tiempo)
     
     time.sleep(1)
     
     # 3. ENVIAR MENSAJE A P5
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     Bitacora.registrar("SEND", 
                       f"{id_proceso} -> P5_SEARCH mensaje='Hola P5, matrices multiplicadas'",
-                      reloj.obtener_tiempo())
+                      tiempo, par="P5_SEARCH")
     
     timestamp_recibido = enviar_mensaje_a_proceso(
-        id_proceso, "P5_SEARCH", 
+        pool, id_proceso, "P5_SEARCH", 
         "Hola P5, matrices multiplicadas",
-        reloj.obtener_tiempo(),
-        "proceso5", 50055
+        tiempo
     )
     
     reloj.actualizar(timestamp_recibido)
 
 
+def agregar_servicios(servidor, id_proceso, reloj, pool, aio):
+    """Registra MatrixService; MessageService y BroadcastService los agrega servidor_proceso"""
+    servicio = ServicioMatricesAsync if aio else ServicioMatrices
+    services_pb2_grpc.add_MatrixServiceServicer_to_server(servicio(id_proceso, reloj, pool), servidor)
+
+
 def iniciar_servidor():
     """Función principal que inicia el servidor gRPC"""
-    id_proceso = "P3_MATRIX"
-    reloj = RelojLamport()
     evento_recibido = threading.Event()
-    
-    servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    
-    services_pb2_grpc.add_MatrixServiceServicer_to_server(
-        ServicioMatrices(id_proceso, reloj), servidor
-    )
-    services_pb2_grpc.add_MessageServiceServicer_to_server(
-        ServicioMensajes(id_proceso, reloj, evento_recibido), servidor
-    )
-    
-    servidor.add_insecure_port('[::]:50053')
-    servidor.start()
-    
-    print(f"{id_proceso} servidor iniciado en puerto 50053")
-    Bitacora.registrar("INTERNAL", f"{id_proceso} inicializado", reloj.obtener_tiempo())
-    
-    threading.Thread(target=tarea_proceso3, args=(id_proceso, reloj, evento_recibido), daemon=True).start()
-    
-    try:
-        servidor.wait_for_termination()
-    except KeyboardInterrupt:
-        print(f"\n{id_proceso} detenido")
-        servidor.stop(0)
+    ejecutar_proceso("P3_MATRIX", agregar_servicios, partial(tarea_proceso3, evento_recibido=evento_recibido),
+                     OPCIONES_SERVIDOR_MATRICES, OPCIONES_CANAL + OPCIONES_TAMANO_MENSAJE, evento_recibido)
 
 
 if __name__ == '__main__':
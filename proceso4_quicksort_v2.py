@@ -4,128 +4,430 @@ Este proceso:
 1. Evento interno: Ordenar 100 números aleatorios (0 a 100) usando Quick Sort
 2. Envía mensaje a P2
 3. Recibe mensaje de P5
+El ordenamiento lo hace motor_ordenamiento.py (introsort por defecto).
+Además ordena datos del cliente enviados en flujo (SortStream) con numpy.sort;
+los flujos que no caben en memoria se ordenan en disco (ordenamiento_externo.py)
+y, con réplicas de P4 configuradas, DistributedSort reparte el ordenamiento
+entre ellas (sample sort).
 """
 
 import grpc
 from concurrent import futures
+import os
 import time
 import random
+import numpy as np
 import services_pb2
 import services_pb2_grpc
 import threading
+from bitacora import Bitacora
+from servidor_proceso import ejecutar_proceso, en_ejecutor, iterar_en_ejecutor, enviar_mensaje_a_proceso
+from topologia import obtener_topologia, separar_endpoint
+from motor_ordenamiento import (ordenar, counting_sort_numpy, usar_conteo_numpy,
+                                 elegir_separadores, particionar)
+from ordenamiento_externo import OrdenamientoExterno, crear_ejecutor
+from forma_respuesta import incluir_entrada, incluir_resultado, resumir
+
+# QuickSort: números generados (0 a 100) por defecto y como máximo
+TAMANO_MUESTRA_DEFECTO = 100
+TAMANO_MUESTRA_MAXIMO = 10**6
+
+# SortStream: máximo de valores por flujo y valores por fragmento de respuesta (1 MB)
+TAMANO_MAXIMO_FLUJO = int(os.environ.get("TAMANO_MAXIMO_ORDEN", str(5 * 10**8)))
+VALORES_POR_FRAGMENTO = 131072
+TIPOS_ORDEN = {"<i8": np.int64, "<f8": np.float64}
+
+# Ordenamiento externo: un flujo que supera MEMORIA_MAXIMA_ORDEN bytes se
+# ordena en runs en disco (a lo más DISCO_MAXIMO_ORDEN bytes) con PROCESOS_ORDEN procesos
+MEMORIA_MAXIMA_ORDEN = int(os.environ.get("MEMORIA_MAXIMA_ORDEN", str(256 * 1024 * 1024)))
+DISCO_MAXIMO_ORDEN = int(os.environ.get("DISCO_MAXIMO_ORDEN", str(16 * 1024**3)))
+DIRECTORIO_TEMPORAL_ORDEN = os.environ.get("DIRECTORIO_TEMPORAL_ORDEN") or None
+PROCESOS_ORDEN = int(os.environ.get("PROCESOS_ORDEN", str(os.cpu_count() or 1)))
+
+# DistributedSort: segundos que se espera a una réplica por su partición antes de ordenarla aquí
+PLAZO_PARTICION = float(os.environ.get("PLAZO_PARTICION", "120.0"))
 
-class RelojLamport:
-    """Reloj de Lamport con thread-safety"""
-    def __init__(self):
-        self.tiempo = 0
-        self.lock = threading.Lock()
-    
-    def incrementar(self):
-        with self.lock:
-            self.tiempo += 1
-            return self.tiempo
-    
-    def actualizar(self, tiempo_recibido):
-        with self.lock:
-            self.tiempo = max(self.tiempo, tiempo_recibido) + 1
-            return self.tiempo
-    
-    def obtener_tiempo(self):
-        with self.lock:
-            return self.tiempo
+
+def fragmentos_orden(ordenado, codificacion, total, algoritmo, tiempo, posicion=0):
+    """SortChunk de un arreglo ordenado que empieza en posicion, en la codificación del cliente"""
+    campo, dtype = codificacion
+    for inicio in range(0, len(ordenado), VALORES_POR_FRAGMENTO):
+        bloque = ordenado[inicio:inicio + VALORES_POR_FRAGMENTO]
+        fragmento = services_pb2.SortChunk(
+            offset=posicion + inicio,
+            total=total,
+            algorithm=algoritmo,
+            timestamp=tiempo,
+            status="OK"
+        )
+        if campo == "packed_values":
+            fragmento.packed_values = bloque.tobytes()
+            fragmento.dtype = dtype
+        else:
+            getattr(fragmento, campo).extend(bloque.tolist())
+        yield fragmento
 
 
-class Bitacora:
-    """Sistema de registro de eventos"""
-    @staticmethod
-    def registrar(tipo_evento, detalles, valor_reloj):
-        marca_temporal = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{marca_temporal}] [{tipo_evento}] {detalles} clock={valor_reloj}")
+class DatosFlujo:
+    """Bloques recibidos en un SortStream, todavía sin ordenar"""
+    def __init__(self):
+        self.bloques = []
+        self.cantidad = 0
+        self.codificacion = None  # (campo, dtype) del primer bloque con datos
+        self.kind = services_pb2.NUMPY_QUICKSORT
+        self.externo = None       # OrdenamientoExterno si los datos pasaron a disco
+        self.remitente = ""
+        self.num_mensajes = 0
+        self.timestamp_maximo = 0
 
 
 class ServicioOrdenamiento(services_pb2_grpc.SortServiceServicer):
     """Implementación del servicio de ordenamiento Quick Sort"""
     
-    def __init__(self, id_proceso, reloj):
+    # SortAlgorithm del proto -> algoritmo de motor_ordenamiento
+    ALGORITMOS = {
+        services_pb2.INTROSORT: "introsort",
+        services_pb2.QUICKSORT_LISTS: "quicksort_listas",
+        services_pb2.BUILTIN: "integrado",
+        services_pb2.COUNTING_SORT: "conteo",
+        services_pb2.RADIX_SORT: "radix",
+        services_pb2.AUTO: "auto",
+    }
+    
+    # NumpySortKind del proto -> kind de numpy.sort
+    KINDS_NUMPY = {
+        services_pb2.NUMPY_QUICKSORT: "quicksort",
+        services_pb2.NUMPY_STABLE: "stable",
+        services_pb2.NUMPY_HEAPSORT: "heapsort",
+        services_pb2.NUMPY_COUNTING: "conteo",
+    }
+    
+    def __init__(self, id_proceso, reloj, pool=None):
         self.id_proceso = id_proceso
         self.reloj = reloj
+        self.pool = pool
+        self.ejecutor = None
+        self.lock_ejecutor = threading.Lock()
     
-    def quick_sort(self, arr):
-        if len(arr) <= 1:
-            return arr
-        
-        pivote = arr[len(arr) // 2]
-        menores = [x for x in arr if x < pivote]
-        iguales = [x for x in arr if x == pivote]
-        mayores = [x for x in arr if x > pivote]
-        
-        return self.quick_sort(menores) + iguales + self.quick_sort(mayores)
+    def obtener_ejecutor(self):
+        with self.lock_ejecutor:
+            if self.ejecutor is None:
+                self.ejecutor = crear_ejecutor(PROCESOS_ORDEN)
+            return self.ejecutor
     
     def QuickSort(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        # Sin algoritmo pedido se usa INTROSORT; la elección según los datos se pide con AUTO
+        algoritmo = self.ALGORITMOS.get(peticion.algorithm)
+        tamano = peticion.sample_size or TAMANO_MUESTRA_DEFECTO
+        tiempo = self.reloj.actualizar(peticion.timestamp)
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} operacion=QUICKSORT(100 números)",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=QUICKSORT({tamano} números, {algoritmo})",
+                          tiempo, par=peticion.sender_id)
+        
+        if algoritmo is None:
+            return services_pb2.SortResponse(
+                timestamp=tiempo,
+                status=f"ERROR: Algoritmo desconocido ({peticion.algorithm})"
+            )
         
-        self.reloj.incrementar()
-        numeros_originales = [random.randint(0, 100) for _ in range(100)]
+        if not 0 < tamano <= TAMANO_MUESTRA_MAXIMO:
+            return services_pb2.SortResponse(
+                timestamp=tiempo,
+                status=f"ERROR: sample_size debe estar entre 1 y {TAMANO_MUESTRA_MAXIMO}"
+            )
+        
+        tiempo = self.reloj.incrementar()
+        numeros_originales = np.random.default_rng().integers(0, 101, tamano).tolist()
         Bitacora.registrar("INTERNAL", 
-                          f"{self.id_proceso} generó 100 números aleatorios",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} generó {tamano} números aleatorios",
+                          tiempo)
         
-        self.reloj.incrementar()
-        numeros_ordenados = self.quick_sort(numeros_originales.copy())
+        tiempo = self.reloj.incrementar()
+        numeros_ordenados, algoritmo = ordenar(numeros_originales, algoritmo)
         Bitacora.registrar("INTERNAL", 
-                          f"{self.id_proceso} ordenó números con Quick Sort",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} ordenó números con {algoritmo}",
+                          tiempo)
         
-        return services_pb2.SortResponse(
-            original_numbers=numeros_originales,
-            sorted_numbers=numeros_ordenados,
-            timestamp=self.reloj.obtener_tiempo()
-        )
-
-
-class ServicioMensajes(services_pb2_grpc.MessageServiceServicer):
-    """Servicio para recibir mensajes de otros procesos"""
+        respuesta = services_pb2.SortResponse(timestamp=tiempo, algorithm=algoritmo, status="OK")
+        if incluir_entrada(peticion):
+            respuesta.original_numbers.extend(numeros_originales)
+        if incluir_resultado(peticion):
+            respuesta.sorted_numbers.extend(numeros_ordenados)
+        else:
+            respuesta.summary.CopyFrom(resumir(numeros_ordenados))
+        return respuesta
     
-    def __init__(self, id_proceso, reloj):
-        self.id_proceso = id_proceso
-        self.reloj = reloj
+    def agregar_mensaje(self, datos, peticion, externo_permitido=True):
+        """Agrega los valores de un mensaje del flujo; ValueError si no son válidos"""
+        if datos.num_mensajes == 0:
+            if peticion.kind not in self.KINDS_NUMPY:
+                raise ValueError(f"kind desconocido ({peticion.kind})")
+            datos.kind = peticion.kind
+        datos.remitente = datos.remitente or peticion.sender_id
+        datos.num_mensajes += 1
+        datos.timestamp_maximo = max(datos.timestamp_maximo, peticion.timestamp)
+        
+        if peticion.packed_values:
+            tipo = TIPOS_ORDEN.get(peticion.dtype)
+            if tipo is None:
+                raise ValueError(f"dtype no soportado: {peticion.dtype!r}")
+            if len(peticion.packed_values) % np.dtype(tipo).itemsize:
+                raise ValueError(f"packed_values no es múltiplo del tamaño de {peticion.dtype}")
+            codificacion = ("packed_values", peticion.dtype)
+            # Vista directa sobre los bytes recibidos
+            bloque = np.frombuffer(peticion.packed_values, dtype=tipo)
+        elif len(peticion.int_values):
+            codificacion = ("int_values", "<i8")
+            bloque = np.fromiter(peticion.int_values, dtype=np.int64, count=len(peticion.int_values))
+        elif len(peticion.double_values):
+            codificacion = ("double_values", "<f8")
+            bloque = np.fromiter(peticion.double_values, dtype=np.float64, count=len(peticion.double_values))
+        else:
+            return
+        
+        if datos.codificacion not in (None, codificacion):
+            raise ValueError("el flujo mezcla tipos o codificaciones de datos")
+        if datos.kind == services_pb2.NUMPY_COUNTING and codificacion[1] != "<i8":
+            raise ValueError("counting sort solo ordena enteros")
+        datos.codificacion = codificacion
+        datos.cantidad += len(bloque)
+        if datos.cantidad > TAMANO_MAXIMO_FLUJO:
+            raise ValueError(f"el flujo supera los {TAMANO_MAXIMO_FLUJO} valores")
+        
+        if externo_permitido and datos.externo is None and (
+                peticion.external or datos.cantidad * bloque.itemsize > MEMORIA_MAXIMA_ORDEN):
+            # Pasar a disco lo recibido hasta ahora y seguir escribiendo ahí
+            datos.externo = OrdenamientoExterno(
+                codificacion[1], self.obtener_ejecutor(), MEMORIA_MAXIMA_ORDEN, DISCO_MAXIMO_ORDEN,
+                PROCESOS_ORDEN, DIRECTORIO_TEMPORAL_ORDEN,
+                # Los runs en disco se ordenan por comparación aunque se pida conteo
+                "quicksort" if datos.kind == services_pb2.NUMPY_COUNTING else self.KINDS_NUMPY[datos.kind]
+            )
+            for anterior in datos.bloques:
+                datos.externo.agregar(anterior)
+            datos.bloques.clear()
+        
+        if datos.externo is not None:
+            datos.externo.agregar(bloque)
+        else:
+            datos.bloques.append(bloque)
     
-    def SendMessage(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+    def ordenar_arreglo(self, arreglo, kind):
+        """Ordena un arreglo en memoria: devuelve (ordenado, algoritmo); ValueError si no se puede"""
+        # Con el kind por defecto, enteros de rango pequeño pasan a counting sort
+        if kind == "quicksort" and usar_conteo_numpy(arreglo):
+            kind = "conteo"
+        if kind == "conteo":
+            return counting_sort_numpy(arreglo), "conteo(numpy.bincount)"
+        arreglo.sort(kind=kind)
+        return arreglo, f"numpy.sort(kind={kind})"
+    
+    def ordenar_flujo(self, datos, error=None):
+        """
+        Un evento RECEIVE por el flujo completo y un evento INTERNAL por el
+        ordenamiento; el resultado sale en fragmentos de VALORES_POR_FRAGMENTO.
+        """
+        tiempo = self.reloj.actualizar(datos.timestamp_maximo)
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} mensaje='{peticion.message}'",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {datos.remitente} operacion=ORDENAR_FLUJO({datos.cantidad} valores en {datos.num_mensajes} mensajes)",
+                          tiempo, par=datos.remitente)
+        
+        if error is None and datos.cantidad == 0:
+            error = "El flujo no contenía datos"
+        if error is not None:
+            if datos.externo is not None:
+                datos.externo.limpiar()
+            yield services_pb2.SortChunk(timestamp=tiempo, status=f"ERROR: {error}")
+            return
+        
+        kind = self.KINDS_NUMPY[datos.kind]
+        try:
+            if datos.externo is None:
+                arreglo = np.concatenate(datos.bloques)
+                datos.bloques.clear()
+                try:
+                    arreglo, algoritmo = self.ordenar_arreglo(arreglo, kind)
+                except ValueError as e:
+                    yield services_pb2.SortChunk(timestamp=tiempo, status=f"ERROR: {e}")
+                    return
+                ordenados = [arreglo]
+            else:
+                # Los runs se ordenan en el pool; la fusión se va generando al enviar
+                ordenados = datos.externo.ordenar()
+                algoritmo = f"externo({len(datos.externo.rutas)} runs, numpy.sort(kind={datos.externo.kind}))"
+            tiempo = self.reloj.incrementar()
+            Bitacora.registrar("INTERNAL", 
+                              f"{self.id_proceso} ordenó {datos.cantidad} valores con {algoritmo}",
+                              tiempo)
+            
+            posicion = 0
+            for ordenado in ordenados:
+                yield from fragmentos_orden(ordenado, datos.codificacion, datos.cantidad,
+                                            algoritmo, tiempo, posicion)
+                posicion += len(ordenado)
+        finally:
+            if datos.externo is not None:
+                datos.externo.limpiar()
+    
+    def SortStream(self, iterador_peticiones, contexto):
+        datos = DatosFlujo()
+        error = None
+        try:
+            for peticion in iterador_peticiones:
+                self.agregar_mensaje(datos, peticion)
+        except ValueError as e:
+            error = str(e)
+        
+        yield from self.ordenar_flujo(datos, error)
+    
+    def ordenar_particion(self, replica, indice, particion, kind):
+        """
+        Ordena una partición en una réplica de P4 con SortStream y devuelve
+        (ordenada, nodo). Si la réplica falla o no termina en PLAZO_PARTICION
+        segundos, la partición se ordena aquí.
+        """
+        if replica is None or not len(particion):
+            try:
+                ordenada, _ = self.ordenar_arreglo(particion.copy(), self.KINDS_NUMPY[kind])
+            except ValueError:
+                ordenada = np.sort(particion)
+            return ordenada, self.id_proceso
         
-        return services_pb2.MessageResponse(
-            status="ACK",
-            timestamp=self.reloj.obtener_tiempo()
+        host, puerto = separar_endpoint(replica)
+        # El anuncio por MessageService deja el intercambio en la traza de Lamport de ambos procesos
+        tiempo = self.reloj.incrementar()
+        # La réplica tiene el mismo id lógico que este proceso; el endpoint solo sirve para llegar a ella
+        Bitacora.registrar("SEND", 
+                          f"{self.id_proceso} -> {replica} partición {indice} ({len(particion)} valores)",
+                          tiempo, par=self.id_proceso)
+        timestamp_recibido = enviar_mensaje_a_proceso(
+            self.pool, self.id_proceso, self.id_proceso,
+            f"ORDENAMIENTO_DISTRIBUIDO partición {indice} ({len(particion)} valores)",
+            tiempo, host, puerto
         )
+        tiempo = self.reloj.actualizar(timestamp_recibido)
+        
+        def mensajes():
+            for inicio in range(0, len(particion), VALORES_POR_FRAGMENTO):
+                yield services_pb2.SortRequest(
+                    sender_id=self.id_proceso,
+                    timestamp=tiempo,
+                    kind=kind,
+                    packed_values=particion[inicio:inicio + VALORES_POR_FRAGMENTO].tobytes(),
+                    dtype=particion.dtype.str
+                )
+        
+        partes = []
+        timestamp_maximo = 0
+        try:
+            cliente = self.pool.obtener_stub(host, puerto, services_pb2_grpc.SortServiceStub)
+            for fragmento in cliente.SortStream(mensajes(), timeout=PLAZO_PARTICION):
+                if fragmento.status != "OK":
+                    raise RuntimeError(fragmento.status)
+                partes.append(np.frombuffer(fragmento.packed_values, dtype=fragmento.dtype))
+                timestamp_maximo = max(timestamp_maximo, fragmento.timestamp)
+        except (grpc.RpcError, RuntimeError) as e:
+            self.pool.reportar_error(host, puerto, e)
+            print(f"[ERROR] Réplica {replica} no ordenó la partición {indice}: {e}")
+            return self.ordenar_particion(None, indice, particion, kind)
+        
+        tiempo = self.reloj.actualizar(timestamp_maximo)
+        Bitacora.registrar("RECEIVE", 
+                          f"{self.id_proceso} <- {replica} partición {indice} ordenada",
+                          tiempo, par=self.id_proceso)
+        return np.concatenate(partes), replica
+    
+    def ordenar_distribuido(self, datos, error=None):
+        """
+        Sample sort: elige separadores con una muestra, reparte los rangos entre
+        este proceso y las demás réplicas de P4 de la topología, y devuelve las particiones ordenadas en orden.
+        """
+        tiempo = self.reloj.actualizar(datos.timestamp_maximo)
+        Bitacora.registrar("RECEIVE", 
+                          f"{self.id_proceso} <- {datos.remitente} operacion=ORDENAR_DISTRIBUIDO({datos.cantidad} valores en {datos.num_mensajes} mensajes)",
+                          tiempo, par=datos.remitente)
+        
+        if error is None and datos.cantidad == 0:
+            error = "El flujo no contenía datos"
+        if error is not None:
+            yield services_pb2.SortChunk(timestamp=tiempo, status=f"ERROR: {error}")
+            return
+        
+        arreglo = np.concatenate(datos.bloques)
+        datos.bloques.clear()
+        nodos = [None] + obtener_topologia().replicas(self.id_proceso)  # None: la partición se ordena en este proceso
+        separadores = elegir_separadores(arreglo, len(nodos))
+        particiones = particionar(arreglo, separadores)
+        del arreglo
+        tiempo = self.reloj.incrementar()
+        Bitacora.registrar("INTERNAL", 
+                          f"{self.id_proceso} repartió {datos.cantidad} valores en particiones de {[len(p) for p in particiones]}",
+                          tiempo)
+        
+        algoritmo = f"distribuido(sample sort en {len(nodos)} nodos)"
+        posicion = 0
+        with futures.ThreadPoolExecutor(max_workers=len(nodos)) as hilos:
+            tareas = [hilos.submit(self.ordenar_particion, nodo, indice, particion, datos.kind)
+                      for indice, (nodo, particion) in enumerate(zip(nodos, particiones))]
+            del particiones
+            # Las particiones se envían en orden mientras las siguientes aún se ordenan
+            for indice, tarea in enumerate(tareas):
+                ordenada, nodo = tarea.result()
+                tiempo = self.reloj.incrementar()
+                Bitacora.registrar("INTERNAL", 
+                                  f"{self.id_proceso} envía partición {indice} ({len(ordenada)} valores, ordenada en {nodo})",
+                                  tiempo)
+                yield from fragmentos_orden(ordenada, datos.codificacion, datos.cantidad,
+                                            algoritmo, tiempo, posicion)
+                posicion += len(ordenada)
+    
+    def DistributedSort(self, iterador_peticiones, contexto):
+        datos = DatosFlujo()
+        error = None
+        try:
+            for peticion in iterador_peticiones:
+                self.agregar_mensaje(datos, peticion, externo_permitido=False)
+        except ValueError as e:
+            error = str(e)
+        
+        yield from self.ordenar_distribuido(datos, error)
 
 
-def enviar_mensaje_a_proceso(id_origen, id_destino, mensaje, timestamp, host, puerto):
-    """Función para enviar mensaje a otro proceso"""
-    try:
-        canal = grpc.insecure_channel(f'{host}:{puerto}')
-        cliente = services_pb2_grpc.MessageServiceStub(canal)
+class ServicioOrdenamientoAsync(ServicioOrdenamiento):
+    """
+    Versión asíncrona (grpc.aio) del servicio de ordenamiento Quick Sort.
+    La lectura de los datos y los ordenamientos van al ejecutor de cálculo.
+    """
+    
+    async def QuickSort(self, peticion, contexto):
+        return await en_ejecutor(super().QuickSort, peticion, contexto)
+    
+    async def SortStream(self, iterador_peticiones, contexto):
+        datos = DatosFlujo()
+        error = None
+        try:
+            async for peticion in iterador_peticiones:
+                await en_ejecutor(self.agregar_mensaje, datos, peticion)
+        except ValueError as e:
+            error = str(e)
         
-        peticion = services_pb2.MessageRequest(
-            sender_id=id_origen,
-            receiver_id=id_destino,
-            message=mensaje,
-            timestamp=timestamp
-        )
+        async for fragmento in iterar_en_ejecutor(self.ordenar_flujo(datos, error)):
+            yield fragmento
+    
+    async def DistributedSort(self, iterador_peticiones, contexto):
+        datos = DatosFlujo()
+        error = None
+        try:
+            async for peticion in iterador_peticiones:
+                await en_ejecutor(self.agregar_mensaje, datos, peticion, externo_permitido=False)
+        except ValueError as e:
+            error = str(e)
         
-        respuesta = cliente.SendMessage(peticion, timeout=5.0)
-        return respuesta.timestamp
-    except Exception as e:
-        print(f"[ERROR] No se pudo enviar mensaje a {id_destino}: {e}")
-        return timestamp
+        async for fragmento in iterar_en_ejecutor(self.ordenar_distribuido(datos, error)):
+            yield fragmento
 
 
-def tarea_proceso4(id_proceso, reloj):
+def tarea_proceso4(id_proceso, reloj, pool):
     """
     Tarea específica del Proceso 4:
     1. Evento interno: Ordenar 100 números aleatorios (0 a 100) usando Quick Sort
@@ -135,38 +437,26 @@ def tarea_proceso4(id_proceso, reloj):
     time.sleep(5)
     
     # 1. EVENTO INTERNO: Ordenar 100 números aleatorios (0-100) con Quick Sort
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     numeros = [random.randint(0, 100) for _ in range(100)]
-    
-    # Función Quick Sort interna
-    def quick_sort_local(arr):
-        if len(arr) <= 1:
-            return arr
-        pivote = arr[len(arr) // 2]
-        menores = [x for x in arr if x < pivote]
-        iguales = [x for x in arr if x == pivote]
-        mayores = [x for x in arr if x > pivote]
-        return quick_sort_local(menores) + iguales + quick_sort_local(mayores)
-    
-    numeros_ordenados = quick_sort_local(numeros.copy())
+    numeros_ordenados, _ = ordenar(numeros)
     
     Bitacora.registrar("INTERNAL", 
                       f"{id_proceso} ordenó 100 números (0-100) con Quick Sort, primeros 5: {numeros_ordenados[:5]}, últimos 5: {numeros_ordenados[-5:]}",
-                      reloj.obtener_tiempo())
+                      tiempo)
     
     time.sleep(1)
     
     # 2. ENVIAR MENSAJE A P2
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     Bitacora.registrar("SEND", 
                       f"{id_proceso} -> P2_AVG mensaje='Hola P2, ordenamiento completado'",
-                      reloj.obtener_tiempo())
+                      tiempo, par="P2_AVG")
     
     timestamp_recibido = enviar_mensaje_a_proceso(
-        id_proceso, "P2_AVG", 
+        pool, id_proceso, "P2_AVG", 
         f"Hola P2, ordenamiento completado: {len(numeros_ordenados)} números",
-        reloj.obtener_tiempo(),
-        "proceso2", 50052
+        tiempo
     )
     
     reloj.actualizar(timestamp_recibido)
@@ -175,33 +465,15 @@ def tarea_proceso4(id_proceso, reloj):
     print(f"[INFO] {id_proceso} esperando mensaje de P5...")
 
 
+def agregar_servicios(servidor, id_proceso, reloj, pool, aio):
+    """Registra SortService; MessageService y BroadcastService los agrega servidor_proceso"""
+    servicio = ServicioOrdenamientoAsync if aio else ServicioOrdenamiento
+    services_pb2_grpc.add_SortServiceServicer_to_server(servicio(id_proceso, reloj, pool), servidor)
+
+
 def iniciar_servidor():
     """Función principal que inicia el servidor gRPC"""
-    id_proceso = "P4_SORT"
-    reloj = RelojLamport()
-    
-    servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    
-    services_pb2_grpc.add_SortServiceServicer_to_server(
-        ServicioOrdenamiento(id_proceso, reloj), servidor
-    )
-    services_pb2_grpc.add_MessageServiceServicer_to_server(
-        ServicioMensajes(id_proceso, reloj), servidor
-    )
-    
-    servidor.add_insecure_port('[::]:50054')
-    servidor.start()
-    
-    print(f"{id_proceso} servidor iniciado en puerto 50054")
-    Bitacora.registrar("INTERNAL", f"{id_proceso} inicializado", reloj.obtener_tiempo())
-    
-    threading.Thread(target=tarea_proceso4, args=(id_proceso, reloj), daemon=True).start()
-    
-    try:
-        servidor.wait_for_termination()
-    except KeyboardInterrupt:
-        print(f"\n{id_proceso} detenido")
-        servidor.stop(0)
+    ejecutar_proceso("P4_SORT", agregar_servicios, tarea_proceso4)
 
 
 if __name__ == '__main__':
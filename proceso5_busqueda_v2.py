@@ -4,141 +4,247 @@ Este proceso:
 1. Recibe mensaje de P3
 2. Evento interno: Encontrar los números "3, 22 y 50" de 200 números aleatorios (0 a 100) usando búsqueda lineal
 3. Envía mensaje a P4
+
+LinearSearch también busca objetivos y datos enviados por el cliente, y
+SearchStream recibe los datos en un flujo; esas búsquedas son vectorizadas
+con NumPy (motor_busqueda.buscar_objetivos_numpy).
 """
 
-import grpc
-from concurrent import futures
+from functools import partial
+import os
 import time
 import random
+import numpy as np
 import services_pb2
 import services_pb2_grpc
 import threading
+from bitacora import Bitacora
+from servidor_proceso import ejecutar_proceso, en_ejecutor, enviar_mensaje_a_proceso
+from forma_respuesta import incluir_entrada, resumir
+from motor_busqueda import buscar, buscar_objetivos_numpy
+
+# Datos del cliente: máximo de valores por búsqueda y de objetivos por petición
+TAMANO_MAXIMO_BUSQUEDA = int(os.environ.get("TAMANO_MAXIMO_BUSQUEDA", str(5 * 10**8)))
+OBJETIVOS_MAXIMOS = 10**6
+TIPOS_BUSQUEDA = {"<i8": np.int64, "<f8": np.float64}
+
+# Con más objetivos que estos, la bitácora lleva un resumen en vez de una línea por objetivo
+OBJETIVOS_EN_BITACORA = 10
+
 
-class RelojLamport:
-    """Reloj de Lamport con thread-safety"""
+class DatosBusqueda:
+    """Objetivos y bloques de datos recibidos del cliente, todavía sin buscar"""
     def __init__(self):
-        self.tiempo = 0
-        self.lock = threading.Lock()
-    
-    def incrementar(self):
-        with self.lock:
-            self.tiempo += 1
-            return self.tiempo
-    
-    def actualizar(self, tiempo_recibido):
-        with self.lock:
-            self.tiempo = max(self.tiempo, tiempo_recibido) + 1
-            return self.tiempo
-    
-    def obtener_tiempo(self):
-        with self.lock:
-            return self.tiempo
+        self.bloques = []
+        self.cantidad = 0
+        self.tipo = None          # dtype del primer bloque con datos
+        self.objetivos = []
+        self.estrategia = services_pb2.LINEAR_SEARCH
+        self.response_shape = services_pb2.FULL
+        self.remitente = ""
+        self.num_mensajes = 0
+        self.timestamp_maximo = 0
 
 
-class Bitacora:
-    """Sistema de registro de eventos"""
-    @staticmethod
-    def registrar(tipo_evento, detalles, valor_reloj):
-        marca_temporal = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{marca_temporal}] [{tipo_evento}] {detalles} clock={valor_reloj}")
+def resultado_busqueda(objetivo, posicion):
+    encontrado = posicion != -1
+    resultado = services_pb2.SearchResult(position=posicion if encontrado else -1, found=encontrado)
+    if isinstance(objetivo, float):
+        resultado.double_value = objetivo
+    else:
+        resultado.value = objetivo
+    return resultado
 
 
 class ServicioBusqueda(services_pb2_grpc.SearchServiceServicer):
     """Implementación del servicio de búsqueda lineal"""
     
+    # SearchStrategy del proto -> estrategia de motor_busqueda
+    ESTRATEGIAS = {
+        services_pb2.LINEAR_SEARCH: "lineal",
+        services_pb2.INDEX_SEARCH: "indice",
+        services_pb2.BINARY_SEARCH: "binaria",
+        services_pb2.AUTO_SEARCH: "auto",
+    }
+    
     def __init__(self, id_proceso, reloj):
         self.id_proceso = id_proceso
         self.reloj = reloj
         self.numeros_objetivo = [3, 22, 50]
     
-    def busqueda_lineal(self, arr, objetivo):
-        for i, valor in enumerate(arr):
-            if valor == objetivo:
-                return i
-        return -1
+    def objetivos_peticion(self, peticion):
+        """Objetivos de un mensaje; ValueError si son demasiados"""
+        objetivos = list(peticion.targets) + list(peticion.double_targets)
+        if len(objetivos) > OBJETIVOS_MAXIMOS:
+            raise ValueError(f"se pueden buscar a lo más {OBJETIVOS_MAXIMOS} objetivos")
+        return objetivos
+    
+    def registrar_resultados(self, objetivos, posiciones, estrategia, cantidad):
+        """Evento interno de la búsqueda: una línea por objetivo o un resumen si son muchos"""
+        if len(objetivos) > OBJETIVOS_EN_BITACORA:
+            tiempo = self.reloj.incrementar()
+            encontrados = sum(1 for posicion in posiciones if posicion != -1)
+            Bitacora.registrar("INTERNAL", 
+                              f"{self.id_proceso} buscó {len(objetivos)} objetivos en {cantidad} valores con {estrategia}: {encontrados} encontrados",
+                              tiempo)
+            return tiempo
+        
+        tiempo = self.reloj.obtener_tiempo()
+        for objetivo, posicion in zip(objetivos, posiciones):
+            tiempo = self.reloj.incrementar()
+            estado = "ENCONTRADO" if posicion != -1 else "NO ENCONTRADO"
+            pos_texto = f"posición={posicion}" if posicion != -1 else "no existe"
+            Bitacora.registrar("INTERNAL", 
+                              f"{self.id_proceso} buscó {objetivo} con {estrategia}: {estado} ({pos_texto})",
+                              tiempo)
+        return tiempo
+    
+    def agregar_mensaje(self, datos, peticion):
+        """Agrega los objetivos y valores de un mensaje; ValueError si no son válidos"""
+        if datos.num_mensajes == 0:
+            datos.estrategia = peticion.strategy
+            datos.response_shape = peticion.response_shape
+        datos.remitente = datos.remitente or peticion.sender_id
+        datos.num_mensajes += 1
+        datos.timestamp_maximo = max(datos.timestamp_maximo, peticion.timestamp)
+        datos.objetivos.extend(self.objetivos_peticion(peticion))
+        if len(datos.objetivos) > OBJETIVOS_MAXIMOS:
+            raise ValueError(f"se pueden buscar a lo más {OBJETIVOS_MAXIMOS} objetivos")
+        
+        if peticion.packed_values:
+            tipo = TIPOS_BUSQUEDA.get(peticion.dtype)
+            if tipo is None:
+                raise ValueError(f"dtype no soportado: {peticion.dtype!r}")
+            if len(peticion.packed_values) % np.dtype(tipo).itemsize:
+                raise ValueError(f"packed_values no es múltiplo del tamaño de {peticion.dtype}")
+            # Vista directa sobre los bytes recibidos
+            bloque = np.frombuffer(peticion.packed_values, dtype=tipo)
+        elif len(peticion.int_values):
+            bloque = np.fromiter(peticion.int_values, dtype=np.int64, count=len(peticion.int_values))
+        elif len(peticion.double_values):
+            bloque = np.fromiter(peticion.double_values, dtype=np.float64, count=len(peticion.double_values))
+        else:
+            return
+        
+        if datos.tipo not in (None, bloque.dtype):
+            raise ValueError("el flujo mezcla tipos de datos")
+        datos.tipo = bloque.dtype
+        datos.cantidad += len(bloque)
+        if datos.cantidad > TAMANO_MAXIMO_BUSQUEDA:
+            raise ValueError(f"los datos superan los {TAMANO_MAXIMO_BUSQUEDA} valores")
+        datos.bloques.append(bloque)
+    
+    def buscar_datos(self, datos, error=None):
+        """Busca los objetivos en los datos recibidos del cliente"""
+        tiempo = self.reloj.actualizar(datos.timestamp_maximo)
+        Bitacora.registrar("RECEIVE", 
+                          f"{self.id_proceso} <- {datos.remitente} operacion=BUSQUEDA({len(datos.objetivos)} objetivos en {datos.cantidad} valores, {datos.num_mensajes} mensajes)",
+                          tiempo, par=datos.remitente)
+        
+        estrategia = self.ESTRATEGIAS.get(datos.estrategia)
+        if error is None and estrategia is None:
+            error = f"Estrategia desconocida ({datos.estrategia})"
+        if error is not None:
+            return services_pb2.SearchResponse(timestamp=tiempo, status=f"ERROR: {error}")
+        
+        objetivos = datos.objetivos or self.numeros_objetivo
+        arreglo = np.concatenate(datos.bloques) if datos.bloques else np.empty(0, dtype=np.int64)
+        datos.bloques.clear()
+        # Enteros y reales se buscan por separado, sin pasar los enteros a float64
+        posiciones, metodo = buscar_objetivos_numpy(arreglo, objetivos, estrategia)
+        posiciones = posiciones.tolist()
+        tiempo = self.registrar_resultados(objetivos, posiciones, metodo, len(arreglo))
+        
+        # El cliente ya tiene sus datos: la respuesta nunca los devuelve
+        respuesta = services_pb2.SearchResponse(
+            results=[resultado_busqueda(objetivo, posicion) for objetivo, posicion in zip(objetivos, posiciones)],
+            timestamp=tiempo,
+            strategy=metodo,
+            status="OK"
+        )
+        if datos.response_shape == services_pb2.SUMMARY:
+            respuesta.summary.CopyFrom(resumir(arreglo))
+        return respuesta
     
     def LinearSearch(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
+        if peticion.packed_values or len(peticion.int_values) or len(peticion.double_values):
+            datos = DatosBusqueda()
+            error = None
+            try:
+                self.agregar_mensaje(datos, peticion)
+            except ValueError as e:
+                error = str(e)
+            return self.buscar_datos(datos, error)
+        
+        estrategia = self.ESTRATEGIAS.get(peticion.strategy)
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        try:
+            objetivos = self.objetivos_peticion(peticion) or self.numeros_objetivo
+        except ValueError as e:
+            objetivos, error = [], str(e)
+        else:
+            error = None if estrategia is not None else f"Estrategia desconocida ({peticion.strategy})"
         Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} operacion=BUSQUEDA_LINEAL([3, 22, 50])",
-                          self.reloj.obtener_tiempo())
+                          f"{self.id_proceso} <- {peticion.sender_id} operacion=BUSQUEDA({len(objetivos)} objetivos, {estrategia})",
+                          tiempo, par=peticion.sender_id)
         
-        self.reloj.incrementar()
+        if error is not None:
+            return services_pb2.SearchResponse(timestamp=tiempo, status=f"ERROR: {error}")
+        
+        tiempo = self.reloj.incrementar()
         numeros = [random.randint(0, 100) for _ in range(200)]
         Bitacora.registrar("INTERNAL", 
                           f"{self.id_proceso} generó 200 números aleatorios",
-                          self.reloj.obtener_tiempo())
+                          tiempo)
         
-        resultados = []
-        for objetivo in self.numeros_objetivo:
-            self.reloj.incrementar()
-            posicion = self.busqueda_lineal(numeros, objetivo)
-            encontrado = posicion != -1
-            
-            resultado = services_pb2.SearchResult(
-                value=objetivo,
-                position=posicion if encontrado else -1,
-                found=encontrado
-            )
-            resultados.append(resultado)
-            
-            estado = "ENCONTRADO" if encontrado else "NO ENCONTRADO"
-            pos_texto = f"posición={posicion}" if encontrado else "no existe"
-            Bitacora.registrar("INTERNAL", 
-                              f"{self.id_proceso} buscó {objetivo}: {estado} ({pos_texto})",
-                              self.reloj.obtener_tiempo())
+        # Todos los objetivos se resuelven juntos: con "indice" la lista se recorre una sola vez
+        posiciones, estrategia = buscar(numeros, objetivos, estrategia)
+        tiempo = self.registrar_resultados(objetivos, posiciones, estrategia, len(numeros))
+        resultados = [resultado_busqueda(objetivo, posicion) for objetivo, posicion in zip(objetivos, posiciones)]
         
-        return services_pb2.SearchResponse(
-            numbers=numeros,
-            results=resultados,
-            timestamp=self.reloj.obtener_tiempo()
-        )
-
-
-class ServicioMensajes(services_pb2_grpc.MessageServiceServicer):
-    """Servicio para recibir mensajes de otros procesos"""
-    
-    def __init__(self, id_proceso, reloj, evento_recibido):
-        self.id_proceso = id_proceso
-        self.reloj = reloj
-        self.evento_recibido = evento_recibido
+        # Los resultados de la búsqueda van con cualquier forma de respuesta
+        respuesta = services_pb2.SearchResponse(results=resultados, timestamp=tiempo,
+                                                strategy=estrategia, status="OK")
+        if incluir_entrada(peticion):
+            respuesta.numbers.extend(numeros)
+        elif peticion.response_shape == services_pb2.SUMMARY:
+            respuesta.summary.CopyFrom(resumir(numeros))
+        return respuesta
     
-    def SendMessage(self, peticion, contexto):
-        self.reloj.actualizar(peticion.timestamp)
-        Bitacora.registrar("RECEIVE", 
-                          f"{self.id_proceso} <- {peticion.sender_id} mensaje='{peticion.message}'",
-                          self.reloj.obtener_tiempo())
+    def SearchStream(self, iterador_peticiones, contexto):
+        datos = DatosBusqueda()
+        error = None
+        try:
+            for peticion in iterador_peticiones:
+                self.agregar_mensaje(datos, peticion)
+        except ValueError as e:
+            error = str(e)
         
-        # Señalar que recibimos el mensaje de P3
-        self.evento_recibido.set()
-        
-        return services_pb2.MessageResponse(
-            status="ACK",
-            timestamp=self.reloj.obtener_tiempo()
-        )
+        return self.buscar_datos(datos, error)
 
 
-def enviar_mensaje_a_proceso(id_origen, id_destino, mensaje, timestamp, host, puerto):
-    """Función para enviar mensaje a otro proceso"""
-    try:
-        canal = grpc.insecure_channel(f'{host}:{puerto}')
-        cliente = services_pb2_grpc.MessageServiceStub(canal)
-        
-        peticion = services_pb2.MessageRequest(
-            sender_id=id_origen,
-            receiver_id=id_destino,
-            message=mensaje,
-            timestamp=timestamp
-        )
+class ServicioBusquedaAsync(ServicioBusqueda):
+    """
+    Versión asíncrona (grpc.aio) del servicio de búsqueda lineal.
+    La lectura de los datos y las búsquedas van al ejecutor de cálculo.
+    """
+    
+    async def LinearSearch(self, peticion, contexto):
+        return await en_ejecutor(super().LinearSearch, peticion, contexto)
+    
+    async def SearchStream(self, iterador_peticiones, contexto):
+        datos = DatosBusqueda()
+        error = None
+        try:
+            async for peticion in iterador_peticiones:
+                await en_ejecutor(self.agregar_mensaje, datos, peticion)
+        except ValueError as e:
+            error = str(e)
         
-        respuesta = cliente.SendMessage(peticion, timeout=5.0)
-        return respuesta.timestamp
-    except Exception as e:
-        print(f"[ERROR] No se pudo enviar mensaje a {id_destino}: {e}")
-        return timestamp
+        return await en_ejecutor(self.buscar_datos, datos, error)
 
 
-def tarea_proceso5(id_proceso, reloj, evento_recibido):
+def tarea_proceso5(id_proceso, reloj, pool, evento_recibido):
     """
     Tarea específica del Proceso 5:
     1. Recibe mensaje de P3 (espera)
@@ -152,71 +258,49 @@ def tarea_proceso5(id_proceso, reloj, evento_recibido):
     time.sleep(1)
     
     # 2. EVENTO INTERNO: Búsqueda lineal de 3, 22 y 50 en 200 números (0-100)
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     numeros = [random.randint(0, 100) for _ in range(200)]
     objetivos = [3, 22, 50]
     
     # Búsqueda lineal
+    posiciones, _ = buscar(numeros, objetivos, "lineal")
     resultados = []
-    for objetivo in objetivos:
-        posicion = -1
-        for i, valor in enumerate(numeros):
-            if valor == objetivo:
-                posicion = i
-                break
+    for objetivo, posicion in zip(objetivos, posiciones):
         encontrado = "ENCONTRADO" if posicion != -1 else "NO ENCONTRADO"
         resultados.append(f"{objetivo}:{encontrado}(pos={posicion})" if posicion != -1 else f"{objetivo}:{encontrado}")
     
     Bitacora.registrar("INTERNAL", 
                       f"{id_proceso} buscó [3, 22, 50] en 200 números (0-100) con búsqueda lineal: {', '.join(resultados)}",
-                      reloj.obtener_tiempo())
+                      tiempo)
     
     time.sleep(1)
     
     # 3. ENVIAR MENSAJE A P4
-    reloj.incrementar()
+    tiempo = reloj.incrementar()
     Bitacora.registrar("SEND", 
                       f"{id_proceso} -> P4_SORT mensaje='Hola P4, búsqueda completada'",
-                      reloj.obtener_tiempo())
+                      tiempo, par="P4_SORT")
     
     timestamp_recibido = enviar_mensaje_a_proceso(
-        id_proceso, "P4_SORT", 
+        pool, id_proceso, "P4_SORT", 
         f"Hola P4, búsqueda completada",
-        reloj.obtener_tiempo(),
-        "proceso4", 50054
+        tiempo
     )
     
     reloj.actualizar(timestamp_recibido)
 
 
+def agregar_servicios(servidor, id_proceso, reloj, pool, aio):
+    """Registra SearchService; MessageService y BroadcastService los agrega servidor_proceso"""
+    servicio = ServicioBusquedaAsync if aio else ServicioBusqueda
+    services_pb2_grpc.add_SearchServiceServicer_to_server(servicio(id_proceso, reloj), servidor)
+
+
 def iniciar_servidor():
     """Función principal que inicia el servidor gRPC"""
-    id_proceso = "P5_SEARCH"
-    reloj = RelojLamport()
     evento_recibido = threading.Event()
-    
-    servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    
-    services_pb2_grpc.add_SearchServiceServicer_to_server(
-        ServicioBusqueda(id_proceso, reloj), servidor
-    )
-    services_pb2_grpc.add_MessageServiceServicer_to_server(
-        ServicioMensajes(id_proceso, reloj, evento_recibido), servidor
-    )
-    
-    servidor.add_insecure_port('[::]:50055')
-    servidor.start()
-    
-    print(f"{id_proceso} servidor iniciado en puerto 50055")
-    Bitacora.registrar("INTERNAL", f"{id_proceso} inicializado", reloj.obtener_tiempo())
-    
-    threading.Thread(target=tarea_proceso5, args=(id_proceso, reloj, evento_recibido), daemon=True).start()
-    
-    try:
-        servidor.wait_for_termination()
-    except KeyboardInterrupt:
-        print(f"\n{id_proceso} detenido")
-        servidor.stop(0)
+    ejecutar_proceso("P5_SEARCH", agregar_servicios, partial(tarea_proceso5, evento_recibido=evento_recibido),
+                     evento_recibido=evento_recibido)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,104 @@
+"""
+RELOJ DE LAMPORT COMPARTIDO
+Implementaciones del reloj lógico usadas por los cinco procesos.
+- RelojLamport: un solo contador protegido por un lock. incrementar() y
+  actualizar() devuelven el valor posterior al evento en la misma
+  adquisición del lock, así que no hace falta llamar a obtener_tiempo()
+  después (y no se puede leer un valor que otro hilo ya adelantó).
+- RelojLamportFragmentado: reparte el contador en fragmentos con su propio
+  lock para servidores con muchos hilos concurrentes. Los tiempos siguen
+  siendo únicos dentro del proceso.
+El modo se elige con la variable de entorno MODO_RELOJ ("simple" o "fragmentado").
+"""
+
+import itertools
+import os
+import threading
+
+
+class RelojLamport:
+    """Reloj de Lamport con thread-safety"""
+    def __init__(self):
+        self.tiempo = 0
+        self.lock = threading.Lock()
+
+    def incrementar(self):
+        """Evento interno o envío: devuelve el nuevo valor del reloj"""
+        with self.lock:
+            self.tiempo += 1
+            return self.tiempo
+
+    def actualizar(self, tiempo_recibido):
+        """Recepción: max(local, recibido) + 1, devuelve el nuevo valor del reloj"""
+        with self.lock:
+            self.tiempo = max(self.tiempo, tiempo_recibido) + 1
+            return self.tiempo
+
+    def obtener_tiempo(self):
+        with self.lock:
+            return self.tiempo
+
+
+class RelojLamportFragmentado:
+    """
+    Reloj de Lamport repartido en fragmentos.
+    Cada hilo trabaja siempre sobre el mismo fragmento (guardado en un
+    threading.local) y solo toma su lock. Un evento parte del máximo de todos
+    los fragmentos, así que sigue siendo mayor que cualquier evento anterior
+    visible en el proceso; el tiempo del proceso es ese máximo.
+    Como el máximo se lee sin los locks de los demás fragmentos, dos hilos
+    pueden partir del mismo valor. Para que los tiempos no se repitan dentro
+    del proceso (orden_total los usa como identificador junto con el id del
+    proceso), el fragmento i solo entrega valores congruentes con i módulo el
+    número de fragmentos: el siguiente tiempo es el menor de esos valores que
+    supera al máximo. Saltar más de una unidad es válido en Lamport.
+    """
+    def __init__(self, num_fragmentos=8):
+        self.fragmentos = [0] * num_fragmentos
+        self.locks = [threading.Lock() for _ in range(num_fragmentos)]
+        self.siguiente_indice = itertools.count()
+        self.lock_indices = threading.Lock()
+        self.local = threading.local()
+
+    def _indice(self):
+        indice = getattr(self.local, "indice", None)
+        if indice is None:
+            with self.lock_indices:
+                indice = next(self.siguiente_indice) % len(self.fragmentos)
+            self.local.indice = indice
+        return indice
+
+    def _siguiente(self, indice, base):
+        """Menor tiempo mayor que base que le corresponde al fragmento"""
+        return base + 1 + (indice - base - 1) % len(self.fragmentos)
+
+    def incrementar(self):
+        indice = self._indice()
+        with self.locks[indice]:
+            tiempo = self._siguiente(indice, max(self.fragmentos))
+            self.fragmentos[indice] = tiempo
+            return tiempo
+
+    def actualizar(self, tiempo_recibido):
+        indice = self._indice()
+        with self.locks[indice]:
+            tiempo = self._siguiente(indice, max(max(self.fragmentos), tiempo_recibido))
+            self.fragmentos[indice] = tiempo
+            return tiempo
+
+    def obtener_tiempo(self):
+        # Todos los locks, siempre en el mismo orden, para leer un máximo consistente
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            return max(self.fragmentos)
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
+
+def crear_reloj():
+    """Crea el reloj indicado por MODO_RELOJ (por defecto "simple")"""
+    if os.environ.get("MODO_RELOJ", "simple") == "fragmentado":
+        return RelojLamportFragmentado(int(os.environ.get("FRAGMENTOS_RELOJ", "8")))
+    return RelojLamport()
@@ -0,0 +1,106 @@
+"""
+RELOJ VECTORIAL Y COLA DE RETENCIÓN CAUSAL
+Difusión con orden causal (Birman-Schiper-Stephenson): la entrada k del
+vector de un proceso es cuántas difusiones causales de k ya entregó.
+- Al difundir, el proceso i suma 1 a su entrada y manda una copia del vector.
+- El receptor entrega el mensaje de i con vector M cuando M[i] == V[i] + 1
+  (es el siguiente de i) y M[k] <= V[k] para todo k != i (ya entregó todo
+  lo que i había visto). Si no, lo guarda en la cola de retención.
+- La cola está indexada por remitente y número de secuencia (M[i]): tras
+  cada entrega solo se revisa el siguiente mensaje de cada remitente.
+
+En el cable el vector va como diferencias entre entradas consecutivas
+(repeated sint64, empaquetado y en zigzag): los contadores de procesos
+parecidos difieren poco, así que cada entrada ocupa uno o dos bytes aunque
+los contadores crezcan, y el tamaño escala con el número de procesos.
+"""
+
+import threading
+from itertools import accumulate
+
+
+def codificar_vector(vector):
+    """Diferencias entre entradas consecutivas (la primera contra 0)"""
+    return [valor - anterior for anterior, valor in zip([0] + vector[:-1], vector)]
+
+
+def decodificar_vector(diferencias):
+    return list(accumulate(diferencias))
+
+
+class ColaCausal:
+    """Reloj vectorial de un proceso y su cola de retención de difusiones causales"""
+
+    def __init__(self, procesos, id_proceso, maximo_retenidos=10000):
+        # Todos los procesos deben usar la misma lista, en el mismo orden
+        self.procesos = sorted(procesos)
+        self.indices = {id_p: indice for indice, id_p in enumerate(self.procesos)}
+        self.propio = self.indices[id_proceso]
+        self.vector = [0] * len(self.procesos)
+        self.retenidos = {}  # índice del remitente -> {secuencia: (vector, contenido)}
+        self.num_retenidos = 0
+        self.maximo_retenidos = maximo_retenidos
+        self.lock = threading.Lock()
+
+    def preparar_envio(self):
+        """Nueva difusión propia: devuelve su vector (ya entregada localmente)"""
+        with self.lock:
+            self.vector[self.propio] += 1
+            return list(self.vector)
+
+    def entregados_de(self, remitente):
+        """Cuántas difusiones de remitente se entregaron aquí"""
+        with self.lock:
+            return self.vector[self.indices[remitente]]
+
+    def _entregable(self, remitente, vector):
+        return (vector[remitente] == self.vector[remitente] + 1
+                and all(valor <= self.vector[k] for k, valor in enumerate(vector) if k != remitente))
+
+    def recibir(self, remitente, vector, contenido):
+        """
+        Registra una difusión recibida. Devuelve la lista de (remitente,
+        secuencia, contenido) que quedan entregados, en orden causal (vacía
+        si el mensaje quedó retenido), o None si ya se había recibido.
+        ValueError si el mensaje no es válido o la cola está llena.
+        """
+        if remitente not in self.indices:
+            raise ValueError(f"proceso desconocido: {remitente}")
+        if len(vector) != len(self.procesos):
+            raise ValueError(f"el vector tiene {len(vector)} entradas y hay {len(self.procesos)} procesos")
+        indice = self.indices[remitente]
+        secuencia = vector[indice]
+
+        with self.lock:
+            if secuencia <= self.vector[indice] or secuencia in self.retenidos.get(indice, {}):
+                return None  # duplicado (p. ej. una retransmisión)
+            if not self._entregable(indice, vector):
+                if self.num_retenidos >= self.maximo_retenidos:
+                    raise ValueError("la cola de retención causal está llena")
+                self.retenidos.setdefault(indice, {})[secuencia] = (vector, contenido)
+                self.num_retenidos += 1
+                return []
+
+            entregados = [(remitente, secuencia, contenido)]
+            self.vector[indice] = secuencia
+            # Cada entrega puede liberar el siguiente mensaje de cualquier remitente
+            hubo_entrega = True
+            while hubo_entrega and self.num_retenidos:
+                hubo_entrega = False
+                for otro, pendientes in list(self.retenidos.items()):
+                    siguiente = pendientes.get(self.vector[otro] + 1)
+                    if siguiente is None or not self._entregable(otro, siguiente[0]):
+                        continue
+                    del pendientes[self.vector[otro] + 1]
+                    if not pendientes:
+                        del self.retenidos[otro]
+                    self.num_retenidos -= 1
+                    self.vector[otro] += 1
+                    entregados.append((self.procesos[otro], self.vector[otro], siguiente[1]))
+                    hubo_entrega = True
+            return entregados
+
+    def estado(self):
+        """(copia del vector, mensajes retenidos)"""
+        with self.lock:
+            return list(self.vector), self.num_retenidos
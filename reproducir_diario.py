@@ -0,0 +1,144 @@
+"""
+REPRODUCCIÓN DE LOS DIARIOS DE EVENTOS
+Une los diarios de P1-P5 (archivos .diario de diario_eventos.py) en el orden
+global de Lamport: por ejecución, luego por reloj y luego por id de proceso.
+Ese orden total es consistente con la relación "sucedió antes".
+Cada registro INICIO abre una ejecución nueva de su proceso (su reloj
+vuelve a 0), y las ejecuciones de los procesos se reúnen en ejecuciones
+globales recorriendo los INICIO de todos por hora de pared: un INICIO se
+suma a la ejecución global en curso, salvo que su proceso ya tenga una
+ejecución en ella, y entonces abre la siguiente. Así el reinicio de un
+proceso nunca se mezcla con su ejecución anterior y tampoco desalinea a
+los demás procesos, que siguen en la suya.
+
+El ordenamiento se hace con NumPy sobre los archivos mapeados en memoria,
+así que millones de eventos se ordenan en segundos; solo se leen los textos
+de los eventos que se imprimen.
+
+Uso:
+  python reproducir_diario.py diarios/*.diario
+  python reproducir_diario.py diarios/*.diario --resumen
+  python reproducir_diario.py diarios/*.diario --ejecucion 2
+"""
+
+import argparse
+import sys
+import numpy as np
+from diario_eventos import leer_diario, NOMBRES_TIPO, TIPOS_EVENTO
+
+def agrupar_inicios(procesos, horas):
+    """
+    Reúne los registros INICIO de todos los procesos (proceso y hora de pared
+    de cada uno) en ejecuciones globales: recorridos por hora, un INICIO abre
+    la ejecución siguiente si su proceso ya tiene una en la ejecución en
+    curso. Devuelve el número de ejecución (desde 1) de cada INICIO, en el
+    orden de entrada.
+    """
+    ejecuciones = np.zeros(len(horas), dtype=np.uint32)
+    ejecucion, presentes = 0, set()
+    for posicion in np.argsort(horas, kind='stable'):
+        if ejecucion == 0 or procesos[posicion] in presentes:
+            ejecucion += 1
+            presentes = set()
+        presentes.add(procesos[posicion])
+        ejecuciones[posicion] = ejecucion
+    return ejecuciones
+
+
+def unir_diarios(rutas):
+    """
+    Devuelve (procesos, registros, payloads, eventos) donde eventos es un arreglo
+    estructurado con el índice del proceso, la ejecución y el registro
+    original, ya ordenado por (ejecucion, reloj, proceso).
+    La ejecución es global (agrupar_inicios): cada INICIO de un proceso le
+    abre una ejecución propia, que comparte número con las de los demás
+    procesos que arrancaron con ella.
+    """
+    procesos, diarios, payloads, locales = [], [], [], []
+    for ruta in rutas:
+        id_proceso, registros, payload = leer_diario(ruta)
+        procesos.append(id_proceso)
+        diarios.append(registros)
+        payloads.append(payload)
+        # Cada registro INICIO abre una ejecución nueva del proceso
+        locales.append(np.cumsum(registros['tipo'] == TIPOS_EVENTO["INICIO"]))
+
+    horas_inicio = [diario['hora'][diario['tipo'] == TIPOS_EVENTO["INICIO"]] for diario in diarios]
+    procesos_inicio = [indice for indice, horas in enumerate(horas_inicio) for _ in range(len(horas))]
+    globales = agrupar_inicios(procesos_inicio, np.concatenate(horas_inicio) if horas_inicio else np.empty(0))
+
+    partes = []
+    desde = 0
+    for proceso, (registros, local, horas) in enumerate(zip(diarios, locales, horas_inicio)):
+        # Ejecución local k (desde 1) -> ejecución global de su INICIO; 0 antes del primero
+        mapa = np.concatenate(([0], globales[desde:desde + len(horas)])).astype(np.uint32)
+        desde += len(horas)
+
+        parte = np.empty(len(registros), dtype=[
+            ('proceso', 'u2'), ('ejecucion', 'u4'), ('indice', 'u8'), ('reloj', 'u8'),
+        ])
+        parte['proceso'] = proceso
+        parte['ejecucion'] = mapa[local]
+        parte['indice'] = np.arange(len(registros))
+        parte['reloj'] = registros['reloj']
+        partes.append(parte)
+
+    eventos = np.concatenate(partes) if partes else np.empty(0)
+    if len(eventos):
+        # Desempatar por nombre de proceso, no por el orden de los argumentos
+        rango = np.argsort(np.argsort(procesos)).astype(np.uint16)
+        orden = np.lexsort((rango[eventos['proceso']], eventos['reloj'], eventos['ejecucion']))
+        eventos = eventos[orden]
+    return procesos, diarios, payloads, eventos
+
+
+def imprimir_eventos(procesos, registros, payloads, eventos):
+    # Reunir las columnas de todos los eventos de una vez, por proceso
+    desplazamientos = np.empty(len(eventos), dtype=np.uint64)
+    longitudes = np.empty(len(eventos), dtype=np.uint32)
+    tipos = np.empty(len(eventos), dtype=np.uint8)
+    pares = np.empty(len(eventos), dtype='S16')
+    for proceso, diario in enumerate(registros):
+        mascara = eventos['proceso'] == proceso
+        seleccion = diario[eventos['indice'][mascara]]
+        desplazamientos[mascara] = seleccion['desplazamiento']
+        longitudes[mascara] = seleccion['longitud']
+        tipos[mascara] = seleccion['tipo']
+        pares[mascara] = seleccion['par']
+
+    lineas = []
+    for proceso, ejecucion, reloj, inicio, longitud, tipo_evento, par in zip(
+            eventos['proceso'].tolist(), eventos['ejecucion'].tolist(), eventos['reloj'].tolist(),
+            desplazamientos.tolist(), longitudes.tolist(), tipos.tolist(), pares.tolist()):
+        detalles = payloads[proceso][inicio:inicio + longitud].decode()
+        par = f" par={par.decode()}" if par else ""
+        lineas.append(f"[ejec={ejecucion}] [clock={reloj}] [{procesos[proceso]}] "
+                      f"[{NOMBRES_TIPO.get(tipo_evento, '?')}]{par} {detalles}\n")
+        if len(lineas) >= 65536:
+            sys.stdout.write("".join(lineas))
+            lineas = []
+    sys.stdout.write("".join(lineas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Une los diarios de eventos en orden de Lamport")
+    parser.add_argument('diarios', nargs='+', help="archivos .diario de cada proceso")
+    parser.add_argument('--ejecucion', type=int, help="mostrar solo esta ejecución (1, 2, ...)")
+    parser.add_argument('--resumen', action='store_true', help="mostrar solo conteos")
+    argumentos = parser.parse_args()
+
+    procesos, registros, payloads, eventos = unir_diarios(argumentos.diarios)
+    if argumentos.ejecucion is not None:
+        eventos = eventos[eventos['ejecucion'] == argumentos.ejecucion]
+
+    if argumentos.resumen:
+        print(f"{len(eventos)} eventos en orden global")
+        for indice, id_proceso in enumerate(procesos):
+            print(f"  {id_proceso}: {int(np.count_nonzero(eventos['proceso'] == indice))} eventos")
+        return
+
+    imprimir_eventos(procesos, registros, payloads, eventos)
+
+
+if __name__ == '__main__':
+    main()
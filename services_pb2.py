@@ -24,57 +24,105 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0eservices.proto\x12\x12\x64istributed_system\"O\n\x0bMathRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x0c\n\x04num1\x18\x02 \x01(\x01\x12\x0c\n\x04num2\x18\x03 \x01(\x01\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\"A\n\x0cMathResponse\x12\x0e\n\x06result\x18\x01 \x01(\x01\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\"6\n\x0e\x41verageRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\"F\n\x0f\x41verageResponse\x12\x0f\n\x07numbers\x18\x01 \x03(\x01\x12\x0f\n\x07\x61verage\x18\x02 \x01(\x01\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\"\x1b\n\tMatrix2x2\x12\x0e\n\x06values\x18\x01 \x03(\x01\"5\n\rMatrixRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\"\xb4\x01\n\x0eMatrixResponse\x12/\n\x08matrix_a\x18\x01 \x01(\x0b\x32\x1d.distributed_system.Matrix2x2\x12/\n\x08matrix_b\x18\x02 \x01(\x0b\x32\x1d.distributed_system.Matrix2x2\x12-\n\x06result\x18\x03 \x01(\x0b\x32\x1d.distributed_system.Matrix2x2\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\"3\n\x0bSortRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\"S\n\x0cSortResponse\x12\x18\n\x10original_numbers\x18\x01 \x03(\x05\x12\x16\n\x0esorted_numbers\x18\x02 \x03(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\"5\n\rSearchRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\">\n\x0cSearchResult\x12\r\n\x05value\x18\x01 \x01(\x05\x12\x10\n\x08position\x18\x02 \x01(\x05\x12\r\n\x05\x66ound\x18\x03 \x01(\x08\"g\n\x0eSearchResponse\x12\x0f\n\x07numbers\x18\x01 \x03(\x05\x12\x31\n\x07results\x18\x02 \x03(\x0b\x32 .distributed_system.SearchResult\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\"\\\n\x0eMessageRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x13\n\x0breceiver_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\"4\n\x0fMessageResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\"I\n\x10\x42roadcastRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\"L\n\x11\x42roadcastResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x65livered_to\x18\x02 \x03(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x32\xc2\x02\n\x0bMathService\x12H\n\x03\x41\x64\x64\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12M\n\x08Subtract\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12M\n\x08Multiply\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12K\n\x06\x44ivide\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse2m\n\x0e\x41verageService\x12[\n\x10\x43\x61lculateAverage\x12\".distributed_system.AverageRequest\x1a#.distributed_system.AverageResponse2j\n\rMatrixService\x12Y\n\x10MultiplyMatrices\x12!.distributed_system.MatrixRequest\x1a\".distributed_system.MatrixResponse2]\n\x0bSortService\x12N\n\tQuickSort\x12\x1f.distributed_system.SortRequest\x1a .distributed_system.SortResponse2f\n\rSearchService\x12U\n\x0cLinearSearch\x12!.distributed_system.SearchRequest\x1a\".distributed_system.SearchResponse2h\n\x0eMessageService\x12V\n\x0bSendMessage\x12\".distributed_system.MessageRequest\x1a#.distributed_system.MessageResponse2s\n\x10\x42roadcastService\x12_\n\x10\x42roadcastMessage\x12$.distributed_system.BroadcastRequest\x1a%.distributed_system.BroadcastResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0eservices.proto\x12\x12\x64istributed_system\"F\n\rResultSummary\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0b\n\x03min\x18\x02 \x01(\x01\x12\x0b\n\x03max\x18\x03 \x01(\x01\x12\x0c\n\x04mean\x18\x04 \x01(\x01\"\x85\x01\n\x0bMathRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x0c\n\x04num1\x18\x02 \x01(\x01\x12\x0c\n\x04num2\x18\x03 \x01(\x01\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\x12\x34\n\toperation\x18\x05 \x01(\x0e\x32!.distributed_system.MathOperation\"A\n\x0cMathResponse\x12\x0e\n\x06result\x18\x01 \x01(\x01\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\"\x8a\x01\n\x10MathBatchRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x34\n\toperation\x18\x02 \x01(\x0e\x32!.distributed_system.MathOperation\x12\x0c\n\x04num1\x18\x03 \x03(\x01\x12\x0c\n\x04num2\x18\x04 \x03(\x01\x12\x11\n\ttimestamp\x18\x05 \x01(\x05\"^\n\x11MathBatchResponse\x12\x0f\n\x07results\x18\x01 \x03(\x01\x12\x15\n\rerror_indices\x18\x02 \x03(\r\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x0e\n\x06status\x18\x04 \x01(\t\"\x9e\x01\n\x0e\x41verageRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x13\n\x0bsample_size\x18\x03 \x01(\x03\x12\x16\n\x0epacked_numbers\x18\x04 \x01(\x08\x12\x39\n\x0eresponse_shape\x18\x05 \x01(\x0e\x32!.distributed_system.ResponseShape\"\xa2\x01\n\x0f\x41verageResponse\x12\x0f\n\x07numbers\x18\x01 \x03(\x01\x12\x0f\n\x07\x61verage\x18\x02 \x01(\x01\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x16\n\x0enumbers_packed\x18\x04 \x01(\x0c\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x32\n\x07summary\x18\x06 \x01(\x0b\x32!.distributed_system.ResultSummary\"D\n\x0c\x41verageChunk\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x02 \x03(\x01\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\"\x98\x01\n\x11StatisticsSummary\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0c\n\x04mean\x18\x02 \x01(\x01\x12\x10\n\x08variance\x18\x03 \x01(\x01\x12\x17\n\x0fsample_variance\x18\x04 \x01(\x01\x12\x0b\n\x03min\x18\x05 \x01(\x01\x12\x0b\n\x03max\x18\x06 \x01(\x01\x12\x11\n\ttimestamp\x18\x07 \x01(\x05\x12\x0e\n\x06status\x18\x08 \x01(\t\"\x1b\n\tMatrix2x2\x12\x0e\n\x06values\x18\x01 \x03(\x01\"4\n\x06Matrix\x12\x0c\n\x04rows\x18\x01 \x01(\x05\x12\x0c\n\x04\x63ols\x18\x02 \x01(\x05\x12\x0e\n\x06values\x18\x03 \x03(\x01\"\xf7\x01\n\rMatMulRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12,\n\x08matrix_a\x18\x03 \x01(\x0b\x32\x1a.distributed_system.Matrix\x12,\n\x08matrix_b\x18\x04 \x01(\x0b\x32\x1a.distributed_system.Matrix\x12\x0c\n\x04rows\x18\x05 \x01(\x05\x12\r\n\x05inner\x18\x06 \x01(\x05\x12\x0c\n\x04\x63ols\x18\x07 \x01(\x05\x12\x39\n\x0eresponse_shape\x18\x08 \x01(\x0e\x32!.distributed_system.ResponseShape\"\xef\x01\n\x0eMatMulResponse\x12,\n\x08matrix_a\x18\x01 \x01(\x0b\x32\x1a.distributed_system.Matrix\x12,\n\x08matrix_b\x18\x02 \x01(\x0b\x32\x1a.distributed_system.Matrix\x12*\n\x06result\x18\x03 \x01(\x0b\x32\x1a.distributed_system.Matrix\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x32\n\x07summary\x18\x06 \x01(\x0b\x32!.distributed_system.ResultSummary\"\xa1\x01\n\x0bTileRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x12\n\nrow_offset\x18\x03 \x01(\x05\x12\x0c\n\x04rows\x18\x04 \x01(\x05\x12\r\n\x05inner\x18\x05 \x01(\x05\x12\x0c\n\x04\x63ols\x18\x06 \x01(\x05\x12\x0e\n\x06\x61_rows\x18\x07 \x01(\x0c\x12\t\n\x01\x62\x18\x08 \x01(\x0c\x12\x12\n\ncol_offset\x18\t \x01(\x05\"\x85\x01\n\x0cTileResponse\x12\x12\n\nrow_offset\x18\x01 \x01(\x05\x12\x0c\n\x04rows\x18\x02 \x01(\x05\x12\x0c\n\x04\x63ols\x18\x03 \x01(\x05\x12\x0e\n\x06result\x18\x04 \x01(\x0c\x12\x11\n\ttimestamp\x18\x05 \x01(\x05\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncol_offset\x18\x07 \x01(\x05\"\xa1\x02\n\x0bMatrixChunk\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x32\n\x07operand\x18\x03 \x01(\x0e\x32!.distributed_system.MatrixOperand\x12\x0c\n\x04rows\x18\x04 \x01(\x05\x12\x0c\n\x04\x63ols\x18\x05 \x01(\x05\x12\r\n\x05\x64type\x18\x06 \x01(\t\x12\x13\n\x0b\x63hunk_index\x18\x07 \x01(\x05\x12\x12\n\nrow_offset\x18\x08 \x01(\x05\x12\x12\n\nchunk_rows\x18\t \x01(\x05\x12\x0c\n\x04\x64\x61ta\x18\n \x01(\x0c\x12\x0e\n\x06status\x18\x0b \x01(\t\x12\x32\n\x07summary\x18\x0c \x01(\x0b\x32!.distributed_system.ResultSummary\"p\n\rMatrixRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x39\n\x0eresponse_shape\x18\x03 \x01(\x0e\x32!.distributed_system.ResponseShape\"\xe8\x01\n\x0eMatrixResponse\x12/\n\x08matrix_a\x18\x01 \x01(\x0b\x32\x1d.distributed_system.Matrix2x2\x12/\n\x08matrix_b\x18\x02 \x01(\x0b\x32\x1d.distributed_system.Matrix2x2\x12-\n\x06result\x18\x03 \x01(\x0b\x32\x1d.distributed_system.Matrix2x2\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\x12\x32\n\x07summary\x18\x05 \x01(\x0b\x32!.distributed_system.ResultSummary\"\xcd\x02\n\x0bSortRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x39\n\x0eresponse_shape\x18\x03 \x01(\x0e\x32!.distributed_system.ResponseShape\x12\x34\n\talgorithm\x18\x04 \x01(\x0e\x32!.distributed_system.SortAlgorithm\x12\x13\n\x0bsample_size\x18\x05 \x01(\x03\x12\x12\n\nint_values\x18\x06 \x03(\x03\x12\x15\n\rdouble_values\x18\x07 \x03(\x01\x12\x15\n\rpacked_values\x18\x08 \x01(\x0c\x12\r\n\x05\x64type\x18\t \x01(\t\x12/\n\x04kind\x18\n \x01(\x0e\x32!.distributed_system.NumpySortKind\x12\x10\n\x08\x65xternal\x18\x0b \x01(\x08\"\xaa\x01\n\x0cSortResponse\x12\x18\n\x10original_numbers\x18\x01 \x03(\x05\x12\x16\n\x0esorted_numbers\x18\x02 \x03(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x32\n\x07summary\x18\x04 \x01(\x0b\x32!.distributed_system.ResultSummary\x12\x11\n\talgorithm\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\"\xb1\x01\n\tSortChunk\x12\x0e\n\x06offset\x18\x01 \x01(\x03\x12\r\n\x05total\x18\x02 \x01(\x03\x12\x12\n\nint_values\x18\x03 \x03(\x03\x12\x15\n\rdouble_values\x18\x04 \x03(\x01\x12\x15\n\rpacked_values\x18\x05 \x01(\x0c\x12\r\n\x05\x64type\x18\x06 \x01(\t\x12\x11\n\talgorithm\x18\x07 \x01(\t\x12\x11\n\ttimestamp\x18\x08 \x01(\x05\x12\x0e\n\x06status\x18\t \x01(\t\"\xa0\x02\n\rSearchRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x39\n\x0eresponse_shape\x18\x03 \x01(\x0e\x32!.distributed_system.ResponseShape\x12\x34\n\x08strategy\x18\x04 \x01(\x0e\x32\".distributed_system.SearchStrategy\x12\x0f\n\x07targets\x18\x05 \x03(\x03\x12\x16\n\x0e\x64ouble_targets\x18\x06 \x03(\x01\x12\x12\n\nint_values\x18\x07 \x03(\x03\x12\x15\n\rdouble_values\x18\x08 \x03(\x01\x12\x15\n\rpacked_values\x18\t \x01(\x0c\x12\r\n\x05\x64type\x18\n \x01(\t\"T\n\x0cSearchResult\x12\r\n\x05value\x18\x01 \x01(\x03\x12\x10\n\x08position\x18\x02 \x01(\x03\x12\r\n\x05\x66ound\x18\x03 \x01(\x08\x12\x14\n\x0c\x64ouble_value\x18\x04 \x01(\x01\"\xbd\x01\n\x0eSearchResponse\x12\x0f\n\x07numbers\x18\x01 \x03(\x05\x12\x31\n\x07results\x18\x02 \x03(\x0b\x32 .distributed_system.SearchResult\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x32\n\x07summary\x18\x04 \x01(\x0b\x32!.distributed_system.ResultSummary\x12\x10\n\x08strategy\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\"\\\n\x0eMessageRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x13\n\x0breceiver_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x05\"4\n\x0fMessageResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\"~\n\x10\x42roadcastRequest\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x0e\n\x06quorum\x18\x04 \x01(\x05\x12\x0e\n\x06\x63\x61usal\x18\x05 \x01(\x08\x12\x13\n\x0btotal_order\x18\x06 \x01(\x08\"\xa7\x01\n\x11\x42roadcastResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x65livered_to\x18\x02 \x03(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x04 \x03(\t\x12\x15\n\rmax_timestamp\x18\x05 \x01(\x05\x12\x0e\n\x06quorum\x18\x06 \x01(\x05\x12\x14\n\x0cvector_delta\x18\x07 \x03(\x12\x12\x0c\n\x04held\x18\x08 \x03(\t\"\\\n\rCausalMessage\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x14\n\x0cvector_delta\x18\x02 \x03(\x12\x12\x11\n\ttimestamp\x18\x03 \x01(\x05\x12\x0f\n\x07message\x18\x04 \x01(\t\"Y\n\x0eOrderedMessage\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x10\n\x08sequence\x18\x03 \x01(\x03\x12\x0f\n\x07message\x18\x04 \x01(\t\"\xad\x01\n\x08OrderAck\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x0c\n\x04sent\x18\x03 \x01(\x03\x12<\n\x08received\x18\x04 \x03(\x0b\x32*.distributed_system.OrderAck.ReceivedEntry\x1a/\n\rReceivedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"A\n\tCausalAck\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\x12\x11\n\tdelivered\x18\x03 \x01(\x03*7\n\rResponseShape\x12\x08\n\x04\x46ULL\x10\x00\x12\x0f\n\x0bRESULT_ONLY\x10\x01\x12\x0b\n\x07SUMMARY\x10\x02*@\n\rMathOperation\x12\x07\n\x03\x41\x44\x44\x10\x00\x12\x0c\n\x08SUBTRACT\x10\x01\x12\x0c\n\x08MULTIPLY\x10\x02\x12\n\n\x06\x44IVIDE\x10\x03*A\n\rMatrixOperand\x12\r\n\tOPERAND_A\x10\x00\x12\r\n\tOPERAND_B\x10\x01\x12\x12\n\x0eOPERAND_RESULT\x10\x02*m\n\rSortAlgorithm\x12\r\n\tINTROSORT\x10\x00\x12\x13\n\x0fQUICKSORT_LISTS\x10\x01\x12\x0b\n\x07\x42UILTIN\x10\x02\x12\x11\n\rCOUNTING_SORT\x10\x03\x12\x0e\n\nRADIX_SORT\x10\x04\x12\x08\n\x04\x41UTO\x10\x05*^\n\rNumpySortKind\x12\x13\n\x0fNUMPY_QUICKSORT\x10\x00\x12\x10\n\x0cNUMPY_STABLE\x10\x01\x12\x12\n\x0eNUMPY_HEAPSORT\x10\x02\x12\x12\n\x0eNUMPY_COUNTING\x10\x03*Y\n\x0eSearchStrategy\x12\x11\n\rLINEAR_SEARCH\x10\x00\x12\x10\n\x0cINDEX_SEARCH\x10\x01\x12\x11\n\rBINARY_SEARCH\x10\x02\x12\x0f\n\x0b\x41UTO_SEARCH\x10\x03\x32\xf7\x03\n\x0bMathService\x12H\n\x03\x41\x64\x64\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12M\n\x08Subtract\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12M\n\x08Multiply\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12K\n\x06\x44ivide\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse\x12[\n\x0c\x42\x61tchCompute\x12$.distributed_system.MathBatchRequest\x1a%.distributed_system.MathBatchResponse\x12V\n\rStreamCompute\x12\x1f.distributed_system.MathRequest\x1a .distributed_system.MathResponse(\x01\x30\x01\x32\xcc\x01\n\x0e\x41verageService\x12[\n\x10\x43\x61lculateAverage\x12\".distributed_system.AverageRequest\x1a#.distributed_system.AverageResponse\x12]\n\x10StreamStatistics\x12 .distributed_system.AverageChunk\x1a%.distributed_system.StatisticsSummary(\x01\x32\xbc\x03\n\rMatrixService\x12Y\n\x10MultiplyMatrices\x12!.distributed_system.MatrixRequest\x1a\".distributed_system.MatrixResponse\x12O\n\x06MatMul\x12!.distributed_system.MatMulRequest\x1a\".distributed_system.MatMulResponse\x12Q\n\x0cMultiplyTile\x12\x1f.distributed_system.TileRequest\x1a .distributed_system.TileResponse\x12V\n\x0eMultiplyStream\x12\x1f.distributed_system.MatrixChunk\x1a\x1f.distributed_system.MatrixChunk(\x01\x30\x01\x12T\n\x0cMatMulStream\x12!.distributed_system.MatMulRequest\x1a\x1f.distributed_system.MatrixChunk0\x01\x32\x86\x02\n\x0bSortService\x12N\n\tQuickSort\x12\x1f.distributed_system.SortRequest\x1a .distributed_system.SortResponse\x12P\n\nSortStream\x12\x1f.distributed_system.SortRequest\x1a\x1d.distributed_system.SortChunk(\x01\x30\x01\x12U\n\x0f\x44istributedSort\x12\x1f.distributed_system.SortRequest\x1a\x1d.distributed_system.SortChunk(\x01\x30\x01\x32\xbf\x01\n\rSearchService\x12U\n\x0cLinearSearch\x12!.distributed_system.SearchRequest\x1a\".distributed_system.SearchResponse\x12W\n\x0cSearchStream\x12!.distributed_system.SearchRequest\x1a\".distributed_system.SearchResponse(\x01\x32h\n\x0eMessageService\x12V\n\x0bSendMessage\x12\".distributed_system.MessageRequest\x1a#.distributed_system.MessageResponse2\xf2\x02\n\x10\x42roadcastService\x12_\n\x10\x42roadcastMessage\x12$.distributed_system.BroadcastRequest\x1a%.distributed_system.BroadcastResponse\x12Q\n\rDeliverCausal\x12!.distributed_system.CausalMessage\x1a\x1d.distributed_system.CausalAck\x12Y\n\x0e\x44\x65liverOrdered\x12\".distributed_system.OrderedMessage\x1a#.distributed_system.MessageResponse\x12O\n\nAckOrdered\x12\x1c.distributed_system.OrderAck\x1a#.distributed_system.MessageResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'services_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_MATHREQUEST']._serialized_start=38
-  _globals['_MATHREQUEST']._serialized_end=117
-  _globals['_MATHRESPONSE']._serialized_start=119
-  _globals['_MATHRESPONSE']._serialized_end=184
-  _globals['_AVERAGEREQUEST']._serialized_start=186
-  _globals['_AVERAGEREQUEST']._serialized_end=240
-  _globals['_AVERAGERESPONSE']._serialized_start=242
-  _globals['_AVERAGERESPONSE']._serialized_end=312
-  _globals['_MATRIX2X2']._serialized_start=314
-  _globals['_MATRIX2X2']._serialized_end=341
-  _globals['_MATRIXREQUEST']._serialized_start=343
-  _globals['_MATRIXREQUEST']._serialized_end=396
-  _globals['_MATRIXRESPONSE']._serialized_start=399
-  _globals['_MATRIXRESPONSE']._serialized_end=579
-  _globals['_SORTREQUEST']._serialized_start=581
-  _globals['_SORTREQUEST']._serialized_end=632
-  _globals['_SORTRESPONSE']._serialized_start=634
-  _globals['_SORTRESPONSE']._serialized_end=717
-  _globals['_SEARCHREQUEST']._serialized_start=719
-  _globals['_SEARCHREQUEST']._serialized_end=772
-  _globals['_SEARCHRESULT']._serialized_start=774
-  _globals['_SEARCHRESULT']._serialized_end=836
-  _globals['_SEARCHRESPONSE']._serialized_start=838
-  _globals['_SEARCHRESPONSE']._serialized_end=941
-  _globals['_MESSAGEREQUEST']._serialized_start=943
-  _globals['_MESSAGEREQUEST']._serialized_end=1035
-  _globals['_MESSAGERESPONSE']._serialized_start=1037
-  _globals['_MESSAGERESPONSE']._serialized_end=1089
-  _globals['_BROADCASTREQUEST']._serialized_start=1091
-  _globals['_BROADCASTREQUEST']._serialized_end=1164
-  _globals['_BROADCASTRESPONSE']._serialized_start=1166
-  _globals['_BROADCASTRESPONSE']._serialized_end=1242
-  _globals['_MATHSERVICE']._serialized_start=1245
-  _globals['_MATHSERVICE']._serialized_end=1567
-  _globals['_AVERAGESERVICE']._serialized_start=1569
-  _globals['_AVERAGESERVICE']._serialized_end=1678
-  _globals['_MATRIXSERVICE']._serialized_start=1680
-  _globals['_MATRIXSERVICE']._serialized_end=1786
-  _globals['_SORTSERVICE']._serialized_start=1788
-  _globals['_SORTSERVICE']._serialized_end=1881
-  _globals['_SEARCHSERVICE']._serialized_start=1883
-  _globals['_SEARCHSERVICE']._serialized_end=1985
-  _globals['_MESSAGESERVICE']._serialized_start=1987
-  _globals['_MESSAGESERVICE']._serialized_end=2091
-  _globals['_BROADCASTSERVICE']._serialized_start=2093
-  _globals['_BROADCASTSERVICE']._serialized_end=2208
+  _globals['_ORDERACK_RECEIVEDENTRY']._loaded_options = None
+  _globals['_ORDERACK_RECEIVEDENTRY']._serialized_options = b'8\001'
+  _globals['_RESPONSESHAPE']._serialized_start=4749
+  _globals['_RESPONSESHAPE']._serialized_end=4804
+  _globals['_MATHOPERATION']._serialized_start=4806
+  _globals['_MATHOPERATION']._serialized_end=4870
+  _globals['_MATRIXOPERAND']._serialized_start=4872
+  _globals['_MATRIXOPERAND']._serialized_end=4937
+  _globals['_SORTALGORITHM']._serialized_start=4939
+  _globals['_SORTALGORITHM']._serialized_end=5048
+  _globals['_NUMPYSORTKIND']._serialized_start=5050
+  _globals['_NUMPYSORTKIND']._serialized_end=5144
+  _globals['_SEARCHSTRATEGY']._serialized_start=5146
+  _globals['_SEARCHSTRATEGY']._serialized_end=5235
+  _globals['_RESULTSUMMARY']._serialized_start=38
+  _globals['_RESULTSUMMARY']._serialized_end=108
+  _globals['_MATHREQUEST']._serialized_start=111
+  _globals['_MATHREQUEST']._serialized_end=244
+  _globals['_MATHRESPONSE']._serialized_start=246
+  _globals['_MATHRESPONSE']._serialized_end=311
+  _globals['_MATHBATCHREQUEST']._serialized_start=314
+  _globals['_MATHBATCHREQUEST']._serialized_end=452
+  _globals['_MATHBATCHRESPONSE']._serialized_start=454
+  _globals['_MATHBATCHRESPONSE']._serialized_end=548
+  _globals['_AVERAGEREQUEST']._serialized_start=551
+  _globals['_AVERAGEREQUEST']._serialized_end=709
+  _globals['_AVERAGERESPONSE']._serialized_start=712
+  _globals['_AVERAGERESPONSE']._serialized_end=874
+  _globals['_AVERAGECHUNK']._serialized_start=876
+  _globals['_AVERAGECHUNK']._serialized_end=944
+  _globals['_STATISTICSSUMMARY']._serialized_start=947
+  _globals['_STATISTICSSUMMARY']._serialized_end=1099
+  _globals['_MATRIX2X2']._serialized_start=1101
+  _globals['_MATRIX2X2']._serialized_end=1128
+  _globals['_MATRIX']._serialized_start=1130
+  _globals['_MATRIX']._serialized_end=1182
+  _globals['_MATMULREQUEST']._serialized_start=1185
+  _globals['_MATMULREQUEST']._serialized_end=1432
+  _globals['_MATMULRESPONSE']._serialized_start=1435
+  _globals['_MATMULRESPONSE']._serialized_end=1674
+  _globals['_TILEREQUEST']._serialized_start=1677
+  _globals['_TILEREQUEST']._serialized_end=1838
+  _globals['_TILERESPONSE']._serialized_start=1841
+  _globals['_TILERESPONSE']._serialized_end=1974
+  _globals['_MATRIXCHUNK']._serialized_start=1977
+  _globals['_MATRIXCHUNK']._serialized_end=2266
+  _globals['_MATRIXREQUEST']._serialized_start=2268
+  _globals['_MATRIXREQUEST']._serialized_end=2380
+  _globals['_MATRIXRESPONSE']._serialized_start=2383
+  _globals['_MATRIXRESPONSE']._serialized_end=2615
+  _globals['_SORTREQUEST']._serialized_start=2618
+  _globals['_SORTREQUEST']._serialized_end=2951
+  _globals['_SORTRESPONSE']._serialized_start=2954
+  _globals['_SORTRESPONSE']._serialized_end=3124
+  _globals['_SORTCHUNK']._serialized_start=3127
+  _globals['_SORTCHUNK']._serialized_end=3304
+  _globals['_SEARCHREQUEST']._serialized_start=3307
+  _globals['_SEARCHREQUEST']._serialized_end=3595
+  _globals['_SEARCHRESULT']._serialized_start=3597
+  _globals['_SEARCHRESULT']._serialized_end=3681
+  _globals['_SEARCHRESPONSE']._serialized_start=3684
+  _globals['_SEARCHRESPONSE']._serialized_end=3873
+  _globals['_MESSAGEREQUEST']._serialized_start=3875
+  _globals['_MESSAGEREQUEST']._serialized_end=3967
+  _globals['_MESSAGERESPONSE']._serialized_start=3969
+  _globals['_MESSAGERESPONSE']._serialized_end=4021
+  _globals['_BROADCASTREQUEST']._serialized_start=4023
+  _globals['_BROADCASTREQUEST']._serialized_end=4149
+  _globals['_BROADCASTRESPONSE']._serialized_start=4152
+  _globals['_BROADCASTRESPONSE']._serialized_end=4319
+  _globals['_CAUSALMESSAGE']._serialized_start=4321
+  _globals['_CAUSALMESSAGE']._serialized_end=4413
+  _globals['_ORDEREDMESSAGE']._serialized_start=4415
+  _globals['_ORDEREDMESSAGE']._serialized_end=4504
+  _globals['_ORDERACK']._serialized_start=4507
+  _globals['_ORDERACK']._serialized_end=4680
+  _globals['_ORDERACK_RECEIVEDENTRY']._serialized_start=4633
+  _globals['_ORDERACK_RECEIVEDENTRY']._serialized_end=4680
+  _globals['_CAUSALACK']._serialized_start=4682
+  _globals['_CAUSALACK']._serialized_end=4747
+  _globals['_MATHSERVICE']._serialized_start=5238
+  _globals['_MATHSERVICE']._serialized_end=5741
+  _globals['_AVERAGESERVICE']._serialized_start=5744
+  _globals['_AVERAGESERVICE']._serialized_end=5948
+  _globals['_MATRIXSERVICE']._serialized_start=5951
+  _globals['_MATRIXSERVICE']._serialized_end=6395
+  _globals['_SORTSERVICE']._serialized_start=6398
+  _globals['_SORTSERVICE']._serialized_end=6660
+  _globals['_SEARCHSERVICE']._serialized_start=6663
+  _globals['_SEARCHSERVICE']._serialized_end=6854
+  _globals['_MESSAGESERVICE']._serialized_start=6856
+  _globals['_MESSAGESERVICE']._serialized_end=6960
+  _globals['_BROADCASTSERVICE']._serialized_start=6963
+  _globals['_BROADCASTSERVICE']._serialized_end=7333
 # @@protoc_insertion_point(module_scope)
@@ -57,6 +57,16 @@ class MathServiceStub(object):
                 request_serializer=services__pb2.MathRequest.SerializeToString,
                 response_deserializer=services__pb2.MathResponse.FromString,
                 _registered_method=True)
+        self.BatchCompute = channel.unary_unary(
+                '/distributed_system.MathService/BatchCompute',
+                request_serializer=services__pb2.MathBatchRequest.SerializeToString,
+                response_deserializer=services__pb2.MathBatchResponse.FromString,
+                _registered_method=True)
+        self.StreamCompute = channel.stream_stream(
+                '/distributed_system.MathService/StreamCompute',
+                request_serializer=services__pb2.MathRequest.SerializeToString,
+                response_deserializer=services__pb2.MathResponse.FromString,
+                _registered_method=True)
 
 
 class MathServiceServicer(object):
@@ -89,6 +99,18 @@ class MathServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCompute(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamCompute(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MathServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -112,6 +134,16 @@ def add_MathServiceServicer_to_server(servicer, server):
                     request_deserializer=services__pb2.MathRequest.FromString,
                     response_serializer=services__pb2.MathResponse.SerializeToString,
             ),
+            'BatchCompute': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCompute,
+                    request_deserializer=services__pb2.MathBatchRequest.FromString,
+                    response_serializer=services__pb2.MathBatchResponse.SerializeToString,
+            ),
+            'StreamCompute': grpc.stream_stream_rpc_method_handler(
+                    servicer.StreamCompute,
+                    request_deserializer=services__pb2.MathRequest.FromString,
+                    response_serializer=services__pb2.MathResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_system.MathService', rpc_method_handlers)
@@ -234,6 +266,60 @@ class MathService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchCompute(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/distributed_system.MathService/BatchCompute',
+            services__pb2.MathBatchRequest.SerializeToString,
+            services__pb2.MathBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamCompute(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/distributed_system.MathService/StreamCompute',
+            services__pb2.MathRequest.SerializeToString,
+            services__pb2.MathResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class AverageServiceStub(object):
     """========================================
@@ -252,6 +338,11 @@ class AverageServiceStub(object):
                 request_serializer=services__pb2.AverageRequest.SerializeToString,
                 response_deserializer=services__pb2.AverageResponse.FromString,
                 _registered_method=True)
+        self.StreamStatistics = channel.stream_unary(
+                '/distributed_system.AverageService/StreamStatistics',
+                request_serializer=services__pb2.AverageChunk.SerializeToString,
+                response_deserializer=services__pb2.StatisticsSummary.FromString,
+                _registered_method=True)
 
 
 class AverageServiceServicer(object):
@@ -266,6 +357,12 @@ class AverageServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamStatistics(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AverageServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -274,6 +371,11 @@ def add_AverageServiceServicer_to_server(servicer, server):
                     request_deserializer=services__pb2.AverageRequest.FromString,
                     response_serializer=services__pb2.AverageResponse.SerializeToString,
             ),
+            'StreamStatistics': grpc.stream_unary_rpc_method_handler(
+                    servicer.StreamStatistics,
+                    request_deserializer=services__pb2.AverageChunk.FromString,
+                    response_serializer=services__pb2.StatisticsSummary.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_system.AverageService', rpc_method_handlers)
@@ -315,6 +417,33 @@ class AverageService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamStatistics(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/distributed_system.AverageService/StreamStatistics',
+            services__pb2.AverageChunk.SerializeToString,
+            services__pb2.StatisticsSummary.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class MatrixServiceStub(object):
     """========================================
@@ -333,6 +462,26 @@ class MatrixServiceStub(object):
                 request_serializer=services__pb2.MatrixRequest.SerializeToString,
                 response_deserializer=services__pb2.MatrixResponse.FromString,
                 _registered_method=True)
+        self.MatMul = channel.unary_unary(
+                '/distributed_system.MatrixService/MatMul',
+                request_serializer=services__pb2.MatMulRequest.SerializeToString,
+                response_deserializer=services__pb2.MatMulResponse.FromString,
+                _registered_method=True)
+        self.MultiplyTile = channel.unary_unary(
+                '/distributed_system.MatrixService/MultiplyTile',
+                request_serializer=services__pb2.TileRequest.SerializeToString,
+                response_deserializer=services__pb2.TileResponse.FromString,
+                _registered_method=True)
+        self.MultiplyStream = channel.stream_stream(
+                '/distributed_system.MatrixService/MultiplyStream',
+                request_serializer=services__pb2.MatrixChunk.SerializeToString,
+                response_deserializer=services__pb2.MatrixChunk.FromString,
+                _registered_method=True)
+        self.MatMulStream = channel.unary_stream(
+                '/distributed_system.MatrixService/MatMulStream',
+                request_serializer=services__pb2.MatMulRequest.SerializeToString,
+                response_deserializer=services__pb2.MatrixChunk.FromString,
+                _registered_method=True)
 
 
 class MatrixServiceServicer(object):
@@ -347,6 +496,33 @@ class MatrixServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def MatMul(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MultiplyTile(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MultiplyStream(self, request_iterator, context):
+        """Matrices grandes en fragmentos de filas: el cliente envía B completa y
+        luego A por bloques; cada bloque de A se multiplica en cuanto llega
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MatMulStream(self, request, context):
+        """Como MatMul, pero la respuesta llega en fragmentos de filas
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MatrixServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -355,6 +531,26 @@ def add_MatrixServiceServicer_to_server(servicer, server):
                     request_deserializer=services__pb2.MatrixRequest.FromString,
                     response_serializer=services__pb2.MatrixResponse.SerializeToString,
             ),
+            'MatMul': grpc.unary_unary_rpc_method_handler(
+                    servicer.MatMul,
+                    request_deserializer=services__pb2.MatMulRequest.FromString,
+                    response_serializer=services__pb2.MatMulResponse.SerializeToString,
+            ),
+            'MultiplyTile': grpc.unary_unary_rpc_method_handler(
+                    servicer.MultiplyTile,
+                    request_deserializer=services__pb2.TileRequest.FromString,
+                    response_serializer=services__pb2.TileResponse.SerializeToString,
+            ),
+            'MultiplyStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.MultiplyStream,
+                    request_deserializer=services__pb2.MatrixChunk.FromString,
+                    response_serializer=services__pb2.MatrixChunk.SerializeToString,
+            ),
+            'MatMulStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.MatMulStream,
+                    request_deserializer=services__pb2.MatMulRequest.FromString,
+                    response_serializer=services__pb2.MatrixChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_system.MatrixService', rpc_method_handlers)
@@ -396,6 +592,114 @@ class MatrixService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def MatMul(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/distributed_system.MatrixService/MatMul',
+            services__pb2.MatMulRequest.SerializeToString,
+            services__pb2.MatMulResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MultiplyTile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/distributed_system.MatrixService/MultiplyTile',
+            services__pb2.TileRequest.SerializeToString,
+            services__pb2.TileResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MultiplyStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/distributed_system.MatrixService/MultiplyStream',
+            services__pb2.MatrixChunk.SerializeToString,
+            services__pb2.MatrixChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MatMulStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/distributed_system.MatrixService/MatMulStream',
+            services__pb2.MatMulRequest.SerializeToString,
+            services__pb2.MatrixChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class SortServiceStub(object):
     """========================================
@@ -414,6 +718,16 @@ class SortServiceStub(object):
                 request_serializer=services__pb2.SortRequest.SerializeToString,
                 response_deserializer=services__pb2.SortResponse.FromString,
                 _registered_method=True)
+        self.SortStream = channel.stream_stream(
+                '/distributed_system.SortService/SortStream',
+                request_serializer=services__pb2.SortRequest.SerializeToString,
+                response_deserializer=services__pb2.SortChunk.FromString,
+                _registered_method=True)
+        self.DistributedSort = channel.stream_stream(
+                '/distributed_system.SortService/DistributedSort',
+                request_serializer=services__pb2.SortRequest.SerializeToString,
+                response_deserializer=services__pb2.SortChunk.FromString,
+                _registered_method=True)
 
 
 class SortServiceServicer(object):
@@ -428,6 +742,23 @@ class SortServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SortStream(self, request_iterator, context):
+        """Ordena los datos que envía el cliente en varios SortRequest (int_values,
+        double_values o packed_values) y devuelve el resultado en fragmentos
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DistributedSort(self, request_iterator, context):
+        """Como SortStream, pero reparte los datos por rangos (sample sort) entre
+        este proceso y las demás réplicas de P4 del registro de topología
+        (topologia.py), que ordenan cada rango
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SortServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -436,6 +767,16 @@ def add_SortServiceServicer_to_server(servicer, server):
                     request_deserializer=services__pb2.SortRequest.FromString,
                     response_serializer=services__pb2.SortResponse.SerializeToString,
             ),
+            'SortStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.SortStream,
+                    request_deserializer=services__pb2.SortRequest.FromString,
+                    response_serializer=services__pb2.SortChunk.SerializeToString,
+            ),
+            'DistributedSort': grpc.stream_stream_rpc_method_handler(
+                    servicer.DistributedSort,
+                    request_deserializer=services__pb2.SortRequest.FromString,
+                    response_serializer=services__pb2.SortChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_system.SortService', rpc_method_handlers)
@@ -477,6 +818,60 @@ class SortService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SortStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/distributed_system.SortService/SortStream',
+            services__pb2.SortRequest.SerializeToString,
+            services__pb2.SortChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DistributedSort(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/distributed_system.SortService/DistributedSort',
+            services__pb2.SortRequest.SerializeToString,
+            services__pb2.SortChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class SearchServiceStub(object):
     """========================================
@@ -495,6 +890,11 @@ class SearchServiceStub(object):
                 request_serializer=services__pb2.SearchRequest.SerializeToString,
                 response_deserializer=services__pb2.SearchResponse.FromString,
                 _registered_method=True)
+        self.SearchStream = channel.stream_unary(
+                '/distributed_system.SearchService/SearchStream',
+                request_serializer=services__pb2.SearchRequest.SerializeToString,
+                response_deserializer=services__pb2.SearchResponse.FromString,
+                _registered_method=True)
 
 
 class SearchServiceServicer(object):
@@ -509,6 +909,14 @@ class SearchServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SearchStream(self, request_iterator, context):
+        """Busca los objetivos en los datos que envía el cliente en varios
+        SearchRequest (int_values, double_values o packed_values)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SearchServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -517,6 +925,11 @@ def add_SearchServiceServicer_to_server(servicer, server):
                     request_deserializer=services__pb2.SearchRequest.FromString,
                     response_serializer=services__pb2.SearchResponse.SerializeToString,
             ),
+            'SearchStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.SearchStream,
+                    request_deserializer=services__pb2.SearchRequest.FromString,
+                    response_serializer=services__pb2.SearchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_system.SearchService', rpc_method_handlers)
@@ -558,6 +971,33 @@ class SearchService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SearchStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/distributed_system.SearchService/SearchStream',
+            services__pb2.SearchRequest.SerializeToString,
+            services__pb2.SearchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class MessageServiceStub(object):
     """========================================
@@ -657,6 +1097,21 @@ class BroadcastServiceStub(object):
                 request_serializer=services__pb2.BroadcastRequest.SerializeToString,
                 response_deserializer=services__pb2.BroadcastResponse.FromString,
                 _registered_method=True)
+        self.DeliverCausal = channel.unary_unary(
+                '/distributed_system.BroadcastService/DeliverCausal',
+                request_serializer=services__pb2.CausalMessage.SerializeToString,
+                response_deserializer=services__pb2.CausalAck.FromString,
+                _registered_method=True)
+        self.DeliverOrdered = channel.unary_unary(
+                '/distributed_system.BroadcastService/DeliverOrdered',
+                request_serializer=services__pb2.OrderedMessage.SerializeToString,
+                response_deserializer=services__pb2.MessageResponse.FromString,
+                _registered_method=True)
+        self.AckOrdered = channel.unary_unary(
+                '/distributed_system.BroadcastService/AckOrdered',
+                request_serializer=services__pb2.OrderAck.SerializeToString,
+                response_deserializer=services__pb2.MessageResponse.FromString,
+                _registered_method=True)
 
 
 class BroadcastServiceServicer(object):
@@ -671,6 +1126,26 @@ class BroadcastServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DeliverCausal(self, request, context):
+        """Entrega entre procesos de una difusión causal (ver reloj_vectorial.py)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeliverOrdered(self, request, context):
+        """Multidifusión con orden total (ver orden_total.py): mensajes y confirmaciones acumulativas
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AckOrdered(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_BroadcastServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -679,6 +1154,21 @@ def add_BroadcastServiceServicer_to_server(servicer, server):
                     request_deserializer=services__pb2.BroadcastRequest.FromString,
                     response_serializer=services__pb2.BroadcastResponse.SerializeToString,
             ),
+            'DeliverCausal': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeliverCausal,
+                    request_deserializer=services__pb2.CausalMessage.FromString,
+                    response_serializer=services__pb2.CausalAck.SerializeToString,
+            ),
+            'DeliverOrdered': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeliverOrdered,
+                    request_deserializer=services__pb2.OrderedMessage.FromString,
+                    response_serializer=services__pb2.MessageResponse.SerializeToString,
+            ),
+            'AckOrdered': grpc.unary_unary_rpc_method_handler(
+                    servicer.AckOrdered,
+                    request_deserializer=services__pb2.OrderAck.FromString,
+                    response_serializer=services__pb2.MessageResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_system.BroadcastService', rpc_method_handlers)
@@ -719,3 +1209,84 @@ class BroadcastService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def DeliverCausal(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/distributed_system.BroadcastService/DeliverCausal',
+            services__pb2.CausalMessage.SerializeToString,
+            services__pb2.CausalAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeliverOrdered(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/distributed_system.BroadcastService/DeliverOrdered',
+            services__pb2.OrderedMessage.SerializeToString,
+            services__pb2.MessageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AckOrdered(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/distributed_system.BroadcastService/AckOrdered',
+            services__pb2.OrderAck.SerializeToString,
+            services__pb2.MessageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,218 @@
+"""
+ARRANQUE COMÚN DE LOS PROCESOS v2
+Lo que comparten los cinco procesos:
+- MODO_SERVIDOR: "hilos" (grpc.server con un ThreadPoolExecutor de
+  HILOS_SERVIDOR hilos) o "aio" (grpc.aio: las RPC son corrutinas de un solo
+  event loop, sin un hilo por RPC en curso)
+- EJECUTAR_TAREA: las réplicas adicionales (EJECUTAR_TAREA=0) solo atienden
+  RPC, sin la tarea de comunicación ni BroadcastService
+- MessageService (ServicioMensajes) y enviar_mensaje_a_proceso
+- ejecutar_proceso: registra los servicios, anuncia el proceso en la
+  topología, lanza la tarea y atiende hasta que lo detengan
+
+En modo aio los handlers que solo toman locks (el reloj, Bitacora.registrar,
+las colas de la difusión) corren directamente en el event loop. El trabajo
+de CPU (NumPy, ordenamientos, búsquedas) va con en_ejecutor o
+iterar_en_ejecutor a un ejecutor propio de HILOS_CALCULO hilos: NumPy suelta
+el GIL en sus bucles, así que esos hilos calculan en paralelo, y como son
+tantos como núcleos, el resto de las RPC no espera a que se libere un hilo.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent import futures
+from functools import partial
+import grpc
+import services_pb2
+import services_pb2_grpc
+from pool_canales import PoolCanales, OPCIONES_SERVIDOR
+from reloj_lamport import crear_reloj
+from bitacora import Bitacora
+from difusion import ServicioDifusion, ServicioDifusionAsync
+from topologia import obtener_topologia
+
+# Modo del servidor: "hilos" (ThreadPoolExecutor) o "aio" (grpc.aio, asyncio)
+MODO_SERVIDOR = os.environ.get("MODO_SERVIDOR", "hilos")
+
+# Las réplicas adicionales (EJECUTAR_TAREA=0) solo atienden RPC, sin la tarea de comunicación
+EJECUTAR_TAREA = os.environ.get("EJECUTAR_TAREA", "1") == "1"
+
+# Hilos del servidor en modo "hilos" y del ejecutor de cálculo en modo "aio"
+HILOS_SERVIDOR = 10
+HILOS_CALCULO = int(os.environ.get("HILOS_CALCULO", str(os.cpu_count() or 1)))
+
+
+_ejecutor_calculo = None
+_lock_ejecutor_calculo = threading.Lock()
+
+
+def obtener_ejecutor_calculo():
+    """Ejecutor compartido por los handlers aio para el trabajo de CPU"""
+    global _ejecutor_calculo
+    with _lock_ejecutor_calculo:
+        if _ejecutor_calculo is None:
+            _ejecutor_calculo = futures.ThreadPoolExecutor(max_workers=HILOS_CALCULO,
+                                                           thread_name_prefix="calculo")
+        return _ejecutor_calculo
+
+
+async def en_ejecutor(funcion, *args, **kwargs):
+    """Calcula funcion(*args, **kwargs) en el ejecutor de cálculo sin detener el event loop"""
+    return await asyncio.get_running_loop().run_in_executor(obtener_ejecutor_calculo(),
+                                                            partial(funcion, *args, **kwargs))
+
+
+async def iterar_en_ejecutor(generador):
+    """Recorre un generador síncrono calculando cada elemento en el ejecutor de cálculo"""
+    while (elemento := await en_ejecutor(next, generador, None)) is not None:
+        yield elemento
+
+
+class ServicioMensajes(services_pb2_grpc.MessageServiceServicer):
+    """Servicio para recibir mensajes de otros procesos"""
+
+    def __init__(self, id_proceso, reloj, evento_recibido=None):
+        self.id_proceso = id_proceso
+        self.reloj = reloj
+        # Evento que espera la tarea del proceso, si espera un mensaje para empezar
+        self.evento_recibido = evento_recibido
+
+    def SendMessage(self, peticion, contexto):
+        # Actualizar reloj al recibir mensaje
+        tiempo = self.reloj.actualizar(peticion.timestamp)
+        Bitacora.registrar("RECEIVE",
+                          f"{self.id_proceso} <- {peticion.sender_id} mensaje='{peticion.message}'",
+                          tiempo, par=peticion.sender_id)
+
+        if self.evento_recibido is not None:
+            self.evento_recibido.set()
+
+        return services_pb2.MessageResponse(
+            status="ACK",
+            timestamp=tiempo
+        )
+
+
+class ServicioMensajesAsync(ServicioMensajes):
+    """Versión asíncrona (grpc.aio) del servicio de mensajes"""
+
+    async def SendMessage(self, peticion, contexto):
+        # Solo toma los locks del reloj y la bitácora: corre en el event loop
+        return super().SendMessage(peticion, contexto)
+
+
+def enviar_mensaje_a_proceso(pool, id_origen, id_destino, mensaje, timestamp, host=None, puerto=None):
+    """
+    Función para enviar mensaje a otro proceso usando el canal compartido del
+    pool. Sin host ni puerto se usa el endpoint primario de id_destino: las
+    réplicas solo atienden los servicios sin estado, no los relojes de la tarea.
+    """
+    try:
+        if host is None:
+            host, puerto = obtener_topologia().procesos()[id_destino]
+        cliente = pool.obtener_stub(host, puerto, services_pb2_grpc.MessageServiceStub)
+
+        peticion = services_pb2.MessageRequest(
+            sender_id=id_origen,
+            receiver_id=id_destino,
+            message=mensaje,
+            timestamp=timestamp
+        )
+
+        respuesta = cliente.SendMessage(peticion, timeout=5.0)
+        return respuesta.timestamp
+    except Exception as e:
+        if host is not None:
+            pool.reportar_error(host, puerto, e)
+        print(f"[ERROR] No se pudo enviar mensaje a {id_destino}: {e}")
+        return timestamp
+
+
+def registrar_servicios(servidor, id_proceso, reloj, pool, agregar_servicios, evento_recibido, aio):
+    """
+    Servicios propios del proceso más MessageService y BroadcastService. Las
+    réplicas (EJECUTAR_TAREA=0) comparten el id lógico del primario, así que
+    no atienden BroadcastService: sus relojes vectoriales y secuencias de
+    orden total ocuparían las mismas entradas que las del primario.
+    """
+    agregar_servicios(servidor, id_proceso, reloj, pool, aio)
+    services_pb2_grpc.add_MessageServiceServicer_to_server(
+        (ServicioMensajesAsync if aio else ServicioMensajes)(id_proceso, reloj, evento_recibido), servidor
+    )
+    if EJECUTAR_TAREA:
+        services_pb2_grpc.add_BroadcastServiceServicer_to_server(
+            (ServicioDifusionAsync if aio else ServicioDifusion)(id_proceso, reloj, pool), servidor
+        )
+
+
+def iniciar_tarea(id_proceso, reloj, pool, tarea):
+    """Registra el arranque y lanza la tarea de comunicación en un hilo separado"""
+    Bitacora.registrar("INTERNAL", f"{id_proceso} inicializado", reloj.obtener_tiempo())
+    if EJECUTAR_TAREA:
+        threading.Thread(target=tarea, args=(id_proceso, reloj, pool), daemon=True).start()
+
+
+async def servir_aio(id_proceso, reloj, pool, agregar_servicios, tarea, opciones, evento_recibido):
+    """Servidor grpc.aio: las RPC se atienden como corrutinas en un solo event loop"""
+    servidor = grpc.aio.server(options=opciones)
+    registrar_servicios(servidor, id_proceso, reloj, pool, agregar_servicios, evento_recibido, aio=True)
+
+    puerto = obtener_topologia().puerto_local(id_proceso)
+    servidor.add_insecure_port(f'[::]:{puerto}')
+    await servidor.start()
+    obtener_topologia().anunciar(id_proceso)
+
+    print(f"{id_proceso} servidor (aio) iniciado en puerto {puerto}")
+    iniciar_tarea(id_proceso, reloj, pool, tarea)
+
+    try:
+        await servidor.wait_for_termination()
+    finally:
+        await servidor.stop(0)
+
+
+def servir_hilos(id_proceso, reloj, pool, agregar_servicios, tarea, opciones, evento_recibido):
+    """Servidor grpc con un pool de HILOS_SERVIDOR hilos"""
+    servidor = grpc.server(futures.ThreadPoolExecutor(max_workers=HILOS_SERVIDOR), options=opciones)
+    registrar_servicios(servidor, id_proceso, reloj, pool, agregar_servicios, evento_recibido, aio=False)
+
+    # Escuchar en el puerto que le asigna la topología
+    puerto = obtener_topologia().puerto_local(id_proceso)
+    servidor.add_insecure_port(f'[::]:{puerto}')
+    servidor.start()
+    obtener_topologia().anunciar(id_proceso)
+
+    print(f"{id_proceso} servidor iniciado en puerto {puerto}")
+    iniciar_tarea(id_proceso, reloj, pool, tarea)
+
+    try:
+        servidor.wait_for_termination()
+    finally:
+        servidor.stop(0)
+
+
+def ejecutar_proceso(id_proceso, agregar_servicios, tarea, opciones_servidor=OPCIONES_SERVIDOR,
+                     opciones_canal=None, evento_recibido=None):
+    """
+    Inicia el servidor gRPC del proceso en el modo MODO_SERVIDOR y lo
+    mantiene corriendo. agregar_servicios(servidor, id_proceso, reloj, pool, aio)
+    registra los servicios propios del proceso (con aio=True, sus versiones
+    asíncronas); tarea(id_proceso, reloj, pool) es su tarea de comunicación.
+    evento_recibido se marca al llegar un SendMessage.
+    """
+    Bitacora.configurar(id_proceso)
+    reloj = crear_reloj()
+    pool = PoolCanales(opciones_canal)
+
+    try:
+        if MODO_SERVIDOR == "aio":
+            asyncio.run(servir_aio(id_proceso, reloj, pool, agregar_servicios, tarea,
+                                   opciones_servidor, evento_recibido))
+        else:
+            servir_hilos(id_proceso, reloj, pool, agregar_servicios, tarea, opciones_servidor, evento_recibido)
+    except KeyboardInterrupt:
+        print(f"\n{id_proceso} detenido")
+    finally:
+        obtener_topologia().retirar()
+        pool.cerrar()
@@ -0,0 +1,100 @@
+"""
+Pruebas de motor_ordenamiento: introsort y radix contra sorted(), con
+negativos, repetidos y los casos que llevan a heapsort.
+"""
+
+import random
+import unittest
+import numpy as np
+from motor_ordenamiento import (introsort, radix_sort, counting_sort, ordenar, elegir_algoritmo,
+                                counting_sort_numpy, elegir_separadores, particionar, UMBRAL_INSERCION,
+                                _heapsort)
+
+
+def casos(semilla=0):
+    """Listas de prueba: vacías, pequeñas, con negativos, repetidos y ordenadas"""
+    rng = random.Random(semilla)
+    yield []
+    yield [1]
+    yield [2, 1]
+    yield list(range(UMBRAL_INSERCION + 1, 0, -1))
+    yield [rng.randint(-1000, 1000) for _ in range(5000)]
+    yield [rng.randint(-3, 3) for _ in range(2000)]
+    yield list(range(-500, 500))
+    yield list(range(500, -500, -1))
+    yield [-(2 ** 40), 2 ** 40, 0, -1, 1] * 50
+
+
+class PruebaIntrosort(unittest.TestCase):
+    def test_ordena_como_sorted(self):
+        for numeros in casos():
+            with self.subTest(n=len(numeros)):
+                self.assertEqual(introsort(list(numeros)), sorted(numeros))
+
+    def test_reales_y_ordenamiento_in_place(self):
+        rng = random.Random(1)
+        numeros = [rng.uniform(-10, 10) for _ in range(3000)]
+        copia = list(numeros)
+        self.assertIs(introsort(copia), copia)
+        self.assertEqual(copia, sorted(numeros))
+
+    def test_peor_caso_de_quicksort(self):
+        # Órgano de tubos: degrada las particiones por mediana de tres
+        numeros = list(range(0, 20000, 2)) + list(range(19999, 0, -2))
+        self.assertEqual(introsort(list(numeros)), sorted(numeros))
+
+    def test_respaldo_de_heapsort(self):
+        rng = random.Random(7)
+        numeros = [rng.randint(-100, 100) for _ in range(1000)]
+        copia = list(numeros)
+        _heapsort(copia, 100, 899)
+        self.assertEqual(copia, numeros[:100] + sorted(numeros[100:900]) + numeros[900:])
+
+
+class PruebaEnteros(unittest.TestCase):
+    def test_radix_con_negativos(self):
+        for numeros in casos(2):
+            with self.subTest(n=len(numeros)):
+                self.assertEqual(radix_sort(list(numeros)), sorted(numeros))
+
+    def test_conteo_con_negativos(self):
+        for numeros in casos(3):
+            with self.subTest(n=len(numeros)):
+                self.assertEqual(counting_sort(list(numeros)), sorted(numeros))
+
+    def test_rechazan_no_enteros(self):
+        for algoritmo in (radix_sort, counting_sort):
+            with self.assertRaises(ValueError):
+                algoritmo([1, 2.5, 3])
+
+    def test_counting_sort_numpy(self):
+        arreglo = np.random.default_rng(4).integers(-50, 50, 10000)
+        np.testing.assert_array_equal(counting_sort_numpy(arreglo), np.sort(arreglo))
+
+
+class PruebaOrdenar(unittest.TestCase):
+    def test_no_modifica_la_entrada(self):
+        numeros = [3, -1, 2]
+        for algoritmo in ("introsort", "quicksort_listas", "integrado", "conteo", "radix"):
+            with self.subTest(algoritmo=algoritmo):
+                self.assertEqual(ordenar(numeros, algoritmo), ([-1, 2, 3], algoritmo))
+        self.assertEqual(numeros, [3, -1, 2])
+
+    def test_auto(self):
+        self.assertEqual(elegir_algoritmo([1, 2, 3]), "integrado")
+        self.assertEqual(elegir_algoritmo([random.randint(0, 10) for _ in range(5000)]), "conteo")
+        with self.assertRaises(ValueError):
+            ordenar([1], "desconocido")
+
+
+class PruebaParticiones(unittest.TestCase):
+    def test_particiones_cubren_los_rangos(self):
+        arreglo = np.random.default_rng(5).integers(-10**6, 10**6, 50000)
+        separadores = elegir_separadores(arreglo, 4, rng=np.random.default_rng(6))
+        particiones = particionar(arreglo, separadores)
+        self.assertEqual(len(particiones), 4)
+        np.testing.assert_array_equal(np.concatenate([np.sort(p) for p in particiones]), np.sort(arreglo))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Pruebas de orden_total: ColaOrdenTotal entrega en el orden (reloj, id)
+solo cuando ningún otro proceso puede mandar un mensaje con clave menor,
+y todos los procesos entregan la misma secuencia.
+"""
+
+import random
+import unittest
+from orden_total import ColaOrdenTotal
+
+PROCESOS = ["A", "B", "C"]
+
+
+def contenidos(entregados):
+    return [contenido for _, _, _, contenido in entregados]
+
+
+class PruebaColaOrdenTotal(unittest.TestCase):
+    def test_espera_confirmaciones_de_todos(self):
+        cola = ColaOrdenTotal(PROCESOS, "A")
+        cola.agregar_propio(1, 1, "a1")
+        self.assertEqual(cola.entregables(), [])
+        cola.agregar_ack("B", 2, 0)
+        self.assertEqual(cola.entregables(), [])
+        cola.agregar_ack("C", 1, 0)
+        self.assertEqual(contenidos(cola.entregables()), ["a1"])
+        self.assertEqual(cola.pendientes(), 0)
+
+    def test_empate_de_reloj_por_id(self):
+        cola = ColaOrdenTotal(PROCESOS, "C")
+        cola.agregar_mensaje("B", 5, 1, "b1")
+        cola.agregar_mensaje("A", 5, 1, "a1")
+        cola.agregar_propio(6, 1, "c1")
+        cola.agregar_ack("A", 6, 1)
+        cola.agregar_ack("B", 6, 1)
+        self.assertEqual(contenidos(cola.entregables()), ["a1", "b1", "c1"])
+
+    def test_espera_el_mensaje_que_falta(self):
+        cola = ColaOrdenTotal(PROCESOS, "A")
+        cola.agregar_mensaje("B", 4, 2, "b2")  # llega antes que b1
+        cola.agregar_ack("C", 10, 0)
+        cola.agregar_ack("B", 10, 2)
+        self.assertEqual(cola.entregables(), [])
+        self.assertEqual(cola.atrasados(), {"B": (0, 2)})
+        self.assertEqual(cola.recibidos_de(), {"B": 0, "C": 0})
+
+        cola.agregar_mensaje("B", 2, 1, "b1")
+        self.assertEqual(contenidos(cola.entregables()), ["b1", "b2"])
+        self.assertEqual(cola.atrasados(), {})
+
+    def test_duplicados_y_remitente_desconocido(self):
+        cola = ColaOrdenTotal(PROCESOS, "A")
+        self.assertTrue(cola.agregar_mensaje("B", 1, 1, "b1"))
+        self.assertFalse(cola.agregar_mensaje("B", 1, 1, "b1"))
+        self.assertEqual(cola.pendientes(), 1)
+        with self.assertRaises(ValueError):
+            cola.agregar_mensaje("Z", 1, 1, "z1")
+        with self.assertRaises(ValueError):
+            cola.agregar_ack("Z", 1, 0)
+
+    def test_mismo_orden_en_todos_los_procesos(self):
+        rng = random.Random(0)
+        relojes = {id_p: 0 for id_p in PROCESOS}
+        mensajes = []
+        for _ in range(60):
+            emisor = rng.choice(PROCESOS)
+            relojes[emisor] += rng.randint(1, 3)
+            secuencia = sum(1 for m in mensajes if m[0] == emisor) + 1
+            mensajes.append((emisor, relojes[emisor], secuencia, f"{emisor}{secuencia}"))
+
+        secuencias = []
+        for id_proceso in PROCESOS:
+            cola = ColaOrdenTotal(PROCESOS, id_proceso)
+            entregados = []
+            # Cada proceso recibe los mensajes ajenos en un orden distinto
+            llegada = mensajes[:]
+            rng.shuffle(llegada)
+            for emisor, reloj, secuencia, contenido in llegada:
+                if emisor == id_proceso:
+                    cola.agregar_propio(reloj, secuencia, contenido)
+                else:
+                    cola.agregar_mensaje(emisor, reloj, secuencia, contenido)
+                entregados.extend(cola.entregables())
+            for otro in PROCESOS:
+                if otro != id_proceso:
+                    enviados = sum(1 for m in mensajes if m[0] == otro)
+                    cola.agregar_ack(otro, max(relojes.values()), enviados)
+            entregados.extend(cola.entregables())
+            secuencias.append(contenidos(entregados))
+
+        esperado = [contenido for _, _, _, contenido in
+                    sorted(mensajes, key=lambda m: (m[1], m[0]))]
+        for secuencia in secuencias:
+            self.assertEqual(secuencia, esperado)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Pruebas de ordenamiento_externo: fusionar_runs junta runs ordenados en la
+misma secuencia que numpy.sort, y OrdenamientoExterno ordena un flujo
+repartido en varios runs en disco.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent import futures
+import numpy as np
+from ordenamiento_externo import OrdenamientoExterno, fusionar_runs
+
+
+class PruebaFusionarRuns(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp(prefix="prueba_runs_")
+        self.addCleanup(shutil.rmtree, self.directorio, ignore_errors=True)
+
+    def escribir_runs(self, runs, dtype):
+        rutas = []
+        for i, run in enumerate(runs):
+            rutas.append(os.path.join(self.directorio, f"run_{i}.bin"))
+            np.sort(np.asarray(run, dtype=dtype)).tofile(rutas[-1])
+        return rutas
+
+    def fusion(self, runs, dtype, elementos_por_bloque):
+        salida = list(fusionar_runs(self.escribir_runs(runs, dtype), dtype, elementos_por_bloque))
+        return np.concatenate(salida) if salida else np.empty(0, dtype=dtype)
+
+    def test_fusion_de_runs_de_distinto_tamano(self):
+        rng = np.random.default_rng(0)
+        runs = [rng.integers(-1000, 1000, tamano) for tamano in (1, 17, 500, 2000)]
+        for elementos_por_bloque in (1, 7, 64, 5000):
+            with self.subTest(elementos_por_bloque=elementos_por_bloque):
+                np.testing.assert_array_equal(self.fusion(runs, np.int64, elementos_por_bloque),
+                                              np.sort(np.concatenate(runs)))
+
+    def test_valores_repetidos_entre_runs(self):
+        runs = [[5] * 100, [5] * 50 + [6] * 10, [4, 5, 6]]
+        np.testing.assert_array_equal(self.fusion(runs, np.int64, 8),
+                                      np.sort(np.concatenate(runs)))
+
+    def test_reales(self):
+        rng = np.random.default_rng(1)
+        runs = [rng.normal(size=tamano) for tamano in (300, 301, 302)]
+        np.testing.assert_array_equal(self.fusion(runs, np.float64, 50),
+                                      np.sort(np.concatenate(runs)))
+
+    def test_sin_runs(self):
+        self.assertEqual(list(fusionar_runs([], np.int64, 10)), [])
+
+
+class PruebaOrdenamientoExterno(unittest.TestCase):
+    def test_flujo_en_varios_runs(self):
+        datos = np.random.default_rng(2).integers(-10**9, 10**9, 20000)
+        with futures.ThreadPoolExecutor(max_workers=2) as ejecutor:
+            # 8 KB de memoria con 2 procesos: runs de 512 valores
+            externo = OrdenamientoExterno(np.int64, ejecutor, 8192, 10**7, 2)
+            try:
+                for inicio in range(0, len(datos), 3000):
+                    externo.agregar(datos[inicio:inicio + 3000])
+                self.assertGreater(len(externo.rutas), 1)
+                ordenado = np.concatenate(list(externo.ordenar()))
+            finally:
+                externo.limpiar()
+        np.testing.assert_array_equal(ordenado, np.sort(datos))
+        self.assertFalse(os.path.exists(externo.directorio))
+
+    def test_limite_de_disco(self):
+        with futures.ThreadPoolExecutor(max_workers=1) as ejecutor:
+            externo = OrdenamientoExterno(np.int64, ejecutor, 8192, 80, 1)
+            try:
+                with self.assertRaises(ValueError):
+                    externo.agregar(np.arange(11))
+            finally:
+                externo.limpiar()
+
+
+if __name__ == '__main__':
+    unittest.main()
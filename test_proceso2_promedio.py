@@ -0,0 +1,59 @@
+"""
+Pruebas de EstadisticasWelford (proceso2_promedio_v2): la combinación por
+bloques (Welford/Chan) da la misma media, varianza, mínimo y máximo que
+NumPy sobre todos los datos juntos.
+"""
+
+import unittest
+import numpy as np
+from proceso2_promedio_v2 import EstadisticasWelford
+
+
+def acumular(bloques):
+    estadisticas = EstadisticasWelford()
+    for bloque in bloques:
+        estadisticas.agregar(np.asarray(bloque, dtype=np.float64))
+    return estadisticas
+
+
+class PruebaEstadisticasWelford(unittest.TestCase):
+    def comparar(self, bloques):
+        estadisticas = acumular(bloques)
+        datos = np.concatenate([np.asarray(b, dtype=np.float64) for b in bloques])
+        self.assertEqual(estadisticas.cantidad, len(datos))
+        self.assertAlmostEqual(estadisticas.media, datos.mean(), places=9)
+        self.assertAlmostEqual(estadisticas.varianza(), datos.var(), places=9)
+        self.assertAlmostEqual(estadisticas.varianza_muestral(), datos.var(ddof=1), places=9)
+        self.assertEqual(estadisticas.minimo, datos.min())
+        self.assertEqual(estadisticas.maximo, datos.max())
+
+    def test_bloques_de_distinto_tamano(self):
+        rng = np.random.default_rng(0)
+        self.comparar([rng.uniform(0, 10, tamano) for tamano in (1, 2, 1000, 7, 50000, 3)])
+
+    def test_un_solo_bloque(self):
+        self.comparar([[1.0, 2.0, 3.0, 4.0]])
+
+    def test_media_grande_sin_perder_precision(self):
+        # Con sumas de cuadrados la varianza de datos alrededor de 1e9 se pierde por cancelación
+        rng = np.random.default_rng(1)
+        bloques = [1e9 + rng.normal(0, 1, 10000) for _ in range(20)]
+        estadisticas = acumular(bloques)
+        datos = np.concatenate(bloques)
+        self.assertAlmostEqual(estadisticas.varianza(), datos.var(), places=6)
+
+    def test_bloques_vacios(self):
+        estadisticas = acumular([[], [5.0], []])
+        self.assertEqual(estadisticas.cantidad, 1)
+        self.assertEqual(estadisticas.media, 5.0)
+        self.assertEqual(estadisticas.varianza(), 0.0)
+        self.assertEqual(estadisticas.varianza_muestral(), 0.0)
+
+    def test_sin_datos(self):
+        estadisticas = EstadisticasWelford()
+        self.assertEqual(estadisticas.cantidad, 0)
+        self.assertEqual(estadisticas.varianza(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Pruebas de reloj_lamport: el reloj simple y el fragmentado dan tiempos
+crecientes, mayores que los recibidos y, en el fragmentado, únicos aunque
+muchos hilos los pidan a la vez.
+"""
+
+import threading
+import unittest
+from reloj_lamport import RelojLamport, RelojLamportFragmentado
+
+
+def tiempos_concurrentes(reloj, hilos=16, eventos=2000):
+    """Tiempos que devuelven `hilos` hilos con `eventos` incrementos o actualizaciones cada uno"""
+    resultados = [[] for _ in range(hilos)]
+    barrera = threading.Barrier(hilos)
+
+    def trabajar(propios):
+        barrera.wait()
+        for i in range(eventos):
+            if i % 3:
+                propios.append(reloj.incrementar())
+            else:
+                propios.append(reloj.actualizar(i))
+
+    trabajadores = [threading.Thread(target=trabajar, args=(propios,)) for propios in resultados]
+    for trabajador in trabajadores:
+        trabajador.start()
+    for trabajador in trabajadores:
+        trabajador.join()
+    return resultados
+
+
+class PruebaRelojLamport(unittest.TestCase):
+    def test_incrementar_y_actualizar(self):
+        reloj = RelojLamport()
+        self.assertEqual(reloj.incrementar(), 1)
+        self.assertEqual(reloj.actualizar(10), 11)
+        self.assertEqual(reloj.actualizar(3), 12)
+        self.assertEqual(reloj.obtener_tiempo(), 12)
+
+    def test_tiempos_unicos_con_hilos(self):
+        reloj = RelojLamport()
+        tiempos = [t for propios in tiempos_concurrentes(reloj) for t in propios]
+        self.assertEqual(len(tiempos), len(set(tiempos)))
+
+
+class PruebaRelojLamportFragmentado(unittest.TestCase):
+    def test_actualizar_supera_al_recibido(self):
+        reloj = RelojLamportFragmentado(4)
+        tiempo = reloj.actualizar(100)
+        self.assertGreater(tiempo, 100)
+        self.assertGreater(reloj.incrementar(), tiempo)
+        self.assertEqual(reloj.obtener_tiempo(), max(reloj.fragmentos))
+
+    def test_tiempos_unicos_con_hilos(self):
+        reloj = RelojLamportFragmentado(8)
+        resultados = tiempos_concurrentes(reloj)
+        tiempos = [t for propios in resultados for t in propios]
+        self.assertEqual(len(tiempos), len(set(tiempos)))
+        # Cada hilo ve su reloj avanzar: un evento siempre supera al anterior del mismo hilo
+        for propios in resultados:
+            self.assertTrue(all(a < b for a, b in zip(propios, propios[1:])))
+        self.assertEqual(reloj.obtener_tiempo(), max(tiempos))
+
+    def test_fragmento_fijo_por_hilo(self):
+        reloj = RelojLamportFragmentado(4)
+        indices = []
+
+        def trabajar():
+            indices.append((reloj._indice(), reloj._indice()))
+
+        trabajadores = [threading.Thread(target=trabajar) for _ in range(4)]
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+        self.assertTrue(all(primero == segundo for primero, segundo in indices))
+        self.assertEqual(sorted(primero for primero, _ in indices), [0, 1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
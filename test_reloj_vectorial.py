@@ -0,0 +1,80 @@
+"""
+Pruebas de reloj_vectorial: codificación del vector y entrega en orden
+causal con la cola de retención de ColaCausal.
+"""
+
+import unittest
+from reloj_vectorial import ColaCausal, codificar_vector, decodificar_vector
+
+PROCESOS = ["A", "B", "C"]
+
+
+class PruebaCodificacion(unittest.TestCase):
+    def test_ida_y_vuelta(self):
+        for vector in ([], [0], [3, 3, 4], [10, 2, 7, 0]):
+            with self.subTest(vector=vector):
+                self.assertEqual(decodificar_vector(codificar_vector(vector)), vector)
+
+    def test_diferencias(self):
+        self.assertEqual(codificar_vector([5, 6, 4]), [5, 1, -2])
+
+
+class PruebaColaCausal(unittest.TestCase):
+    def setUp(self):
+        self.a = ColaCausal(PROCESOS, "A")
+        self.b = ColaCausal(PROCESOS, "B")
+        self.c = ColaCausal(PROCESOS, "C")
+
+    def test_entrega_inmediata(self):
+        vector = self.a.preparar_envio()
+        self.assertEqual(vector, [1, 0, 0])
+        self.assertEqual(self.c.recibir("A", vector, "m1"), [("A", 1, "m1")])
+        self.assertEqual(self.c.entregados_de("A"), 1)
+
+    def test_retiene_hasta_el_anterior_del_mismo_remitente(self):
+        primero = self.a.preparar_envio()
+        segundo = self.a.preparar_envio()
+        self.assertEqual(self.c.recibir("A", segundo, "m2"), [])
+        self.assertEqual(self.c.estado(), ([0, 0, 0], 1))
+        self.assertEqual(self.c.recibir("A", primero, "m1"), [("A", 1, "m1"), ("A", 2, "m2")])
+        self.assertEqual(self.c.estado(), ([2, 0, 0], 0))
+
+    def test_retiene_hasta_la_causa_de_otro_remitente(self):
+        # B responde a m1 de A; C recibe la respuesta antes que m1
+        vector_a = self.a.preparar_envio()
+        self.b.recibir("A", vector_a, "m1")
+        vector_b = self.b.preparar_envio()
+        self.assertEqual(vector_b, [1, 1, 0])
+
+        self.assertEqual(self.c.recibir("B", vector_b, "respuesta"), [])
+        self.assertEqual(self.c.entregados_de("B"), 0)
+        self.assertEqual(self.c.recibir("A", vector_a, "m1"),
+                         [("A", 1, "m1"), ("B", 1, "respuesta")])
+
+    def test_duplicados(self):
+        primero = self.a.preparar_envio()
+        segundo = self.a.preparar_envio()
+        self.assertEqual(self.c.recibir("A", segundo, "m2"), [])
+        # Retenido y reenviado: sigue retenido, no se entregó
+        self.assertIsNone(self.c.recibir("A", segundo, "m2"))
+        self.assertEqual(self.c.entregados_de("A"), 0)
+        self.c.recibir("A", primero, "m1")
+        # Ya entregado
+        self.assertIsNone(self.c.recibir("A", primero, "m1"))
+        self.assertEqual(self.c.entregados_de("A"), 2)
+
+    def test_mensajes_invalidos(self):
+        with self.assertRaises(ValueError):
+            self.c.recibir("Z", [1, 0, 0], "m")
+        with self.assertRaises(ValueError):
+            self.c.recibir("A", [1, 0], "m")
+
+    def test_cola_llena(self):
+        cola = ColaCausal(PROCESOS, "C", maximo_retenidos=1)
+        cola.recibir("A", [2, 0, 0], "m2")
+        with self.assertRaises(ValueError):
+            cola.recibir("A", [3, 0, 0], "m3")
+
+
+if __name__ == '__main__':
+    unittest.main()
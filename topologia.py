@@ -0,0 +1,210 @@
+"""
+TOPOLOGÍA Y DESCUBRIMIENTO DE PROCESOS
+Traduce los ids lógicos de los procesos (P1_MATH, ...) a uno o más
+endpoints "host:puerto", para que ningún proceso tenga hosts ni puertos
+escritos en el código. Fuentes, de menor a mayor prioridad:
+- TOPOLOGIA_POR_DEFECTO: un endpoint por proceso (los hostnames de docker-compose)
+- el archivo JSON de ARCHIVO_TOPOLOGIA, p. ej.
+  {"P3_MATRIX": ["proceso3:50053", "proceso3b:50053"]}; se relee si cambia
+- variables ENDPOINTS_<ID>, p. ej. ENDPOINTS_P3_MATRIX="proceso3:50053,proceso3b:50053"
+A eso se suma un registro liviano: si DIRECTORIO_REGISTRO apunta a un
+directorio compartido (un volumen), cada réplica se anuncia al arrancar
+con un archivo <id>/<host>:<puerto> que renueva cada INTERVALO_REGISTRO
+segundos y borra al detenerse. Los anuncios que no se renuevan en
+3 intervalos caducan. Así se agregan réplicas sin tocar código ni
+configuración (docker compose up --scale).
+elegir() reparte las llamadas round-robin entre los endpoints de un id.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from itertools import count
+
+TOPOLOGIA_POR_DEFECTO = {
+    "P1_MATH": ["proceso1:50051"],
+    "P2_AVG": ["proceso2:50052"],
+    "P3_MATRIX": ["proceso3:50053"],
+    "P4_SORT": ["proceso4:50054"],
+    "P5_SEARCH": ["proceso5:50055"],
+}
+
+ARCHIVO_TOPOLOGIA = os.environ.get("ARCHIVO_TOPOLOGIA", "")
+DIRECTORIO_REGISTRO = os.environ.get("DIRECTORIO_REGISTRO", "")
+INTERVALO_REGISTRO = float(os.environ.get("INTERVALO_REGISTRO", "5.0"))
+
+# Cada cuántos segundos se revisan el archivo y el registro como máximo
+INTERVALO_RECARGA = 1.0
+
+
+def separar_endpoint(endpoint):
+    """'host:puerto' -> (host, puerto)"""
+    host, puerto = endpoint.rsplit(":", 1)
+    return host, int(puerto)
+
+
+def endpoints_de_entorno(entorno=None):
+    """Endpoints definidos con variables ENDPOINTS_<ID>"""
+    entorno = os.environ if entorno is None else entorno
+    return {nombre[len("ENDPOINTS_"):]: [e.strip() for e in valor.split(",") if e.strip()]
+            for nombre, valor in entorno.items() if nombre.startswith("ENDPOINTS_")}
+
+
+class Topologia:
+    """Endpoints de cada proceso lógico, con recarga del archivo y del registro"""
+
+    def __init__(self, archivo=ARCHIVO_TOPOLOGIA, directorio_registro=DIRECTORIO_REGISTRO,
+                 intervalo_registro=INTERVALO_REGISTRO, entorno=None, por_defecto=TOPOLOGIA_POR_DEFECTO):
+        self.por_defecto = por_defecto
+        self.archivo = archivo
+        self.directorio_registro = directorio_registro
+        self.intervalo_registro = intervalo_registro
+        self.del_entorno = endpoints_de_entorno(entorno)
+        self.del_archivo = {}
+        self.version_archivo = None
+        self.registrados = {}
+        self.tabla = {}
+        self.proxima_recarga = 0.0
+        self.turnos = {}
+        self.anuncios = {}  # ruta del archivo de anuncio -> evento para detener su renovación
+        self.lock = threading.Lock()
+        self._recargar(forzar=True)
+
+    def _leer_archivo(self):
+        try:
+            version = os.stat(self.archivo).st_mtime_ns
+        except OSError:
+            return  # sin archivo se usan las demás fuentes
+        if version == self.version_archivo:
+            return
+        self.version_archivo = version
+        try:
+            with open(self.archivo) as f:
+                contenido = json.load(f)
+            self.del_archivo = {id_p: [endpoints] if isinstance(endpoints, str) else list(endpoints)
+                                for id_p, endpoints in contenido.items()}
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            # Un archivo a medio escribir no debe tumbar al proceso: sigue la versión anterior
+            print(f"[ERROR] Topología inválida en {self.archivo}: {e}")
+
+    def _leer_registro(self):
+        registrados = {}
+        limite = time.time() - 3 * self.intervalo_registro
+        try:
+            ids = os.listdir(self.directorio_registro)
+        except OSError:
+            ids = []
+        for id_p in ids:
+            try:
+                with os.scandir(os.path.join(self.directorio_registro, id_p)) as entradas:
+                    vigentes = sorted(e.name for e in entradas if e.stat().st_mtime >= limite)
+            except OSError:
+                continue
+            if vigentes:
+                registrados[id_p] = vigentes
+        self.registrados = registrados
+
+    def _recargar(self, forzar=False):
+        ahora = time.monotonic()
+        if not forzar and ahora < self.proxima_recarga:
+            return
+        self.proxima_recarga = ahora + INTERVALO_RECARGA
+        if self.archivo:
+            self._leer_archivo()
+        if self.directorio_registro:
+            self._leer_registro()
+        tabla = {id_p: list(endpoints) for id_p, endpoints in self.por_defecto.items()}
+        tabla.update(self.del_archivo)
+        tabla.update(self.del_entorno)
+        for id_p, endpoints in self.registrados.items():
+            tabla[id_p] = tabla.get(id_p, []) + [e for e in endpoints if e not in tabla.get(id_p, [])]
+        self.tabla = tabla
+
+    def endpoints(self, id_proceso):
+        """Lista de endpoints 'host:puerto' del proceso lógico (vacía si no se conoce)"""
+        with self.lock:
+            self._recargar()
+            return list(self.tabla.get(id_proceso, []))
+
+    def elegir(self, id_proceso):
+        """(host, puerto) del siguiente endpoint del proceso, round-robin. KeyError si no tiene"""
+        with self.lock:
+            self._recargar()
+            endpoints = self.tabla.get(id_proceso)
+            if not endpoints:
+                raise KeyError(f"proceso desconocido en la topología: {id_proceso}")
+            turno = next(self.turnos.setdefault(id_proceso, count()))
+            return separar_endpoint(endpoints[turno % len(endpoints)])
+
+    def procesos(self):
+        """id -> (host, puerto) del primer endpoint de cada proceso"""
+        with self.lock:
+            self._recargar()
+            return {id_p: separar_endpoint(endpoints[0]) for id_p, endpoints in self.tabla.items() if endpoints}
+
+    def puerto_local(self, id_proceso):
+        """Puerto en el que escucha este proceso: PUERTO, o el de su primer endpoint"""
+        if os.environ.get("PUERTO"):
+            return int(os.environ["PUERTO"])
+        endpoints = self.endpoints(id_proceso)
+        if not endpoints:
+            raise KeyError(f"proceso desconocido en la topología: {id_proceso}")
+        return separar_endpoint(endpoints[0])[1]
+
+    def endpoint_propio(self, id_proceso):
+        """Endpoint con el que los demás llegan a este proceso: ENDPOINT_PROPIO o hostname:puerto"""
+        return os.environ.get("ENDPOINT_PROPIO") or f"{socket.gethostname()}:{self.puerto_local(id_proceso)}"
+
+    def replicas(self, id_proceso):
+        """Endpoints del proceso lógico sin contar a este proceso"""
+        propio = self.endpoint_propio(id_proceso)
+        return [e for e in self.endpoints(id_proceso) if e != propio]
+
+    def anunciar(self, id_proceso, endpoint=None):
+        """Anuncia este proceso en el registro y lo renueva en segundo plano"""
+        if not self.directorio_registro:
+            return
+        endpoint = endpoint or self.endpoint_propio(id_proceso)
+        directorio = os.path.join(self.directorio_registro, id_proceso)
+        os.makedirs(directorio, exist_ok=True)
+        ruta = os.path.join(directorio, endpoint)
+        open(ruta, "a").close()
+        detener = threading.Event()
+
+        def renovar():
+            # Solo se actualiza la fecha: tras retirar() el archivo no se vuelve a crear
+            while not detener.wait(self.intervalo_registro):
+                try:
+                    os.utime(ruta)
+                except OSError as e:
+                    print(f"[ERROR] No se pudo renovar el anuncio {ruta}: {e}")
+
+        with self.lock:
+            self.anuncios[ruta] = detener
+        threading.Thread(target=renovar, daemon=True).start()
+
+    def retirar(self):
+        """Borra los anuncios de este proceso del registro"""
+        with self.lock:
+            anuncios, self.anuncios = self.anuncios, {}
+        for ruta, detener in anuncios.items():
+            detener.set()
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+
+
+_topologia = None
+_lock_topologia = threading.Lock()
+
+
+def obtener_topologia():
+    """Topología compartida por todo el proceso"""
+    global _topologia
+    with _lock_topologia:
+        if _topologia is None:
+            _topologia = Topologia()
+        return _topologia